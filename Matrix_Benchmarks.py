@@ -0,0 +1,709 @@
+"""
+Benchmarks for the Matrix class and the Matrix_Utils routines.
+
+Run them from the folder containing the Geometry package:
+
+	python -m Geometry.Matrix_Benchmarks
+"""
+
+import io
+import math
+import os
+import re
+import random
+import timeit
+import tracemalloc
+from array import array
+from decimal import Decimal
+from operator import mul
+
+from Geometry.classes import Matrix
+from Geometry.classes import MatrixStack
+from Geometry.classes import FrozenMatrix
+from Geometry.classes import SparseMatrix
+from Geometry.utils import Matrix_Utils as mu
+from Geometry.utils import Matrix_IO as mio
+from Geometry.utils import Expression_Utils as eu
+from Geometry.utils import Stack_Utils as stu
+from Geometry.utils import Parallel_Utils as pu
+from Geometry.utils import Iterative_Utils as iu
+from Geometry.utils import Vector_Utils as vu
+
+
+def random_elements(rows, cols, seed=0):
+	rnd = random.Random(seed)
+
+	return [rnd.uniform(-10.0, 10.0) for __ in range(rows * cols)]
+
+
+def report(title, rows):
+	print(title)
+
+	for label, value in rows:
+		print("    {:<40} {}".format(label, value))
+
+	print("")
+
+
+def bench_storage_modes(sizes=(4, 16, 32), repeat=3):
+	"""
+	Compares the numeric backends (float array('d'), Decimal and Fraction storage) when constructing matrices and when
+	multiplying them with matrix_prod.
+	"""
+
+	for size in sizes:
+		elements = random_elements(size, size)
+		rows = []
+
+		for mode in ("float", "decimal", "fraction"):
+			matrix_a = Matrix.Matrix(size, size, elements, numeric=mode)
+			matrix_b = Matrix.Matrix(size, size, elements, numeric=mode)
+
+			number = max(1, 2000 // (size * size))
+			construct = min(timeit.repeat(lambda: Matrix.Matrix(size, size, elements, numeric=mode),
+			                              number=number, repeat=repeat)) / number
+			number = max(1, 20000 // (size * size * size))
+			prod = min(timeit.repeat(lambda: mu.matrix_prod(matrix_a, matrix_b),
+			                         number=number, repeat=repeat)) / number
+
+			rows.append(("{} construction".format(mode), "{:10.1f} matrices/s".format(1.0 / construct)))
+			rows.append(("{} matrix_prod".format(mode), "{:10.1f} products/s".format(1.0 / prod)))
+
+		report("Numeric backends, {0}x{0}".format(size), rows)
+
+
+class _LegacyMatrix(object):
+	"""
+	Instance layout of Matrix before it declared __slots__: shape and a list of rounded Decimals kept in a per-instance
+	__dict__.
+	"""
+
+	rows = 0
+	cols = 0
+	decimals = 6
+
+	def __init__(self, rows, columns, elements, exact=True):
+		self.rows = rows
+		self.cols = columns
+
+		if exact:
+			self.elements = [round(Decimal(str(e)), self.decimals) for e in elements]
+		else:
+			self.elements = array('d', elements)
+
+
+def _bytes_per_instance(factory, count):
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	instances = [factory() for __ in range(count)]
+	after = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+
+	return (after - before) / float(len(instances))
+
+
+def bench_instance_memory(sizes=(3, 4), count=20000):
+	"""
+	Measures the memory held by each matrix instance (object, element buffer and elements) for the slot-based Matrix
+	and for the previous dict-based layout, in both storage modes.
+	"""
+
+	for size in sizes:
+		elements = random_elements(size, size)
+		rows = []
+
+		for label, cls, exact in (("dict + Decimal list (previous class)", _LegacyMatrix, True),
+		                          ("dict + array('d')", _LegacyMatrix, False),
+		                          ("slots + Decimal list", Matrix.Matrix, True),
+		                          ("slots + array('d')", Matrix.Matrix, False)):
+			per_instance = _bytes_per_instance(lambda: cls(size, size, elements, exact=exact), count)
+			rows.append((label, "{:8.1f} bytes/matrix".format(per_instance)))
+
+		report("Per-instance memory, {0}x{0}".format(size), rows)
+
+
+def bench_matrix_stack(counts=(100, 1000), order=4, repeat=3):
+	"""
+	Compares composing count 4x4 transforms with one stack_prod call against count matrix_prod calls.
+	"""
+
+	for count in counts:
+		matrices_a = [Matrix.Matrix(order, order, random_elements(order, order, seed=i)) for i in range(count)]
+		matrices_b = [Matrix.Matrix(order, order, random_elements(order, order, seed=count + i)) for i in range(count)]
+		stack_a = MatrixStack.MatrixStack.from_matrices(matrices_a)
+		stack_b = MatrixStack.MatrixStack.from_matrices(matrices_b)
+
+		per_matrix = min(timeit.repeat(lambda: [mu.matrix_prod(a, b) for a, b in zip(matrices_a, matrices_b)],
+		                               number=1, repeat=repeat))
+		batched = min(timeit.repeat(lambda: stu.stack_prod(stack_a, stack_b), number=1, repeat=repeat))
+		broadcast = min(timeit.repeat(lambda: stu.stack_prod(matrices_a[0], stack_b), number=1, repeat=repeat))
+		inverse = min(timeit.repeat(lambda: stu.stack_inverse(stack_a), number=1, repeat=repeat))
+
+		report("Transform stacks, {} x {}x{}".format(count, order, order), [
+			("matrix_prod per matrix", "{:8.2f} ms".format(per_matrix * 1000.0)),
+			("stack_prod", "{:8.2f} ms".format(batched * 1000.0)),
+			("stack_prod, broadcast matrix", "{:8.2f} ms".format(broadcast * 1000.0)),
+			("stack_inverse", "{:8.2f} ms".format(inverse * 1000.0)),
+		])
+
+
+def bench_fixed_size(repeat=3, number=2000):
+	"""
+	Compares the unrolled 3x3/4x4 kernels Matrix_Utils dispatches to against the general dense kernels.
+	"""
+
+	for order in (3, 4):
+		matrix_a = Matrix.Matrix(order, order, random_elements(order, order, seed=1))
+		matrix_b = Matrix.Matrix(order, order, random_elements(order, order, seed=2))
+		rows = []
+
+		for label, general, fixed in (
+				("product", lambda: mu._dense_matrix_prod(matrix_a, matrix_b), lambda: mu.matrix_prod(matrix_a, matrix_b)),
+				("transpose", lambda: mu._dense_matrix_transpose(matrix_a), lambda: mu.matrix_transpose(matrix_a)),
+				("inverse", lambda: mu._rref_matrix_inverse(matrix_a), lambda: mu.matrix_inverse(matrix_a))):
+			count = number if label != "inverse" else max(1, number // 20)
+			general_time = min(timeit.repeat(general, number=count, repeat=repeat)) / count
+			fixed_time = min(timeit.repeat(fixed, number=count, repeat=repeat)) / count
+
+			rows.append(("{} general".format(label), "{:10.2f} us".format(general_time * 1e6)))
+			rows.append(("{} unrolled".format(label), "{:10.2f} us  ({:.1f}x)".format(fixed_time * 1e6,
+			                                                                         general_time / fixed_time)))
+
+		report("Fixed-size kernels, {0}x{0}".format(order), rows)
+
+
+def _parse_text(text, rows, cols, exact):
+	numbers = re.findall(r"-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?", text)
+
+	return Matrix.Matrix(rows, cols, [Decimal(e) if exact else float(e) for e in numbers], exact=exact)
+
+
+def bench_serialization(sizes=(64, 256), repeat=3):
+	"""
+	Compares loading a matrix from the binary format (Matrix_IO.load) against parsing its text form (str(matrix)).
+	Only float64 loads are copies; exact loads still create one Decimal per element, which keeps them within an order
+	of magnitude of text parsing.
+	"""
+
+	for size in sizes:
+		rows = []
+
+		for exact in (False, True):
+			mode = "exact" if exact else "float"
+			matrix = Matrix.Matrix(size, size, random_elements(size, size), exact=exact)
+			text = str(matrix)
+			data = mio.dumps(matrix)
+
+			parse = min(timeit.repeat(lambda: _parse_text(text, size, size, exact), number=1, repeat=repeat))
+			load = min(timeit.repeat(lambda: mio.load(io.BytesIO(data)), number=1, repeat=repeat))
+
+			rows.append(("{} text parse".format(mode), "{:10.3f} ms".format(parse * 1000.0)))
+			label = "float binary load (copy)" if not exact else "exact binary load (Decimal per element)"
+			rows.append((label, "{:10.3f} ms  ({:.0f}x)".format(load * 1000.0, parse / load)))
+
+		report("Serialization, {0}x{0}".format(size), rows)
+
+
+def bench_lazy_expressions(sizes=(4, 16, 64), repeat=3):
+	"""
+	Compares eager Matrix_Utils chains against the same expressions evaluated lazily, on expressions typical of a rig
+	solver: blending two transforms, the damped least squares normal matrix J^T J + lambda I, and a chain of three
+	products. The lazy timings include building the expression. Products use the same kernels on both paths, so only
+	fused scaled sums and transposes gain; at 4x4, building and flattening the tree costs more than it saves.
+	"""
+
+	for size in sizes:
+		matrix_a = Matrix.Matrix(size, size, random_elements(size, size, seed=1))
+		matrix_b = Matrix.Matrix(size, size, random_elements(size, size, seed=2))
+		matrix_c = Matrix.Matrix(size, size, random_elements(size, size, seed=3))
+		jacobian = Matrix.Matrix(2 * size, size, random_elements(2 * size, size, seed=4))
+		identity = mu.matrix_identity(size)
+		rows = []
+
+		for label, eager, lazy in (
+				("(0.3 A + 0.7 B) @ C^T",
+				 lambda: mu.matrix_prod(mu.matrix_add(mu.matrix_scalar_prod(matrix_a, 0.3), mu.matrix_scalar_prod(matrix_b, 0.7)),
+				                        mu.matrix_transpose(matrix_c)),
+				 lambda: ((matrix_a.lazy() * 0.3 + matrix_b.lazy() * 0.7) @ matrix_c.lazy().T).evaluate()),
+				("J^T @ J + 0.01 I",
+				 lambda: mu.matrix_add(mu.matrix_prod(mu.matrix_transpose(jacobian), jacobian),
+				                       mu.matrix_scalar_prod(identity, 0.01)),
+				 lambda: (jacobian.lazy().T @ jacobian + identity.lazy() * 0.01).evaluate()),
+				("A @ B @ C",
+				 lambda: mu.matrix_prod(mu.matrix_prod(matrix_a, matrix_b), matrix_c),
+				 lambda: (matrix_a.lazy() @ matrix_b @ matrix_c).evaluate()),
+				("A - 2 B + C^T",
+				 lambda: mu.matrix_add(mu.matrix_sub(matrix_a, mu.matrix_scalar_prod(matrix_b, 2)), mu.matrix_transpose(matrix_c)),
+				 lambda: (matrix_a.lazy() - matrix_b.lazy() * 2 + matrix_c.lazy().T).evaluate())):
+			number = max(1, 20000 // (size * size * size))
+			eager_time = min(timeit.repeat(eager, number=number, repeat=repeat)) / number
+			lazy_time = min(timeit.repeat(lazy, number=number, repeat=repeat)) / number
+
+			rows.append(("{} eager".format(label), "{:10.2f} us".format(eager_time * 1e6)))
+			rows.append(("{} lazy".format(label), "{:10.2f} us  ({:.1f}x)".format(lazy_time * 1e6, eager_time / lazy_time)))
+
+		report("Lazy expressions, {0}x{0}".format(size), rows)
+
+
+def bench_frozen_cache(sizes=(4, 8, 16), calls=200, distinct=10, repeat=3):
+	"""
+	Calls matrix_inverse and matrix_rank repeatedly over a small set of constant matrices (as a rig evaluating the same
+	bind poses every frame would), on plain matrices and on frozen ones whose results are memoized.
+	"""
+
+	for size in sizes:
+		matrices = [Matrix.Matrix(size, size, random_elements(size, size, seed=i)) for i in range(distinct)]
+		frozen = [matrix.freeze() for matrix in matrices]
+		rows = []
+
+		def run(pool):
+			for i in range(calls):
+				mu.matrix_inverse(pool[i % distinct])
+				mu.matrix_rank(pool[i % distinct])
+
+		FrozenMatrix.CACHE.clear()
+		plain_time = min(timeit.repeat(lambda: run(matrices), number=1, repeat=repeat))
+		frozen_time = min(timeit.repeat(lambda: run(frozen), number=1, repeat=repeat))
+		info = FrozenMatrix.CACHE.info()
+
+		rows.append(("plain, {} calls".format(2 * calls), "{:10.2f} ms".format(plain_time * 1e3)))
+		rows.append(("frozen, {} calls".format(2 * calls), "{:10.2f} ms  ({:.1f}x)".format(frozen_time * 1e3,
+		                                                                                plain_time / frozen_time)))
+		rows.append(("cache hits / misses", "{hits} / {misses}".format(**info)))
+
+		report("Frozen matrix cache, {0}x{0}".format(size), rows)
+
+
+def bench_row_reduction(sizes=(50, 100, 200, 500)):
+	"""
+	Times row_reduced_echelon and column_reduced_echelon (in-place Gauss-Jordan elimination) on dense float matrices.
+	"""
+
+	rows = []
+
+	for size in sizes:
+		matrix = Matrix.Matrix(size, size, random_elements(size, size, seed=5))
+
+		rref = min(timeit.repeat(lambda: mu.row_reduced_echelon(matrix), number=1, repeat=1 if size > 200 else 3))
+		cref = min(timeit.repeat(lambda: mu.column_reduced_echelon(matrix), number=1, repeat=1 if size > 200 else 3))
+
+		rows.append(("{0}x{0} row_reduced_echelon".format(size), "{:10.3f} s".format(rref)))
+		rows.append(("{0}x{0} column_reduced_echelon".format(size), "{:10.3f} s".format(cref)))
+
+	report("Row reduction", rows)
+
+
+def bench_lu_solve(sizes=(4, 16, 64), targets=200, repeat=3):
+	"""
+	Solves the same system against many right-hand sides: one augmented row reduction per target, against a single
+	LU factorization followed by solve (one target at a time) and solve_many (all targets at once).
+	"""
+
+	for size in sizes:
+		matrix = Matrix.Matrix(size, size, random_elements(size, size, seed=6))
+		rhs = Matrix.Matrix(size, targets, random_elements(size, targets, seed=7))
+		columns = [Matrix.Matrix(size, 1, rhs.col(ci)) for ci in range(targets)]
+		rows = []
+
+		rref_time = min(timeit.repeat(lambda: [mu.row_reduced_echelon(mu.matrix_augment(matrix, b)) for b in columns],
+		                              number=1, repeat=repeat))
+		def solve_each():
+			lu = mu.LUFactorization(matrix)
+
+			return [lu.solve(b) for b in columns]
+
+		solve_time = min(timeit.repeat(solve_each, number=1, repeat=repeat))
+		many_time = min(timeit.repeat(lambda: mu.LUFactorization(matrix).solve_many(rhs), number=1, repeat=repeat))
+
+		rows.append(("RREF of [A | b] per target", "{:10.2f} ms".format(rref_time * 1e3)))
+		rows.append(("LU + solve per target", "{:10.2f} ms  ({:.1f}x)".format(solve_time * 1e3, rref_time / solve_time)))
+		rows.append(("LU + solve_many", "{:10.2f} ms  ({:.1f}x)".format(many_time * 1e3, rref_time / many_time)))
+
+		report("Solving {} targets, {}x{}".format(targets, size, size), rows)
+
+
+def bench_inverse(sizes=(8, 16, 64), repeat=3, number=2000):
+	"""
+	Compares matrix_inverse (one LU elimination that also detects singularity) against the previous implementation
+	(has_inverse through a row reduction, then a second row reduction of [A | I]), on regular and singular matrices, and
+	the general 4x4 inverse against the affine and rigid ones.
+	"""
+
+	for size in sizes:
+		matrix = Matrix.Matrix(size, size, random_elements(size, size, seed=8))
+		singular = Matrix.Matrix(size, size, random_elements(1, size, seed=9) * size)
+		count = max(1, 4000 // (size * size))
+		rows = []
+
+		previous = min(timeit.repeat(lambda: mu._rref_matrix_inverse(matrix), number=count, repeat=repeat)) / count
+		current = min(timeit.repeat(lambda: mu.matrix_inverse(matrix), number=count, repeat=repeat)) / count
+		identity = mu.matrix_identity(size)
+		previous_singular = min(timeit.repeat(lambda: mu.row_equivalence(singular, identity),
+		                                      number=count, repeat=repeat)) / count
+		current_singular = min(timeit.repeat(lambda: mu.try_inverse(singular), number=count, repeat=repeat)) / count
+
+		rows.append(("previous inverse", "{:10.2f} us".format(previous * 1e6)))
+		rows.append(("matrix_inverse", "{:10.2f} us  ({:.1f}x)".format(current * 1e6, previous / current)))
+		rows.append(("previous check, singular", "{:10.2f} us".format(previous_singular * 1e6)))
+		rows.append(("try_inverse, singular", "{:10.2f} us  ({:.1f}x)".format(current_singular * 1e6,
+		                                                                      previous_singular / current_singular)))
+
+		report("Inverse, {0}x{0}".format(size), rows)
+
+	cos = 0.8
+	sin = 0.6
+	rigid = Matrix.Matrix(4, 4, [cos, -sin, 0.0, 1.5, sin, cos, 0.0, -2.0, 0.0, 0.0, 1.0, 3.0, 0.0, 0.0, 0.0, 1.0])
+	general = Matrix.Matrix(4, 4, random_elements(4, 4, seed=10))
+	rows = []
+
+	for label, function in (("previous inverse", lambda: mu._rref_matrix_inverse(rigid)),
+	                        ("general (adjugate)", lambda: mu.matrix_inverse(general)),
+	                        ("matrix_inverse (affine)", lambda: mu.matrix_inverse(rigid)),
+	                        ("matrix_affine_inverse", lambda: mu.matrix_affine_inverse(rigid)),
+	                        ("matrix_rigid_inverse", lambda: mu.matrix_rigid_inverse(rigid))):
+		count = number if label != "previous inverse" else max(1, number // 20)
+		elapsed = min(timeit.repeat(function, number=count, repeat=repeat)) / count
+		rows.append((label, "{:10.2f} us".format(elapsed * 1e6)))
+
+	report("Inverse of 4x4 transforms", rows)
+
+
+def bench_large_products(sizes=(64, 128, 256, 512, 1024), thresholds=(128, 256, 512), previous_limit=256):
+	"""
+	Times the dense product of square float matrices with the tiled kernel alone (strassen_threshold=0) and with the
+	Strassen recursion at several thresholds, to locate the crossover. The previous kernel (triple loop through
+	Matrix.get) is timed up to previous_limit.
+
+	Measured with CPython 3.11, the tiled kernel is about 6x faster than the previous one at 64 and 7x from 128 on.
+	Below 512 Strassen stays within run-to-run noise of the tiled kernel (the block additions cost about as much as
+	the block product saved); from 512 on it is 10-18% faster, whatever the threshold between 128 and 512. Strassen
+	also rounds floats slightly worse than the plain dot products, so STRASSEN_THRESHOLD = 512 only enables it where
+	it clearly pays off.
+	"""
+
+	for size in sizes:
+		matrix_a = Matrix.Matrix(size, size, random_elements(size, size, seed=11))
+		matrix_b = Matrix.Matrix(size, size, random_elements(size, size, seed=12))
+		repeat = 3 if size <= 256 else 1
+		rows = []
+
+		tiled = min(timeit.repeat(lambda: mu.matrix_prod(matrix_a, matrix_b, strassen_threshold=0),
+		                          number=1, repeat=repeat))
+
+		if size <= previous_limit:
+			previous = min(timeit.repeat(lambda: mu._naive_matrix_prod(matrix_a, matrix_b), number=1, repeat=repeat))
+			rows.append(("previous kernel", "{:10.3f} s".format(previous)))
+			rows.append(("tiled", "{:10.3f} s  ({:.1f}x)".format(tiled, previous / tiled)))
+		else:
+			rows.append(("tiled", "{:10.3f} s".format(tiled)))
+
+		for threshold in thresholds:
+			if threshold > size:
+				continue
+
+			strassen = min(timeit.repeat(lambda: mu.matrix_prod(matrix_a, matrix_b, strassen_threshold=threshold),
+			                             number=1, repeat=repeat))
+			rows.append(("strassen, threshold {}".format(threshold), "{:10.3f} s  ({:.2f}x tiled)".format(
+				strassen, tiled / strassen)))
+
+		report("Dense product, {0}x{0}".format(size), rows)
+
+
+def bench_parallel(size=512, targets=512, workers=(2, 4, 8, 16, 32)):
+	"""
+	Times matrix_prod and LUFactorization.solve_many in the calling process against a ParallelExecutor with several
+	worker counts. Worker counts above the number of CPUs of the machine can\'t be any faster than the serial run.
+	"""
+
+	matrix_a = Matrix.Matrix(size, size, random_elements(size, size, seed=13))
+	matrix_b = Matrix.Matrix(size, size, random_elements(size, size, seed=14))
+	rhs = Matrix.Matrix(size, targets, random_elements(size, targets, seed=15))
+	factorization = mu.LUFactorization(matrix_a)
+
+	serial_prod = min(timeit.repeat(lambda: mu.matrix_prod(matrix_a, matrix_b, strassen_threshold=0), number=1, repeat=1))
+	serial_solve = min(timeit.repeat(lambda: factorization.solve_many(rhs), number=1, repeat=1))
+	rows = [("matrix_prod, serial", "{:10.3f} s".format(serial_prod)),
+	        ("solve_many, serial", "{:10.3f} s".format(serial_solve))]
+
+	for count in workers:
+		with pu.ParallelExecutor(workers=count) as executor:
+			''' Starts the pool before timing '''
+			executor.product(Matrix.Matrix(2 * executor.min_block, 1), Matrix.Matrix(1, 1))
+
+			prod = min(timeit.repeat(lambda: mu.matrix_prod(matrix_a, matrix_b, executor=executor), number=1, repeat=1))
+			solve = min(timeit.repeat(lambda: factorization.solve_many(rhs, executor=executor), number=1, repeat=1))
+
+		rows.append(("matrix_prod, {} workers".format(count), "{:10.3f} s  ({:.1f}x)".format(prod, serial_prod / prod)))
+		rows.append(("solve_many, {} workers".format(count), "{:10.3f} s  ({:.1f}x)".format(solve, serial_solve / solve)))
+
+	report("Parallel executor ({} CPUs), {}x{} operands, {} right-hand sides".format(os.cpu_count(), size, size, targets),
+	       rows)
+
+
+def bench_least_squares(counts=(100, 500, 2000), repeat=3):
+	"""
+	Fits an affine transform to noisy point correspondences with lstsq (Householder QR) and with the normal equations
+	(At * A solved through LU), and reports the time and the error of the fitted matrix against the true one. Points
+	far from the origin and nearly coplanar make At * A badly conditioned.
+	"""
+
+	rnd = random.Random(16)
+	truth = [rnd.uniform(-1.0, 1.0) for __ in range(12)]
+
+	for count in counts:
+		points = [(1000.0 + rnd.uniform(-1.0, 1.0), 1000.0 + rnd.uniform(-1.0, 1.0), 1000.0 + rnd.uniform(-0.05, 0.05))
+		          for __ in range(count)]
+		matrix = Matrix.Matrix(count, 4, [e for point in points for e in point + (1.0,)])
+		truth_matrix = Matrix.Matrix(4, 3, truth)
+		targets = mu.matrix_add(mu.matrix_prod(matrix, truth_matrix),
+		                        Matrix.Matrix(count, 3, [rnd.gauss(0.0, 1e-9) for __ in range(count * 3)]))
+
+		def normal_equations():
+			transposed = mu.matrix_transpose(matrix)
+
+			return mu.LUFactorization(mu.matrix_prod(transposed, matrix), tolerance=0.0).solve_many(
+				mu.matrix_prod(transposed, targets))
+
+		qr_time = min(timeit.repeat(lambda: mu.lstsq(matrix, targets), number=1, repeat=repeat))
+		normal_time = min(timeit.repeat(normal_equations, number=1, repeat=repeat))
+		factorization = mu.qr_factorization(matrix)
+		reuse_time = min(timeit.repeat(lambda: mu.lstsq(factorization, targets), number=1, repeat=repeat))
+
+		qr_error = max(abs(a - b) for a, b in zip(mu.lstsq(matrix, targets).elements(), truth))
+		normal_error = max(abs(a - b) for a, b in zip(normal_equations().elements(), truth))
+
+		report("Least squares, {} correspondences".format(count), [
+			("normal equations", "{:10.3f} ms  error {:.1e}".format(normal_time * 1e3, normal_error)),
+			("lstsq (QR)", "{:10.3f} ms  error {:.1e}".format(qr_time * 1e3, qr_error)),
+			("lstsq, reused factorization", "{:10.3f} ms".format(reuse_time * 1e3)),
+		])
+
+
+def _weighted_grid_laplacian(side, seed=0):
+	"""
+	Sparse weighted Laplacian of a side x side grid (random edge weights) plus a small diagonal shift, which makes it
+	symmetric positive definite, as the weight-smoothing systems are.
+	"""
+
+	rnd = random.Random(seed)
+	builder = SparseMatrix.COOMatrix(side * side, side * side)
+	diagonal = [0.01] * (side * side)
+
+	for i in range(side):
+		for j in range(side):
+			for ni, nj in ((i + 1, j), (i, j + 1)):
+				if ni < side and nj < side:
+					weight = rnd.uniform(0.1, 10.0)
+					a = i * side + j
+					b = ni * side + nj
+					builder.add(a, b, -weight).add(b, a, -weight)
+					diagonal[a] += weight
+					diagonal[b] += weight
+
+	for index, value in enumerate(diagonal):
+		builder.add(index, index, value)
+
+	return builder.to_csr()
+
+
+def bench_iterative_solvers(sides=(30, 100), max_iterations=2000):
+	"""
+	Solves weighted grid Laplacians with conjugate gradient (plain and Jacobi preconditioned), Gauss-Seidel and SOR,
+	and conjugate gradient again warm started from the solution of a slightly different right-hand side.
+	"""
+
+	for side in sides:
+		matrix = _weighted_grid_laplacian(side, seed=17)
+		rnd = random.Random(18)
+		b = [rnd.uniform(-1.0, 1.0) for __ in range(side * side)]
+		previous = iu.conjugate_gradient(matrix, [e * 0.99 for e in b]).x
+		rows = []
+
+		for label, solve in (("conjugate gradient", lambda: iu.conjugate_gradient(matrix, b, preconditioner=None,
+		                                                                          max_iterations=max_iterations)),
+		                     ("conjugate gradient, jacobi", lambda: iu.conjugate_gradient(matrix, b,
+		                                                                                  max_iterations=max_iterations)),
+		                     ("conjugate gradient, warm start", lambda: iu.conjugate_gradient(
+			                     matrix, b, x0=previous, max_iterations=max_iterations)),
+		                     ("gauss-seidel", lambda: iu.gauss_seidel(matrix, b, max_iterations=max_iterations)),
+		                     ("sor, omega 1.9", lambda: iu.sor(matrix, b, omega=1.9, max_iterations=max_iterations))):
+			start = timeit.default_timer()
+			solution = solve()
+			elapsed = timeit.default_timer() - start
+
+			rows.append((label, "{:10.3f} s  {:5d} iterations{}".format(
+				elapsed, solution.iterations, "" if solution.converged else " (not converged)")))
+
+		report("Iterative solvers, {0}x{0} grid Laplacian ({1} unknowns, {2} stored)".format(
+			side, side * side, matrix.nnz()), rows)
+
+
+def bench_incremental_echelon(sizes=(10, 30), repeat=3):
+	"""
+	Builds a 2n x n system one row at a time (half of the rows dependent on the previous ones) and asks for the rank and
+	whether a target is in the column space after every row: reducing the system from scratch on every query versus
+	an IncrementalEchelon updated with every row.
+	"""
+
+	for size in sizes:
+		rnd = random.Random(19)
+		rows = []
+
+		for ri in range(2 * size):
+			if ri % 2 and rows:
+				weights = [rnd.uniform(-1.0, 1.0) for __ in rows]
+				rows.append([sum(w * row[ci] for w, row in zip(weights, rows)) for ci in range(size)])
+			else:
+				rows.append(random_elements(1, size, seed=20 + ri))
+
+		x = random_elements(size, 1, seed=21)
+
+		def from_scratch():
+			for count in range(1, len(rows) + 1):
+				matrix = Matrix.Matrix(count, size, [e for row in rows[:count] for e in row])
+				target = mu.matrix_prod(matrix, Matrix.Matrix(size, 1, x))
+				mu.matrix_rank(matrix)
+				mu.in_column_space(target, matrix)
+
+		def incremental():
+			echelon = mu.IncrementalEchelon(size)
+
+			for count, row in enumerate(rows, 1):
+				echelon.append(row)
+				target = [sum(map(mul, previous, x)) for previous in rows[:count]]
+				echelon.rank
+				echelon.in_column_space(target)
+
+		scratch_time = min(timeit.repeat(from_scratch, number=1, repeat=repeat))
+		incremental_time = min(timeit.repeat(incremental, number=1, repeat=repeat))
+
+		report("Incremental row reduction, {} rows of {}".format(2 * size, size), [
+			("reduce from scratch", "{:10.2f} ms".format(scratch_time * 1e3)),
+			("IncrementalEchelon", "{:10.2f} ms  ({:.1f}x)".format(incremental_time * 1e3, scratch_time / incremental_time)),
+		])
+
+
+def bench_inverse_updates(sizes=(16, 64), changes=20, repeat=3):
+	"""
+	Replaces one row at a time of a diagonally dominant matrix and keeps its inverse: inverting it again after every
+	change (matrix_inverse) versus an UpdatableInverse (Sherman-Morrison updates with drift checks).
+	"""
+
+	for size in sizes:
+		rnd = random.Random(22)
+		matrix = Matrix.Matrix(size, size, [rnd.uniform(-1.0, 1.0) + (size if i % (size + 1) == 0 else 0.0)
+		                                    for i in range(size * size)])
+		new_rows = [(rnd.randrange(size), [rnd.uniform(-1.0, 1.0) for __ in range(size)]) for __ in range(changes)]
+
+		for index, row in new_rows:
+			row[index] += size
+
+		def invert_again():
+			current = matrix.copy()
+
+			for index, row in new_rows:
+				for ci, value in enumerate(row):
+					current.set(index, ci, value)
+
+				mu.matrix_inverse(current)
+
+		def update():
+			inverse = mu.UpdatableInverse(matrix)
+
+			for index, row in new_rows:
+				inverse.replace_row(index, row)
+
+			return inverse
+
+		again_time = min(timeit.repeat(invert_again, number=1, repeat=repeat))
+		update_time = min(timeit.repeat(update, number=1, repeat=repeat))
+		updated = update()
+
+		report("Inverse updates, {0}x{0}, {1} row changes".format(size, changes), [
+			("matrix_inverse after every change", "{:10.2f} ms".format(again_time * 1e3)),
+			("UpdatableInverse", "{:10.2f} ms  ({:.1f}x)".format(update_time * 1e3, again_time / update_time)),
+			("drift / refactorizations", "{:10.1e} / {}".format(updated.drift(), updated.refactorizations)),
+		])
+
+
+def bench_column_space_many(shapes=((6, 3), (12, 6)), count=2000, repeat=3):
+	"""
+	Tests count candidate vectors (half of them in the column space) against the same matrix: in_column_space once per
+	vector versus a single in_column_space_many.
+	"""
+
+	for rows_count, cols_count in shapes:
+		rnd = random.Random(23)
+		matrix = Matrix.Matrix(rows_count, cols_count, random_elements(rows_count, cols_count, seed=24))
+		candidates = []
+
+		for ci in range(count):
+			if ci % 2:
+				candidates.append([rnd.uniform(-1.0, 1.0) for __ in range(rows_count)])
+			else:
+				x = Matrix.Matrix(cols_count, 1, [rnd.uniform(-1.0, 1.0) for __ in range(cols_count)])
+				candidates.append(list(mu.matrix_prod(matrix, x).elements()))
+
+		targets = Matrix.Matrix(rows_count, count, [candidate[ri] for ri in range(rows_count) for candidate in candidates])
+		vectors = [Matrix.Matrix(rows_count, 1, candidate) for candidate in candidates]
+
+		one_by_one = min(timeit.repeat(lambda: [mu.in_column_space(vector, matrix) for vector in vectors],
+		                               number=1, repeat=repeat))
+		batched = min(timeit.repeat(lambda: mu.in_column_space_many(targets, matrix), number=1, repeat=repeat))
+
+		report("Column space membership, {} vectors against a {}x{} matrix".format(count, rows_count, cols_count), [
+			("in_column_space per vector", "{:10.2f} ms".format(one_by_one * 1e3)),
+			("in_column_space_many", "{:10.2f} ms  ({:.1f}x)".format(batched * 1e3, one_by_one / batched)),
+		])
+
+
+def bench_simplex_volumes(dimensions=(3, 6), count=2000, repeat=3):
+	"""
+	Signed volumes of count random simplices: a Matrix of edges and matrix_determinant per simplex versus a single
+	simplex_signed_volumes call.
+	"""
+
+	for n in dimensions:
+		rnd = random.Random(25)
+		simplices = [[[rnd.uniform(-1.0, 1.0) for __ in range(n)] for __ in range(n + 1)] for __ in range(count)]
+		factorial = math.factorial(n)
+
+		def per_simplex():
+			return [mu.matrix_determinant(Matrix.Matrix(n, n, [c - o for point in simplex[1:]
+			                                                    for c, o in zip(point, simplex[0])])) / factorial
+			        for simplex in simplices]
+
+		one_by_one = min(timeit.repeat(per_simplex, number=1, repeat=repeat))
+		batched = min(timeit.repeat(lambda: vu.simplex_signed_volumes(simplices), number=1, repeat=repeat))
+
+		report("Signed volumes of {} simplices in R{}".format(count, n), [
+			("matrix_determinant per simplex", "{:10.2f} ms".format(one_by_one * 1e3)),
+			("simplex_signed_volumes", "{:10.2f} ms  ({:.1f}x)".format(batched * 1e3, one_by_one / batched)),
+		])
+
+
+BENCHMARKS = [
+	bench_storage_modes,
+	bench_instance_memory,
+	bench_matrix_stack,
+	bench_fixed_size,
+	bench_serialization,
+	bench_lazy_expressions,
+	bench_frozen_cache,
+	bench_row_reduction,
+	bench_lu_solve,
+	bench_inverse,
+	bench_large_products,
+	bench_parallel,
+	bench_least_squares,
+	bench_iterative_solvers,
+	bench_incremental_echelon,
+	bench_inverse_updates,
+	bench_column_space_many,
+	bench_simplex_volumes,
+]
+
+
+if __name__ == "__main__":
+	for benchmark in BENCHMARKS:
+		benchmark()
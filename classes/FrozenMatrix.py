@@ -0,0 +1,154 @@
+from array import array
+from collections import OrderedDict
+
+from . import Matrix
+
+DEFAULT_CACHE_SIZE = 256
+
+
+class FrozenMatrix(Matrix.Matrix):
+	"""
+	Immutable Matrix. Its elements are kept in a tuple, so it can be hashed (the hash is computed once, when it is
+	created) and used as a dictionary key.
+
+	Matrix_Utils memoizes the expensive results derived from frozen matrices (inverse, row-reduced echelon form, rank,
+	determinant...) in CACHE, so calling them again on an equal frozen matrix, e.g. a bind pose or a plane basis, costs
+	a dictionary lookup. Memoized matrices are returned frozen as well, since they are shared between callers.
+
+	Use Matrix.freeze() to get a frozen copy of a matrix and copy() to get a mutable one back.
+	"""
+
+	__slots__ = ('__hash',)
+
+	frozen = True
+
+	def __init__(self, rows, columns, elements=None, exact=False, numeric=None):
+		super(FrozenMatrix, self).__init__(rows, columns, elements, exact=exact, numeric=numeric)
+
+		self._Matrix__elements = tuple(self._Matrix__elements)
+		self.__hash = hash((self.rows, self.cols, self.numeric.name, self._Matrix__elements))
+
+	def __hash__(self):
+		return self.__hash
+
+	def __eq__(self, other):
+		"""
+		Frozen matrices are equal when they share dimension, numeric backend and elements (compared exactly, as the
+		hash is). Use Matrix_Utils.matrix_equality for a comparison within a tolerance.
+		"""
+
+		if not isinstance(other, FrozenMatrix):
+			return NotImplemented
+
+		return self.__hash == other.__hash and self.rows == other.rows and self.cols == other.cols and \
+			self.numeric.name == other.numeric.name and self.elements() == other.elements()
+
+	def __ne__(self, other):
+		equal = self.__eq__(other)
+
+		return equal if equal is NotImplemented else not equal
+
+	def __iadd__(self, other):
+		''' Fall back to __add__, which returns a new matrix '''
+		return NotImplemented
+
+	__isub__ = __iadd__
+	__imul__ = __iadd__
+	__imatmul__ = __iadd__
+
+	def buffer(self):
+		"""
+		Returns a read-only float64 memoryview over a copy of the elements.
+
+			:return: memoryview instance
+
+			:raise: Exception
+		"""
+
+		if self.exact:
+			raise Exception("Exact matrices don\'t store float64 elements and don\'t expose a buffer. Exiting...")
+
+		return memoryview(array('d', self.elements())).toreadonly().cast('B').cast('d', (self.rows, self.cols))
+
+	@property
+	def __array_interface__(self):
+		raise AttributeError("Frozen matrices don\'t expose their elements\' memory")
+
+	def freeze(self):
+		return self
+
+	def set_elements(self, elements):
+		if hasattr(self, '_FrozenMatrix__hash'):
+			raise Exception(Matrix.FROZEN_MESSAGE)
+
+		return super(FrozenMatrix, self).set_elements(elements)
+
+	def set(self, row, col, value):
+		raise Exception(Matrix.FROZEN_MESSAGE)
+
+
+class DerivedCache(object):
+	"""
+	Bounded, least-recently-used cache of the results derived from frozen matrices. Keys are tuples holding the name of
+	the derived result, the frozen matrix and any argument the result depends on.
+	"""
+
+	def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+		super(DerivedCache, self).__init__()
+
+		self.maxsize = maxsize
+		self.hits = 0
+		self.misses = 0
+		self.__entries = OrderedDict()
+
+	def __len__(self):
+		return len(self.__entries)
+
+	def lookup(self, key, compute):
+		"""
+		Returns the result cached for key, computing (and caching) it first when it is not cached.
+
+			:param key: Hashable
+			:param compute: Callable with no arguments returning the result
+
+			:return: The cached result
+		"""
+
+		entries = self.__entries
+
+		try:
+			result = entries[key]
+		except KeyError:
+			self.misses += 1
+		else:
+			self.hits += 1
+			entries.move_to_end(key)
+
+			return result
+
+		result = compute()
+		entries[key] = result
+
+		if len(entries) > self.maxsize:
+			entries.popitem(last=False)
+
+		return result
+
+	def clear(self):
+		"""
+		Drops every cached result and resets the counters.
+		"""
+
+		self.__entries.clear()
+		self.hits = 0
+		self.misses = 0
+
+	def info(self):
+		"""
+		:return: Dictionary with the hits, misses, current size and maximum size of the cache
+		"""
+
+		return {'hits': self.hits, 'misses': self.misses, 'size': len(self.__entries), 'maxsize': self.maxsize}
+
+
+CACHE = DerivedCache()
@@ -1,28 +1,381 @@
+import os
+import sys
+import mmap
+from array import array
 from decimal import Decimal
+from fractions import Fraction
+
+from . import MatrixExpression
+
+FROZEN_MESSAGE = "Frozen matrices can\'t be modified. Use copy() to get a mutable one. Exiting..."
 
 
 class Matrix(object):
-	rows = 0
-	cols = 0
-	decimals = 6
+	"""
+	Dense rows x cols matrix stored in row-major order.
+
+	The numeric type of the elements is chosen per matrix with the numeric argument (see NUMERICS):
+
+		- 'float' (default): plain doubles in a compact array('d') buffer. No rounding is applied when they are
+		stored; the tolerance given by Matrix.decimals is only applied when matrices are compared.
+		- 'decimal': Decimals rounded to Matrix.decimals (or to the decimals of a DecimalNumeric instance), for
+		reproducible output. exact=True is a shortcut for it.
+		- 'fraction': fractions.Fraction, for exact row reduction of small integer systems.
+
+	Instances only hold their shape and their element buffer (no per-instance __dict__), which keeps the many small
+	3x3/4x4 matrices used by a scene as cheap as possible.
+
+	The +, -, * (by a scalar) and @ operators map to the Matrix_Utils functions; their in-place variants (+=, -=, *=,
+	@=) write the result back into this matrix\'s buffer instead of allocating a new matrix.
+
+	Float matrices expose their buffer to NumPy (__array_interface__) and to anything accepting the buffer protocol
+	(Matrix.buffer), and can wrap an existing float64 buffer with Matrix.from_buffer. In both directions the memory is
+	shared, not copied.
+	"""
+
+	__slots__ = ('rows', 'cols', '__elements', '__numeric')
 
-	__elements = []
+	decimals = 6
+	frozen = False
 
 	def __str__(self):
-		return "{}".format(self.__elements)
+		return "{}".format(list(self.__elements))
 
-	def __init__(self, rows, columns, elements=None):
+	def __init__(self, rows, columns, elements=None, exact=False, numeric=None):
 		super(Matrix, self).__init__()
 
 		self.rows = rows
 		self.cols = columns
+		self.__numeric = get_numeric(numeric if numeric is not None else ('decimal' if exact else 'float'))
 
 		elements = elements if elements else []
 		if len(elements) > 0:
-			self.set_elements([e for e in elements])
+			self.set_elements(elements)
 
 		else:
-			self.__elements = [0.0 for __ in range(rows * columns)]
+			self.__elements = self.__numeric.zeros(rows * columns)
+
+	def __add__(self, other):
+		if not hasattr(other, 'cols') or getattr(other, 'is_expression', False):
+			''' Lazy expressions handle the operation themselves (see MatrixExpression) '''
+			return NotImplemented
+
+		return _matrix_utils().matrix_add(self, other)
+
+	def __sub__(self, other):
+		if not hasattr(other, 'cols') or getattr(other, 'is_expression', False):
+			return NotImplemented
+
+		return _matrix_utils().matrix_sub(self, other)
+
+	def __mul__(self, scalar):
+		if hasattr(scalar, 'cols'):
+			return NotImplemented
+
+		return _matrix_utils().matrix_scalar_prod(self, scalar)
+
+	__rmul__ = __mul__
+
+	def __matmul__(self, other):
+		if not hasattr(other, 'cols') or getattr(other, 'is_expression', False):
+			return NotImplemented
+
+		return _matrix_utils().matrix_prod(self, other)
+
+	def __neg__(self):
+		return _matrix_utils().matrix_scalar_prod(self, -1)
+
+	def lazy(self):
+		"""
+		Starts a lazy expression from this matrix: operations on the result are recorded and only computed, in a single
+		fused pass, when evaluate() is called on it, e.g. (A.lazy() * 0.5 + B) @ C.lazy().T. Fusing pays off for scaled
+		sums and transposes; products run through the same kernels matrix_prod uses, and on 3x3/4x4 matrices building
+		the expression costs more than calling matrix_prod directly.
+
+			:return: MatrixExpression instance
+		"""
+
+		return MatrixExpression.MatrixLeaf(self)
+
+	def __iadd__(self, other):
+		if not hasattr(other, 'cols') or getattr(other, 'is_expression', False):
+			return NotImplemented
+
+		return _matrix_utils().matrix_add(self, other, out=self)
+
+	def __isub__(self, other):
+		if not hasattr(other, 'cols') or getattr(other, 'is_expression', False):
+			return NotImplemented
+
+		return _matrix_utils().matrix_sub(self, other, out=self)
+
+	def __imul__(self, scalar):
+		if hasattr(scalar, 'cols'):
+			return NotImplemented
+
+		return _matrix_utils().matrix_scalar_prod(self, scalar, out=self)
+
+	def __imatmul__(self, other):
+		if not hasattr(other, 'cols') or getattr(other, 'is_expression', False):
+			return NotImplemented
+
+		if other.rows == other.cols:
+			''' The product keeps this matrix\'s dimension, so it is written back into its buffer '''
+			return _matrix_utils().matrix_prod(self, other, out=self)
+
+		return _matrix_utils().matrix_prod(self, other)
+
+	@classmethod
+	def from_buffer(cls, buffer, rows, columns):
+		"""
+		Creates a rows x columns matrix backed by the buffer received as argument (array('d'), bytearray, mmap, NumPy
+		array, ...). When the buffer holds float64 elements, or raw bytes, the matrix shares its memory with it;
+		buffers holding any other numeric type are copied into a new array('d').
+
+			:param buffer: Object supporting the buffer protocol, C-contiguous
+			:param rows: Integer
+			:param columns: Integer
+
+			:return: Matrix instance
+
+			:raise: Exception
+		"""
+
+		view = memoryview(buffer)
+
+		try:
+			if view.format in ('d', '<d', '=d', 'B', 'b', 'c'):
+				elements = view.cast('B').cast('d')
+			else:
+				elements = array('d', view.cast('B').cast(view.format))
+		except (TypeError, ValueError) as exc:
+			raise Exception("Unable to read float elements from the buffer received: %s" % exc)
+
+		try:
+			assert len(elements) == rows * columns
+		except AssertionError:
+			raise Exception("The buffer holds %i elements, expected %i for a %ix%i matrix" % (
+				len(elements), rows * columns, rows, columns))
+
+		matrix = cls.__new__(cls)
+		matrix.rows = rows
+		matrix.cols = columns
+		matrix.__numeric = FLOAT
+		matrix.__elements = elements
+
+		return matrix
+
+	@classmethod
+	def from_stored(cls, rows, columns, elements, numeric):
+		"""
+		Creates a matrix adopting elements that already have the type and precision the numeric backend stores (e.g.
+		Decimals rounded to its decimals, read back by Matrix_IO), so they are not converted again one by one as
+		set_elements does. The sequence is used as received, not copied.
+
+			:param rows: Integer
+			:param columns: Integer
+			:param elements: array('d') for the float backend, list for the exact ones
+			:param numeric: String ('float', 'decimal', 'fraction') or numeric backend instance
+
+			:return: Matrix instance
+
+			:raise: Exception
+		"""
+
+		try:
+			assert len(elements) == rows * columns
+		except AssertionError:
+			raise Exception("Received %i elements, expected %i for a %ix%i matrix" % (
+				len(elements), rows * columns, rows, columns))
+
+		matrix = cls.__new__(cls)
+		matrix.rows = rows
+		matrix.cols = columns
+		matrix.__numeric = get_numeric(numeric)
+		matrix.__elements = elements
+
+		return matrix
+
+	@classmethod
+	def open_mmap(cls, path, rows, columns, mode='r+'):
+		"""
+		Creates a rows x columns matrix backed by a memory-mapped file holding rows * columns native float64 values in
+		row-major order (no header). Elements are paged in from disk as they are read, so the matrix can be larger than
+		the memory available, and every Matrix_Utils routine accepts it as any other float matrix.
+
+		The modes follow the ones used by NumPy\'s memmap:
+
+			- 'r': Read-only. Writing to the matrix raises a TypeError.
+			- 'r+': Read and write an existing file.
+			- 'w+': Create (or truncate) the file with rows * columns zeros, read and write.
+			- 'c': Copy-on-write. Changes stay in memory and are never written to the file.
+
+			:param path: String
+			:param rows: Integer
+			:param columns: Integer
+			:param mode: String
+
+			:return: Matrix instance. Call its close() method, or use it as a context manager, to release the file.
+
+			:raise: Exception
+		"""
+
+		accesses = {'r': mmap.ACCESS_READ, 'r+': mmap.ACCESS_WRITE, 'w+': mmap.ACCESS_WRITE, 'c': mmap.ACCESS_COPY}
+		size = rows * columns * 8
+
+		try:
+			access = accesses[mode]
+		except KeyError:
+			raise Exception("Unknown mode \'%s\'. Expected one of: %s" % (mode, ", ".join(sorted(accesses))))
+
+		if size == 0:
+			raise Exception("Can\'t memory-map an empty %ix%i matrix. Exiting..." % (rows, columns))
+
+		with open(path, 'w+b' if mode == 'w+' else ('rb' if mode == 'r' else 'r+b')) as fp:
+			if mode == 'w+':
+				fp.truncate(size)
+			elif os.fstat(fp.fileno()).st_size < size:
+				raise Exception("The file %s is too small for a %ix%i float64 matrix" % (path, rows, columns))
+
+			mapping = mmap.mmap(fp.fileno(), size, access=access)
+
+		return cls.from_buffer(mapping, rows, columns)
+
+	def _mapping(self):
+		elements = self.__elements
+
+		if isinstance(elements, memoryview) and isinstance(elements.obj, mmap.mmap):
+			return elements.obj
+
+		return None
+
+	def flush(self):
+		"""
+		Writes the changes of a memory-mapped matrix to its file. Does nothing for other matrices.
+		"""
+
+		mapping = self._mapping()
+
+		if mapping is not None and not mapping.closed:
+			try:
+				mapping.flush()
+			except (TypeError, ValueError, OSError):
+				''' Read-only and copy-on-write mappings have nothing to flush '''
+				pass
+
+		return self
+
+	def close(self):
+		"""
+		Flushes and unmaps the file backing a memory-mapped matrix. The matrix can\'t be used afterwards. Does nothing
+		for other matrices.
+		"""
+
+		mapping = self._mapping()
+
+		if mapping is not None and not mapping.closed:
+			self.flush()
+			self.__elements.release()
+			mapping.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def buffer(self):
+		"""
+		Returns a rows x cols memoryview over the elements of this matrix. Writing to it writes to the matrix.
+
+			:return: memoryview
+
+			:raise: Exception
+		"""
+
+		if self.exact:
+			raise Exception("Exact matrices don\'t store float64 elements and don\'t expose a buffer. Exiting...")
+
+		return memoryview(self.__elements).cast('B').cast('d', (self.rows, self.cols))
+
+	def __buffer__(self, flags):
+		return self.buffer()
+
+	@property
+	def __array_interface__(self):
+		if self.exact:
+			raise AttributeError("Exact matrices don\'t store float64 elements and don\'t expose a buffer")
+
+		return {
+			'version': 3,
+			'shape': (self.rows, self.cols),
+			'typestr': '<f8' if sys.byteorder == 'little' else '>f8',
+			'data': self.__elements,
+		}
+
+	@property
+	def exact(self):
+		"""
+		True when the elements are stored as Decimals or Fractions, False when they are stored as doubles.
+		"""
+
+		return self.__numeric.exact
+
+	@property
+	def numeric(self):
+		"""
+		The numeric backend (FloatNumeric, DecimalNumeric or FractionNumeric instance) of the elements.
+		"""
+
+		return self.__numeric
+
+	@classmethod
+	def tolerance(cls):
+		"""
+		Returns the absolute difference under which two elements are considered equal, i.e. the tolerance derived from
+		Matrix.decimals.
+
+			:return: Float
+		"""
+
+		return 0.1 ** cls.decimals
+
+	def coerce(self, value):
+		"""
+		Converts the value received as argument to the numeric type used to store the elements of this matrix.
+
+			:param value: Integer, float, Decimal or Fraction
+
+			:return: Float, Decimal or Fraction
+		"""
+
+		return self.__numeric.coerce(value)
+
+	def copy(self):
+		return Matrix(self.rows, self.cols, self.__elements, numeric=self.__numeric)
+
+	def freeze(self):
+		"""
+		Returns an immutable, hashable copy of this matrix, whose derived results (inverse, row-reduced echelon form,
+		rank, determinant) are memoized by Matrix_Utils.
+
+			:return: FrozenMatrix instance
+		"""
+
+		from .FrozenMatrix import FrozenMatrix
+
+		return FrozenMatrix(self.rows, self.cols, self.__elements, numeric=self.__numeric)
+
+	def converted(self, numeric):
+		"""
+		Returns a copy of this matrix whose elements use the numeric backend received as argument.
+
+			:param numeric: String ('float', 'decimal', 'fraction') or numeric backend instance
+
+			:return: Matrix instance
+		"""
+
+		return Matrix(self.rows, self.cols, self.__elements, numeric=numeric)
 
 	def get(self, row, col):
 		try:
@@ -45,6 +398,61 @@ class Matrix(object):
 	def col(self, index):
 		return [self.get(ri, index) for ri in range(self.rows)]
 
+	def row_view(self, index):
+		"""
+		Returns a view over the row at the index received as argument. The view reads and writes this matrix\'s
+		elements directly, no copy is made.
+
+			:param index: Integer
+
+			:return: VectorView instance
+
+			:raise: IndexError
+		"""
+
+		if not 0 <= index < self.rows:
+			raise IndexError(
+				"Received a row index greater than the rows contained (indices are zero-based): %i > %i" % (
+				index, self.rows - 1))
+
+		return VectorView(self.__elements, index * self.cols, 1, self.cols, self.__numeric.store)
+
+	def col_view(self, index):
+		"""
+		Returns a view over the column at the index received as argument. The view reads and writes this matrix\'s
+		elements directly, no copy is made.
+
+			:param index: Integer
+
+			:return: VectorView instance
+
+			:raise: IndexError
+		"""
+
+		if not 0 <= index < self.cols:
+			raise IndexError(
+				"Received a column index greater than the columns contained (indices are zero-based): %i > %i" % (
+				index, self.cols - 1))
+
+		return VectorView(self.__elements, index, self.cols, self.rows, self.__numeric.store)
+
+	def submatrix_view(self, row, col, rows, cols):
+		"""
+		Returns a view over the rows x cols block whose top-left element is at (row, col). The view reads and writes
+		this matrix\'s elements directly, no copy is made.
+
+			:param row: Integer
+			:param col: Integer
+			:param rows: Integer
+			:param cols: Integer
+
+			:return: SubmatrixView instance
+
+			:raise: IndexError
+		"""
+
+		return SubmatrixView(self, row, col, rows, cols)
+
 	def elements(self):
 		return self.__elements
 
@@ -52,8 +460,11 @@ class Matrix(object):
 		try:
 			assert len(elements) == self.rows * self.cols
 
-			self.__elements = [round(Decimal(str(e)), Matrix.decimals) for e in elements]
-		# self.__elements = [round(float(int(e * 10000000))/10000000.0, 7) for e in elements]
+			if isinstance(getattr(self, '_Matrix__elements', None), memoryview):
+				''' Keep writing to the shared buffer this matrix was created from '''
+				self.__elements[:] = array('d', elements)
+			else:
+				self.__elements = self.__numeric.storage(elements)
 		except AssertionError:
 			raise Exception("Not enough elements received")
 
@@ -61,8 +472,12 @@ class Matrix(object):
 
 	def set(self, row, col, value):
 		try:
-			self.__elements[(row * self.cols) + col] = round(Decimal(str(value)), Matrix.decimals)
-		# self.__elements[(row * self.cols) + col] = round(float(int(value * 10000000))/10000000.0, 7)
+			store = self.__numeric.store
+
+			if store is None:
+				self.__elements[(row * self.cols) + col] = value
+			else:
+				self.__elements[(row * self.cols) + col] = store(value)
 		except IndexError:
 			if row >= self.rows:
 				raise IndexError(
@@ -101,3 +516,421 @@ class Matrix(object):
 				raise ie
 
 		return self
+
+
+def _matrix_utils():
+	"""
+	Matrix_Utils imports this module, so it is imported on first use by the arithmetic operators.
+	"""
+
+	from ..utils import Matrix_Utils
+
+	return Matrix_Utils
+
+
+class VectorView(object):
+	"""
+	Strided window over a flat element buffer: element i of the view is buffer[start + i * stride]. Rows of a matrix
+	are views with stride 1 and columns are views with a stride equal to the matrix\'s columns.
+
+	Views are bound to the buffer the matrix holds when they are created; replacing the matrix\'s elements with
+	set_elements leaves existing views pointing at the previous buffer. Views over a frozen matrix (whose elements are
+	kept in a tuple) are read-only: writing through them raises.
+	"""
+
+	__slots__ = ('buffer', 'start', 'stride', 'length', 'store')
+
+	def __init__(self, buffer, start, stride, length, store=None):
+		super(VectorView, self).__init__()
+
+		self.buffer = buffer
+		self.start = start
+		self.stride = stride
+		self.length = length
+		self.store = store
+
+	def __str__(self):
+		return "{}".format(self.tolist())
+
+	def __len__(self):
+		return self.length
+
+	def __iter__(self):
+		buffer = self.buffer
+
+		for i in range(self.start, self.start + self.stride * self.length, self.stride):
+			yield buffer[i]
+
+	def __getitem__(self, index):
+		if index < 0:
+			index += self.length
+
+		if not 0 <= index < self.length:
+			raise IndexError("View index out of range: %i" % index)
+
+		return self.buffer[self.start + index * self.stride]
+
+	def __setitem__(self, index, value):
+		if index < 0:
+			index += self.length
+
+		if not 0 <= index < self.length:
+			raise IndexError("View index out of range: %i" % index)
+
+		buffer = self.writable_buffer()
+
+		if self.store is not None:
+			value = self.store(value)
+
+		buffer[self.start + index * self.stride] = value
+
+	def indices(self):
+		return range(self.start, self.start + self.stride * self.length, self.stride)
+
+	def writable_buffer(self):
+		"""
+		Returns the buffer the view writes to.
+
+			:raise: Exception when the view is over a frozen matrix
+		"""
+
+		if isinstance(self.buffer, tuple):
+			raise Exception(FROZEN_MESSAGE)
+
+		return self.buffer
+
+	def tolist(self):
+		return [e for e in self]
+
+	def assign(self, values):
+		"""
+		Copies the values received as argument (any iterable with as many elements as the view) into the view.
+
+			:param values: Iterable of numbers
+
+			:return: VectorView instance
+		"""
+
+		try:
+			assert len(values) == self.length
+		except AssertionError:
+			raise IndexError("The total elements received is not equal to the length of the view. Exiting...")
+
+		buffer = self.writable_buffer()
+		store = self.store
+
+		if store is not None:
+			for i, value in zip(self.indices(), values):
+				buffer[i] = store(value)
+		else:
+			for i, value in zip(self.indices(), values):
+				buffer[i] = value
+
+		return self
+
+	def scale(self, scalar):
+		"""
+		Multiplies every element of the view by the scalar received as argument, in place.
+
+			:param scalar: Integer, float, Decimal or Fraction
+
+			:return: VectorView instance
+		"""
+
+		buffer = self.writable_buffer()
+		store = self.store
+
+		if store is not None:
+			scalar = store(scalar)
+
+			for i in self.indices():
+				buffer[i] = store(buffer[i] * scalar)
+		else:
+			for i in self.indices():
+				buffer[i] *= scalar
+
+		return self
+
+	def add_scaled(self, other, scalar):
+		"""
+		Adds scalar times the view received as argument to this view, in place: self = self + scalar * other.
+
+			:param other: VectorView instance with the same length
+			:param scalar: Integer, float, Decimal or Fraction
+
+			:return: VectorView instance
+		"""
+
+		try:
+			assert other.length == self.length
+		except AssertionError:
+			raise IndexError("Views have different lengths: %i /= %i" % (self.length, other.length))
+
+		buffer = self.writable_buffer()
+		other_buffer = other.buffer
+		store = self.store
+
+		if store is not None:
+			scalar = store(scalar)
+
+			for i, j in zip(self.indices(), other.indices()):
+				buffer[i] = store(buffer[i] + other_buffer[j] * scalar)
+		else:
+			for i, j in zip(self.indices(), other.indices()):
+				buffer[i] += other_buffer[j] * scalar
+
+		return self
+
+	def swap(self, other):
+		"""
+		Interchanges the elements of this view with the ones of the view received as argument, in place.
+
+			:param other: VectorView instance with the same length
+
+			:return: VectorView instance
+		"""
+
+		try:
+			assert other.length == self.length
+		except AssertionError:
+			raise IndexError("Views have different lengths: %i /= %i" % (self.length, other.length))
+
+		buffer = self.writable_buffer()
+		other_buffer = other.writable_buffer()
+
+		for i, j in zip(self.indices(), other.indices()):
+			buffer[i], other_buffer[j] = other_buffer[j], buffer[i]
+
+		return self
+
+
+class SubmatrixView(object):
+	"""
+	Rectangular window over a matrix\'s elements. It exposes the same get/set/row_view/col_view interface as Matrix,
+	with indices relative to the window, and reads and writes the parent\'s buffer directly.
+	"""
+
+	__slots__ = ('matrix', 'row_offset', 'col_offset', 'rows', 'cols')
+
+	def __init__(self, matrix, row, col, rows, cols):
+		super(SubmatrixView, self).__init__()
+
+		try:
+			assert 0 <= row and 0 <= col and rows >= 0 and cols >= 0
+			assert row + rows <= matrix.rows and col + cols <= matrix.cols
+		except AssertionError:
+			raise IndexError(
+				"The %ix%i block at (%i, %i) does not fit in a %ix%i matrix" % (rows, cols, row, col, matrix.rows,
+				                                                              matrix.cols))
+
+		self.matrix = matrix
+		self.row_offset = row
+		self.col_offset = col
+		self.rows = rows
+		self.cols = cols
+
+	def __str__(self):
+		return "{}".format(self.elements())
+
+	@property
+	def exact(self):
+		return self.matrix.exact
+
+	@property
+	def numeric(self):
+		return self.matrix.numeric
+
+	def coerce(self, value):
+		return self.matrix.coerce(value)
+
+	def get(self, row, col):
+		if not (0 <= row < self.rows and 0 <= col < self.cols):
+			raise IndexError("No element at row %i and col %i" % (row, col))
+
+		return self.matrix.get(self.row_offset + row, self.col_offset + col)
+
+	def set(self, row, col, value):
+		if not (0 <= row < self.rows and 0 <= col < self.cols):
+			raise IndexError("No element at row %i and col %i" % (row, col))
+
+		self.matrix.set(self.row_offset + row, self.col_offset + col, value)
+
+		return self
+
+	def row_view(self, index):
+		if not 0 <= index < self.rows:
+			raise IndexError(
+				"Received a row index greater than the rows contained (indices are zero-based): %i > %i" % (
+				index, self.rows - 1))
+
+		start = (self.row_offset + index) * self.matrix.cols + self.col_offset
+
+		return VectorView(self.matrix.elements(), start, 1, self.cols, self.matrix.numeric.store)
+
+	def col_view(self, index):
+		if not 0 <= index < self.cols:
+			raise IndexError(
+				"Received a column index greater than the columns contained (indices are zero-based): %i > %i" % (
+				index, self.cols - 1))
+
+		start = self.row_offset * self.matrix.cols + self.col_offset + index
+
+		return VectorView(self.matrix.elements(), start, self.matrix.cols, self.rows, self.matrix.numeric.store)
+
+	def row(self, index):
+		return self.row_view(index).tolist()
+
+	def col(self, index):
+		return self.col_view(index).tolist()
+
+	def elements(self):
+		"""
+		Returns a row-major copy of the elements inside the window.
+
+			:return: List
+		"""
+
+		elements = []
+
+		for ri in range(self.rows):
+			elements.extend(self.row_view(ri))
+
+		return elements
+
+	def assign(self, matrix):
+		"""
+		Copies the elements of the matrix (or view) received as argument into the window.
+
+			:param matrix: Matrix or SubmatrixView instance with the same dimension as the window
+
+			:return: SubmatrixView instance
+		"""
+
+		try:
+			assert matrix.rows == self.rows and matrix.cols == self.cols
+		except AssertionError:
+			raise Exception("Expected a %ix%i matrix, got a %ix%i one instead. Exiting..." % (
+				self.rows, self.cols, matrix.rows, matrix.cols))
+
+		for ri in range(self.rows):
+			self.row_view(ri).assign(matrix.row_view(ri))
+
+		return self
+
+
+class FloatNumeric(object):
+	"""
+	Numeric backend storing doubles in an array('d'). Elements are stored as received, with no conversion.
+	"""
+
+	name = 'float'
+	exact = False
+	store = None
+
+	def coerce(self, value):
+		return float(value)
+
+	def storage(self, elements):
+		return array('d', elements)
+
+	def zeros(self, count):
+		return array('d', [0.0]) * count
+
+
+class DecimalNumeric(object):
+	"""
+	Numeric backend storing Decimals rounded to a fixed number of decimals: the ones given when creating the backend
+	or, when none are given, Matrix.decimals at the time every element is stored.
+	"""
+
+	name = 'decimal'
+	exact = True
+
+	def __init__(self, decimals=None):
+		super(DecimalNumeric, self).__init__()
+
+		self.decimals = decimals
+
+	def store(self, value):
+		if isinstance(value, Fraction):
+			value = Decimal(value.numerator) / value.denominator
+		else:
+			value = Decimal(str(value))
+
+		return round(value, Matrix.decimals if self.decimals is None else self.decimals)
+
+	coerce = store
+
+	def storage(self, elements):
+		store = self.store
+
+		return [store(e) for e in elements]
+
+	def zeros(self, count):
+		return [Decimal(0) for __ in range(count)]
+
+
+class FractionNumeric(object):
+	"""
+	Numeric backend storing fractions.Fraction elements, so additions, products and divisions are exact. Floats are
+	converted through their shortest representation, i.e. 0.1 is stored as 1/10.
+	"""
+
+	name = 'fraction'
+	exact = True
+
+	def store(self, value):
+		if type(value) is Fraction:
+			return value
+		elif isinstance(value, float):
+			return Fraction(repr(value))
+
+		return Fraction(value)
+
+	coerce = store
+
+	def storage(self, elements):
+		store = self.store
+
+		return [store(e) for e in elements]
+
+	def zeros(self, count):
+		return [Fraction(0) for __ in range(count)]
+
+
+FLOAT = FloatNumeric()
+DECIMAL = DecimalNumeric()
+FRACTION = FractionNumeric()
+
+NUMERICS = {
+	FLOAT.name: FLOAT,
+	DECIMAL.name: DECIMAL,
+	FRACTION.name: FRACTION,
+}
+
+''' When operands use different backends, the one with the lowest precedence (the least exact) is used '''
+NUMERIC_PRECEDENCE = {
+	FLOAT.name: 0,
+	DECIMAL.name: 1,
+	FRACTION.name: 2,
+}
+
+
+def get_numeric(numeric):
+	"""
+	Returns the numeric backend for the name received as argument. Backend instances are returned as received.
+
+		:param numeric: String ('float', 'decimal', 'fraction') or numeric backend instance
+
+		:return: FloatNumeric, DecimalNumeric or FractionNumeric instance
+
+		:raise: Exception
+	"""
+
+	if hasattr(numeric, 'storage'):
+		return numeric
+
+	try:
+		return NUMERICS[numeric]
+	except KeyError:
+		raise Exception("Unknown numeric backend \'%s\'. Expected one of: %s" % (numeric, ", ".join(sorted(NUMERICS))))
@@ -0,0 +1,200 @@
+class MatrixExpression(object):
+	"""
+	Base class of the nodes of a lazy matrix expression tree. Combining expressions (or an expression and a Matrix)
+	with +, -, * (scalar), @ or transpose() records the operation instead of computing it; evaluate() computes the
+	whole tree in one fused pass (see Expression_Utils.evaluate).
+
+	Every node knows the dimension of its result, so invalid operations are reported when the tree is built.
+	"""
+
+	__slots__ = ('rows', 'cols')
+
+	is_expression = True
+
+	def __init__(self, rows, columns):
+		super(MatrixExpression, self).__init__()
+
+		self.rows = rows
+		self.cols = columns
+
+	def __str__(self):
+		return "<{} {}x{}>".format(type(self).__name__, self.rows, self.cols)
+
+	def __add__(self, other):
+		if not hasattr(other, 'cols'):
+			return NotImplemented
+
+		return MatrixSum(self, as_expression(other))
+
+	def __radd__(self, other):
+		if not hasattr(other, 'cols'):
+			return NotImplemented
+
+		return MatrixSum(as_expression(other), self)
+
+	def __sub__(self, other):
+		if not hasattr(other, 'cols'):
+			return NotImplemented
+
+		return MatrixSum(self, MatrixScale(as_expression(other), -1))
+
+	def __rsub__(self, other):
+		if not hasattr(other, 'cols'):
+			return NotImplemented
+
+		return MatrixSum(as_expression(other), MatrixScale(self, -1))
+
+	def __mul__(self, scalar):
+		if hasattr(scalar, 'cols'):
+			return NotImplemented
+
+		return MatrixScale(self, scalar)
+
+	__rmul__ = __mul__
+
+	def __neg__(self):
+		return MatrixScale(self, -1)
+
+	def __matmul__(self, other):
+		if not hasattr(other, 'cols'):
+			return NotImplemented
+
+		return MatrixProduct(self, as_expression(other))
+
+	def __rmatmul__(self, other):
+		if not hasattr(other, 'cols'):
+			return NotImplemented
+
+		return MatrixProduct(as_expression(other), self)
+
+	def transpose(self):
+		return MatrixTranspose(self)
+
+	@property
+	def T(self):
+		return MatrixTranspose(self)
+
+	def children(self):
+		return ()
+
+	def leaves(self):
+		"""
+		Returns the matrices at the leaves of the tree, left to right.
+
+			:return: List of Matrix or SparseMatrix instances
+		"""
+
+		leaves = []
+
+		for child in self.children():
+			leaves.extend(child.leaves())
+
+		return leaves
+
+	def evaluate(self, out=None):
+		"""
+		Computes the expression.
+
+			:param out: Optional Matrix instance with the expression\'s dimension to write the result into. It can be
+					one of the leaves.
+
+			:return: Matrix instance
+		"""
+
+		from ..utils import Expression_Utils
+
+		return Expression_Utils.evaluate(self, out=out)
+
+
+class MatrixLeaf(MatrixExpression):
+	"""
+	Wraps a Matrix (or SparseMatrix) so it can take part in an expression. The matrix is referenced, not copied.
+	"""
+
+	__slots__ = ('matrix',)
+
+	def __init__(self, matrix):
+		super(MatrixLeaf, self).__init__(matrix.rows, matrix.cols)
+
+		self.matrix = matrix
+
+	def leaves(self):
+		return [self.matrix]
+
+
+class MatrixTranspose(MatrixExpression):
+	__slots__ = ('operand',)
+
+	def __init__(self, operand):
+		super(MatrixTranspose, self).__init__(operand.cols, operand.rows)
+
+		self.operand = operand
+
+	def children(self):
+		return (self.operand,)
+
+
+class MatrixScale(MatrixExpression):
+	__slots__ = ('operand', 'scalar')
+
+	def __init__(self, operand, scalar):
+		super(MatrixScale, self).__init__(operand.rows, operand.cols)
+
+		self.operand = operand
+		self.scalar = scalar
+
+	def children(self):
+		return (self.operand,)
+
+
+class MatrixSum(MatrixExpression):
+	__slots__ = ('left', 'right')
+
+	def __init__(self, left, right):
+		try:
+			assert left.rows == right.rows and left.cols == right.cols
+		except AssertionError:
+			raise Exception("Matrix addition is not defined for matrices A(%ix%i) and B(%ix%i)" % (
+				left.rows, left.cols, right.rows, right.cols))
+
+		super(MatrixSum, self).__init__(left.rows, left.cols)
+
+		self.left = left
+		self.right = right
+
+	def children(self):
+		return (self.left, self.right)
+
+
+class MatrixProduct(MatrixExpression):
+	__slots__ = ('left', 'right')
+
+	def __init__(self, left, right):
+		try:
+			assert left.cols == right.rows
+		except AssertionError:
+			raise Exception("Matrix product for matrices A(%ix%i) and B(%ix%i) is not defined" % (
+				left.rows, left.cols, right.rows, right.cols))
+
+		super(MatrixProduct, self).__init__(left.rows, right.cols)
+
+		self.left = left
+		self.right = right
+
+	def children(self):
+		return (self.left, self.right)
+
+
+def as_expression(value):
+	"""
+	Returns the expression received as argument, or a MatrixLeaf wrapping it when it is a matrix.
+
+		:param value: MatrixExpression, Matrix or SparseMatrix instance
+
+		:return: MatrixExpression instance
+	"""
+
+	if getattr(value, 'is_expression', False):
+		return value
+
+	return MatrixLeaf(value)
@@ -0,0 +1,123 @@
+from array import array
+
+from . import Matrix
+
+
+class MatrixStack(object):
+	"""
+	Stack of count matrices sharing the same rows x cols dimension, stored back to back (row-major) in a single
+	array('d') buffer: matrix i starts at element i * rows * cols.
+
+	Indexing a stack returns a Matrix sharing the stack\'s memory, so reading or writing it reads or writes the stack.
+	"""
+
+	__slots__ = ('count', 'rows', 'cols', '__elements')
+
+	def __str__(self):
+		return "{}".format([self[i].elements().tolist() for i in range(self.count)])
+
+	def __init__(self, count, rows, columns, elements=None):
+		super(MatrixStack, self).__init__()
+
+		self.count = count
+		self.rows = rows
+		self.cols = columns
+
+		if elements is not None and len(elements) > 0:
+			try:
+				assert len(elements) == count * rows * columns
+			except AssertionError:
+				raise Exception("Expected %i elements for %i %ix%i matrices, got %i instead. Exiting..." % (
+					count * rows * columns, count, rows, columns, len(elements)))
+
+			self.__elements = array('d', elements)
+		else:
+			self.__elements = array('d', [0.0]) * (count * rows * columns)
+
+	@classmethod
+	def from_matrices(cls, matrices):
+		"""
+		Creates a stack holding a copy of the matrices received as argument, all of which must share the same dimension.
+
+			:param matrices: List of Matrix instances
+
+			:return: MatrixStack instance
+
+			:raise: Exception
+		"""
+
+		if len(matrices) == 0:
+			raise Exception("No matrices received to build the stack. Exiting...")
+
+		rows = matrices[0].rows
+		cols = matrices[0].cols
+		elements = array('d')
+
+		for matrix in matrices:
+			if not (matrix.rows == rows and matrix.cols == cols):
+				raise Exception("Matrices in a stack must share the same dimension: %ix%i /= %ix%i" % (
+					rows, cols, matrix.rows, matrix.cols))
+
+			elements.extend(array('d', matrix.elements()))
+
+		return cls(len(matrices), rows, cols, elements)
+
+	@classmethod
+	def identity(cls, count, order):
+		stack = cls(count, order, order)
+		elements = stack.elements()
+
+		for i in range(count):
+			offset = i * order * order
+
+			for d in range(order):
+				elements[offset + d * order + d] = 1.0
+
+		return stack
+
+	def __len__(self):
+		return self.count
+
+	def __getitem__(self, index):
+		if index < 0:
+			index += self.count
+
+		if not 0 <= index < self.count:
+			raise IndexError("Stack index out of range: %i" % index)
+
+		size = self.rows * self.cols
+
+		return Matrix.Matrix.from_buffer(memoryview(self.__elements)[index * size:(index + 1) * size], self.rows,
+		                                 self.cols)
+
+	def __setitem__(self, index, matrix):
+		if not (matrix.rows == self.rows and matrix.cols == self.cols):
+			raise Exception("Expected a %ix%i matrix, got a %ix%i one instead. Exiting..." % (
+				self.rows, self.cols, matrix.rows, matrix.cols))
+
+		if index < 0:
+			index += self.count
+
+		if not 0 <= index < self.count:
+			raise IndexError("Stack index out of range: %i" % index)
+
+		size = self.rows * self.cols
+		self.__elements[index * size:(index + 1) * size] = array('d', matrix.elements())
+
+	def __iter__(self):
+		for i in range(self.count):
+			yield self[i]
+
+	def elements(self):
+		return self.__elements
+
+	def matrices(self):
+		"""
+		Returns an independent copy of every matrix in the stack.
+
+			:return: List of Matrix instances
+		"""
+
+		size = self.rows * self.cols
+
+		return [Matrix.Matrix(self.rows, self.cols, self.__elements[i * size:(i + 1) * size]) for i in range(self.count)]
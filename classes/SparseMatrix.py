@@ -0,0 +1,236 @@
+from array import array
+from bisect import bisect_left
+
+from . import Matrix
+
+
+class SparseMatrix(object):
+	"""
+	Sparse rows x cols matrix stored in compressed sparse row (CSR) form:
+
+		- data holds the nonzero elements, row after row, as doubles.
+		- indices holds the column index of every element in data.
+		- indptr holds, for every row, the position in data/indices where the row starts (rows + 1 entries).
+
+	The column indices of every row are sorted and unique. Use SparseMatrix.from_coo or a COOMatrix builder to create
+	one from (row, col, value) triplets.
+	"""
+
+	__slots__ = ('rows', 'cols', 'indptr', 'indices', 'data')
+
+	exact = False
+	numeric = Matrix.FLOAT
+
+	def __str__(self):
+		return "{}".format(list(self.elements()))
+
+	def __init__(self, rows, columns, indptr=None, indices=None, data=None):
+		super(SparseMatrix, self).__init__()
+
+		self.rows = rows
+		self.cols = columns
+		self.indptr = array('l', indptr) if indptr is not None else array('l', [0]) * (rows + 1)
+		self.indices = array('l', indices) if indices is not None else array('l')
+		self.data = array('d', data) if data is not None else array('d')
+
+		try:
+			assert len(self.indptr) == rows + 1 and len(self.indices) == len(self.data) == self.indptr[-1]
+		except AssertionError:
+			raise Exception("Inconsistent CSR arrays received for a %ix%i matrix. Exiting..." % (rows, columns))
+
+	@classmethod
+	def from_coo(cls, rows, columns, row_indices, col_indices, values):
+		"""
+		Creates a CSR matrix from (row, col, value) triplets given as three parallel sequences. Triplets sharing the
+		same position are summed and explicit zeros are dropped.
+
+			:param rows: Integer
+			:param columns: Integer
+			:param row_indices: List of integers
+			:param col_indices: List of integers
+			:param values: List of floats
+
+			:return: SparseMatrix instance
+
+			:raise: IndexError
+		"""
+
+		row_entries = [{} for __ in range(rows)]
+
+		for ri, ci, value in zip(row_indices, col_indices, values):
+			if not (0 <= ri < rows and 0 <= ci < columns):
+				raise IndexError("No element at row %i and col %i on a %ix%i matrix" % (ri, ci, rows, columns))
+
+			entries = row_entries[ri]
+			entries[ci] = entries.get(ci, 0.0) + value
+
+		indptr = array('l', [0])
+		indices = array('l')
+		data = array('d')
+
+		for entries in row_entries:
+			for ci in sorted(entries):
+				value = entries[ci]
+
+				if value != 0.0:
+					indices.append(ci)
+					data.append(value)
+
+			indptr.append(len(data))
+
+		return cls(rows, columns, indptr, indices, data)
+
+	@classmethod
+	def from_dense(cls, matrix, tolerance=0.0):
+		"""
+		Creates a CSR matrix holding the elements of the dense matrix received as argument whose absolute value is
+		greater than tolerance.
+
+			:param matrix: Matrix instance
+			:param tolerance: Float
+
+			:return: SparseMatrix instance
+		"""
+
+		elements = matrix.elements()
+		cols = matrix.cols
+		indptr = array('l', [0])
+		indices = array('l')
+		data = array('d')
+
+		for ri in range(matrix.rows):
+			offset = ri * cols
+
+			for ci in range(cols):
+				value = elements[offset + ci]
+
+				if abs(value) > tolerance:
+					indices.append(ci)
+					data.append(value)
+
+			indptr.append(len(data))
+
+		return cls(matrix.rows, cols, indptr, indices, data)
+
+	def nnz(self):
+		"""
+		Returns the number of elements explicitly stored.
+
+			:return: Integer
+		"""
+
+		return len(self.data)
+
+	def coerce(self, value):
+		return float(value)
+
+	def copy(self):
+		return SparseMatrix(self.rows, self.cols, self.indptr, self.indices, self.data)
+
+	def get(self, row, col):
+		if not 0 <= row < self.rows:
+			raise IndexError(
+				"Received a row index greater than the rows contained (indices are zero-based): %i > %i" % (
+				row, self.rows - 1))
+		elif not 0 <= col < self.cols:
+			raise IndexError(
+				"Received a column index greater than the columns contained (indices are zero-based): %i > %i" % (
+				col, self.cols - 1))
+
+		start = self.indptr[row]
+		end = self.indptr[row + 1]
+		position = bisect_left(self.indices, col, start, end)
+
+		if position < end and self.indices[position] == col:
+			return self.data[position]
+
+		return 0.0
+
+	def row(self, index):
+		row = [0.0] * self.cols
+
+		for position in range(self.indptr[index], self.indptr[index + 1]):
+			row[self.indices[position]] = self.data[position]
+
+		return row
+
+	def col(self, index):
+		return [self.get(ri, index) for ri in range(self.rows)]
+
+	def row_entries(self, index):
+		"""
+		Returns the (column index, value) pairs stored for the row at the index received as argument.
+
+			:param index: Integer
+
+			:return: List of tuples
+		"""
+
+		start = self.indptr[index]
+		end = self.indptr[index + 1]
+
+		return list(zip(self.indices[start:end], self.data[start:end]))
+
+	def elements(self):
+		"""
+		Returns a dense, row-major copy of the elements.
+
+			:return: array('d')
+		"""
+
+		elements = array('d', [0.0]) * (self.rows * self.cols)
+		indices = self.indices
+		data = self.data
+
+		for ri in range(self.rows):
+			offset = ri * self.cols
+
+			for position in range(self.indptr[ri], self.indptr[ri + 1]):
+				elements[offset + indices[position]] = data[position]
+
+		return elements
+
+	def to_dense(self):
+		return Matrix.Matrix(self.rows, self.cols, self.elements())
+
+
+class COOMatrix(object):
+	"""
+	Coordinate-format builder for SparseMatrix: collects (row, col, value) triplets in any order and converts them to
+	CSR with to_csr().
+	"""
+
+	__slots__ = ('rows', 'cols', 'row_indices', 'col_indices', 'values')
+
+	def __init__(self, rows, columns):
+		super(COOMatrix, self).__init__()
+
+		self.rows = rows
+		self.cols = columns
+		self.row_indices = array('l')
+		self.col_indices = array('l')
+		self.values = array('d')
+
+	def add(self, row, col, value):
+		"""
+		Adds the value received as argument at (row, col). Values added more than once at the same position are summed
+		when converting to CSR.
+
+			:param row: Integer
+			:param col: Integer
+			:param value: Float
+
+			:return: COOMatrix instance
+		"""
+
+		self.row_indices.append(row)
+		self.col_indices.append(col)
+		self.values.append(value)
+
+		return self
+
+	def nnz(self):
+		return len(self.values)
+
+	def to_csr(self):
+		return SparseMatrix.from_coo(self.rows, self.cols, self.row_indices, self.col_indices, self.values)
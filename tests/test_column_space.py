@@ -0,0 +1,70 @@
+import random
+import unittest
+
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_Utils as mu
+
+
+def _residual_is_zero(matrix, x, k):
+	return mu.matrix_equality(mu.matrix_prod(matrix, x), k, tolerance=1e-6)
+
+
+class ColumnSpaceTest(unittest.TestCase):
+	"""
+	in_column_space and in_column_space_many give the same answers, and every solution they return solves matrix * x = k.
+	"""
+
+	def assert_agree(self, matrix, vectors):
+		targets = Matrix.Matrix(matrix.rows, len(vectors), [v[ri] for ri in range(matrix.rows) for v in vectors])
+		flags, solutions = mu.in_column_space_many(targets, matrix)
+
+		for ci, vector in enumerate(vectors):
+			k = Matrix.Matrix(matrix.rows, 1, vector)
+			in_space, x = mu.in_column_space(k, matrix)
+
+			self.assertEqual(in_space, flags[ci], vector)
+
+			if in_space:
+				self.assertTrue(_residual_is_zero(matrix, x, k), vector)
+				self.assertEqual(list(x.elements()), list(solutions.col_view(ci)), vector)
+			else:
+				self.assertIsNone(x)
+
+	def test_rank_deficient(self):
+		matrix = Matrix.Matrix(3, 3, [1, 2, 3, 2, 4, 6, 1, 1, 1])
+		in_space, x = mu.in_column_space(Matrix.Matrix(3, 1, [6, 12, 3]), matrix)
+
+		self.assertTrue(in_space)
+		self.assertEqual(list(x.elements()), [0.0, 3.0, 0.0])
+		self.assert_agree(matrix, [[6, 12, 3], [6, 11, 3], [0, 0, 0], [1, 2, 5]])
+
+	def test_singular_and_wide(self):
+		rnd = random.Random(3)
+
+		for rows, cols, rank in ((4, 4, 2), (4, 4, 3), (3, 5, 2), (5, 3, 1)):
+			left = [[rnd.randint(-3, 3) for __ in range(rank)] for __ in range(rows)]
+			right = [[rnd.randint(-3, 3) for __ in range(cols)] for __ in range(rank)]
+			matrix = Matrix.Matrix(rows, cols, [sum(left[ri][i] * right[i][ci] for i in range(rank)) for ri in range(rows)
+			                                    for ci in range(cols)])
+			vectors = [list(mu.matrix_prod(matrix, Matrix.Matrix(cols, 1, [rnd.randint(-2, 2) for __ in range(cols)])).elements())
+			           for __ in range(3)]
+			vectors += [[rnd.randint(-5, 5) for __ in range(rows)] for __ in range(3)]
+
+			self.assert_agree(matrix, vectors)
+
+	def test_exact_backend(self):
+		matrix = Matrix.Matrix(3, 3, [1, 2, 3, 2, 4, 6, 1, 1, 1], numeric='fraction')
+		in_space, x = mu.in_column_space(Matrix.Matrix(3, 1, [6, 12, 3], numeric='fraction'), matrix)
+
+		self.assertTrue(in_space)
+		self.assertEqual(list(mu.matrix_prod(matrix, x).elements()), [6, 12, 3])
+
+	def test_row_space(self):
+		matrix = Matrix.Matrix(3, 3, [1, 2, 3, 2, 4, 6, 1, 1, 1])
+
+		self.assertTrue(mu.in_row_space(Matrix.Matrix(1, 3, [3, 5, 7]), matrix)[0])
+		self.assertEqual(mu.in_row_space(Matrix.Matrix(1, 3, [1, 0, 0]), matrix), (False, None))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from fractions import Fraction
+
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_Utils as mu
+
+
+''' (rows, cols, elements, row-reduced-echelon form) '''
+CASES = [
+	(3, 3, [1, 2, 1, 2, 4, 0, 3, 6, 1], [1, 2, 0, 0, 0, 1, 0, 0, 0]),
+	(3, 4, [1, 2, 3, 4, 2, 4, 6, 8, 1, 0, 1, 0], [1, 0, 1, 0, 0, 1, 1, 2, 0, 0, 0, 0]),
+	(2, 3, [3, 1, 1, 1, 3, 1], [1, 0, Fraction(1, 4), 0, 1, Fraction(1, 4)]),
+	# A zero first pivot: the rows must be swapped
+	(3, 3, [0, 1, 2, 1, 0, 3, 4, -3, 8], [1, 0, 0, 0, 1, 0, 0, 0, 1]),
+	(3, 2, [0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0]),
+]
+
+BACKENDS = ('float', 'decimal', 'fraction')
+
+
+class RowReducedEchelonTest(unittest.TestCase):
+	def test_known_forms(self):
+		for rows, cols, elements, expected in CASES:
+			for numeric in BACKENDS:
+				rref = mu.row_reduced_echelon(Matrix.Matrix(rows, cols, elements, numeric=numeric))
+
+				self.assertEqual(rref.numeric.name, numeric)
+				self.assertTrue(mu.matrix_equality(rref, Matrix.Matrix(rows, cols, expected, numeric=numeric)),
+				                (elements, numeric, list(rref.elements())))
+
+	def test_fraction_is_exact(self):
+		rref = mu.row_reduced_echelon(Matrix.Matrix(2, 3, [3, 1, 1, 1, 3, 1], numeric='fraction'))
+
+		self.assertEqual(list(rref.elements()), [1, 0, Fraction(1, 4), 0, 1, Fraction(1, 4)])
+
+	def test_numeric_argument(self):
+		rref = mu.row_reduced_echelon(Matrix.Matrix(2, 3, [3, 1, 1, 1, 3, 1]), numeric='fraction')
+
+		self.assertEqual(list(rref.elements()), [1, 0, Fraction(1, 4), 0, 1, Fraction(1, 4)])
+
+	def test_small_pivot(self):
+		''' Without partial pivoting, eliminating with the 1e-8 pivot loses the second row to rounding '''
+		rref = mu.row_reduced_echelon(Matrix.Matrix(2, 3, [1e-8, 1, 1, 1, 1, 2]))
+
+		self.assertTrue(mu.matrix_equality(rref, Matrix.Matrix(2, 3, [1, 0, 1, 0, 1, 1])), list(rref.elements()))
+
+	def test_column_form_is_transposed_row_form(self):
+		for rows, cols, elements, expected in CASES:
+			for numeric in BACKENDS:
+				matrix = Matrix.Matrix(rows, cols, elements, numeric=numeric)
+				expected_form = mu.matrix_transpose(mu.row_reduced_echelon(mu.matrix_transpose(matrix)))
+
+				self.assertTrue(mu.matrix_equality(mu.column_reduced_echelon(matrix), expected_form), (elements, numeric))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,59 @@
+import random
+import unittest
+from fractions import Fraction
+
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_Utils as mu
+
+
+def _random_matrix(rows, cols, seed):
+	rnd = random.Random(seed)
+
+	return Matrix.Matrix(rows, cols, [rnd.uniform(-1.0, 1.0) for __ in range(rows * cols)])
+
+
+class EvaluateTest(unittest.TestCase):
+	"""
+	Lazy expressions evaluate to the same matrices as the eager Matrix_Utils chains, for sizes taking both the unrolled
+	and the tiled product kernels.
+	"""
+
+	def test_matches_eager(self):
+		for size in (2, 3, 4, 5, 16):
+			a = _random_matrix(size, size, 1)
+			b = _random_matrix(size, size, 2)
+			c = _random_matrix(size, size, 3)
+			j = _random_matrix(2 * size, size, 4)
+			identity = mu.matrix_identity(size)
+
+			for lazy, eager in (
+					(((a.lazy() * 0.3 + b.lazy() * 0.7) @ c.lazy().T),
+					 mu.matrix_prod(mu.matrix_add(mu.matrix_scalar_prod(a, 0.3), mu.matrix_scalar_prod(b, 0.7)),
+					                mu.matrix_transpose(c))),
+					((j.lazy().T @ j + identity.lazy() * 0.01),
+					 mu.matrix_add(mu.matrix_prod(mu.matrix_transpose(j), j), mu.matrix_scalar_prod(identity, 0.01))),
+					((a.lazy() @ b @ c), mu.matrix_prod(mu.matrix_prod(a, b), c)),
+					((a.lazy() - b.lazy() * 2 + c.lazy().T),
+					 mu.matrix_add(mu.matrix_sub(a, mu.matrix_scalar_prod(b, 2)), mu.matrix_transpose(c)))):
+				self.assertTrue(mu.matrix_equality(lazy.evaluate(), eager), size)
+
+	def test_out_aliasing_a_leaf(self):
+		a = _random_matrix(5, 5, 5)
+		b = _random_matrix(5, 5, 6)
+		expected = mu.matrix_prod(a, b)
+
+		result = (a.lazy() @ b).evaluate(out=a)
+
+		self.assertIs(result, a)
+		self.assertTrue(mu.matrix_equality(a, expected))
+
+	def test_fraction(self):
+		a = Matrix.Matrix(2, 2, [1, 2, 3, 4], numeric='fraction')
+
+		result = ((a.lazy() @ a.lazy().T) * Fraction(1, 3)).evaluate()
+
+		self.assertEqual(list(result.elements()), [Fraction(5, 3), Fraction(11, 3), Fraction(11, 3), Fraction(25, 3)])
+
+
+if __name__ == "__main__":
+	unittest.main()
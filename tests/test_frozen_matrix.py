@@ -0,0 +1,66 @@
+import unittest
+
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_IO as mio
+from Geometry.utils import Matrix_Utils as mu
+
+
+class FrozenMatrixTest(unittest.TestCase):
+	"""
+	Frozen matrices can be serialized, and every route that would write to them raises the frozen-matrix error.
+	"""
+
+	def setUp(self):
+		self.frozen = Matrix.Matrix(2, 2, [1.0, 2.0, 3.0, 4.0]).freeze()
+
+	def assertFrozenError(self, function, *args):
+		with self.assertRaises(Exception) as context:
+			function(*args)
+
+		self.assertEqual(str(context.exception), Matrix.FROZEN_MESSAGE)
+
+	def test_dump(self):
+		for numeric in ('float', 'decimal', 'fraction'):
+			frozen = Matrix.Matrix(2, 2, [1, 2, 3, 4], numeric=numeric).freeze()
+			loaded = mio.loads(mio.dumps(frozen))
+
+			self.assertEqual(loaded.numeric.name, numeric)
+			self.assertEqual(list(loaded.elements()), list(frozen.elements()))
+
+	def test_set(self):
+		self.assertFrozenError(self.frozen.set, 0, 0, 5.0)
+		self.assertFrozenError(self.frozen.set_elements, [0.0] * 4)
+
+	def test_out(self):
+		self.assertFrozenError(lambda: mu.matrix_add(self.frozen, self.frozen, out=self.frozen))
+		self.assertFrozenError(lambda: mu.matrix_sub(self.frozen, self.frozen, out=self.frozen))
+		self.assertFrozenError(lambda: mu.matrix_scalar_prod(self.frozen, 2.0, out=self.frozen))
+		self.assertFrozenError(lambda: mu.matrix_prod(self.frozen, self.frozen, out=self.frozen))
+		self.assertFrozenError(lambda: (self.frozen.lazy() * 2.0).evaluate(out=self.frozen))
+
+	def test_views(self):
+		row = self.frozen.row_view(0)
+		col = self.frozen.col_view(1)
+		mutable = Matrix.Matrix(2, 2, [5.0, 6.0, 7.0, 8.0]).row_view(1)
+
+		self.assertEqual(row.tolist(), [1.0, 2.0])
+		self.assertFrozenError(row.scale, 2.0)
+		self.assertFrozenError(row.assign, [0.0, 0.0])
+		self.assertFrozenError(row.add_scaled, col, 1.0)
+		self.assertFrozenError(row.__setitem__, 0, 9.0)
+		self.assertFrozenError(mutable.swap, row)
+		self.assertFrozenError(self.frozen.submatrix_view(0, 0, 1, 2).row_view(0).scale, 2.0)
+
+		self.assertEqual(list(self.frozen.elements()), [1.0, 2.0, 3.0, 4.0])
+		self.assertEqual(mutable.tolist(), [7.0, 8.0])
+
+	def test_operators_return_new_matrices(self):
+		result = self.frozen
+		result += self.frozen
+
+		self.assertIsNot(result, self.frozen)
+		self.assertEqual(list(self.frozen.elements()), [1.0, 2.0, 3.0, 4.0])
+
+
+if __name__ == "__main__":
+	unittest.main()
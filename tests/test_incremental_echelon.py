@@ -0,0 +1,85 @@
+import random
+import unittest
+
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_Utils as mu
+
+
+def _rows(count, cols, seed):
+	"""
+	Random integer rows, every third one a combination of the previous two.
+	"""
+
+	rnd = random.Random(seed)
+	rows = []
+
+	for ri in range(count):
+		if ri % 3 == 2:
+			rows.append([2 * a - b for a, b in zip(rows[-1], rows[-2])])
+		else:
+			rows.append([rnd.randint(-4, 4) for __ in range(cols)])
+
+	return rows
+
+
+class IncrementalEchelonTest(unittest.TestCase):
+	def test_matches_row_reduction(self):
+		for cols, numeric in ((4, 'float'), (3, 'fraction'), (6, 'decimal')):
+			rows = _rows(8, cols, cols)
+			echelon = mu.IncrementalEchelon(cols, numeric=numeric)
+
+			for count, row in enumerate(rows, 1):
+				previous = echelon.rank
+				raised = echelon.append(row)
+				matrix = Matrix.Matrix(count, cols, [e for r in rows[:count] for e in r], numeric=numeric)
+				reduction = mu.RowReduction(matrix)
+
+				self.assertEqual(raised, echelon.rank > previous)
+				self.assertEqual(echelon.rank, reduction.rank, (cols, count))
+				self.assertEqual(echelon.rows, count)
+				self.assertTrue(mu.matrix_equality(echelon.rref(), reduction.rref(), tolerance=1e-9), (cols, count))
+
+	def test_membership_matches_from_scratch(self):
+		rnd = random.Random(5)
+		cols = 4
+		rows = _rows(6, cols, 9)
+		echelon = mu.IncrementalEchelon(cols, numeric='fraction')
+		echelon.extend(Matrix.Matrix(len(rows), cols, [e for row in rows for e in row]))
+		matrix = Matrix.Matrix(len(rows), cols, [e for row in rows for e in row], numeric='fraction')
+
+		for __ in range(10):
+			x = [rnd.randint(-3, 3) for __ in range(cols)]
+			inside = [sum(a * b for a, b in zip(row, x)) for row in rows]
+			outside = [rnd.randint(-5, 5) for __ in rows]
+
+			for k in (inside, outside):
+				in_space, solution = echelon.in_column_space(k)
+				expected = mu.in_column_space(Matrix.Matrix(len(rows), 1, k, numeric='fraction'), matrix)[0]
+
+				self.assertEqual(in_space, expected, k)
+
+				if in_space:
+					self.assertEqual(list(mu.matrix_prod(matrix, solution).elements()), k)
+				else:
+					self.assertIsNone(solution)
+
+			y = [rnd.randint(-2, 2) for __ in rows]
+			combination = [sum(y[ri] * rows[ri][ci] for ri in range(len(rows))) for ci in range(cols)]
+
+			for k in (combination, [rnd.randint(-5, 5) for __ in range(cols)]):
+				in_space, solution = echelon.in_row_space(k)
+				expected = mu.in_row_space(Matrix.Matrix(1, cols, k, numeric='fraction'), matrix)[0]
+
+				self.assertEqual(in_space, expected, k)
+
+				if in_space:
+					self.assertEqual(list(mu.matrix_prod(solution, matrix).elements()), k)
+				else:
+					self.assertIsNone(solution)
+
+	def test_row_length(self):
+		self.assertRaises(Exception, mu.IncrementalEchelon(3).append, [1, 2])
+
+
+if __name__ == '__main__':
+	unittest.main()
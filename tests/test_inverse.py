@@ -0,0 +1,62 @@
+import random
+import unittest
+
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_Utils as mu
+
+
+def _scaled_identity(order, scale):
+	return mu.matrix_scalar_prod(mu.matrix_identity(order), scale)
+
+
+class SingularityTest(unittest.TestCase):
+	"""
+	has_inverse, try_inverse and LUFactorization agree on which matrices are singular, whether the 3x3/4x4 matrices go
+	through the unrolled kernels or not.
+	"""
+
+	def test_scaled_identity_same_at_every_order(self):
+		for scale, invertible in ((1e-5, False), (4e-5, False), (1e-4, True), (1e-2, True), (1.0, True), (1e3, True)):
+			for order in range(2, 6):
+				matrix = _scaled_identity(order, scale)
+
+				self.assertEqual(mu.has_inverse(matrix), invertible, (scale, order))
+				self.assertEqual(mu.try_inverse(matrix) is not None, invertible, (scale, order))
+
+	def test_tolerance_same_at_every_order(self):
+		for order in range(2, 6):
+			matrix = _scaled_identity(order, 1e-5)
+
+			self.assertTrue(mu.has_inverse(matrix, tolerance=1e-6), order)
+			self.assertIsNotNone(mu.try_inverse(matrix, tolerance=1e-6), order)
+
+	def test_fixed_size_matches_lu(self):
+		rnd = random.Random(7)
+
+		for order in (3, 4):
+			for __ in range(200):
+				''' Rank-deficient matrices nudged by a small amount, so some of them fall on each side of the test '''
+				rows = [[rnd.uniform(-1.0, 1.0) for __ in range(order)] for __ in range(order - 1)]
+				weights = [rnd.uniform(-1.0, 1.0) for __ in range(order - 1)]
+				nudge = rnd.choice((0.0, 1e-6, 1e-5, 1e-4, 1e-3))
+				last = [sum(w * row[ci] for w, row in zip(weights, rows)) + rnd.uniform(-nudge, nudge)
+				        for ci in range(order)]
+				matrix = Matrix.Matrix(order, order, [e for row in rows + [last] for e in row])
+
+				singular = mu.LUFactorization(matrix).singular
+
+				self.assertEqual(mu.has_inverse(matrix), not singular)
+				self.assertEqual(mu.try_inverse(matrix) is None, singular)
+
+	def test_affine_matches_lu(self):
+		for scale in (1e-5, 1e-3, 1.0):
+			matrix = Matrix.Matrix(4, 4, [scale, 0.0, 0.0, 1.0,
+			                              0.0, scale, 0.0, 2.0,
+			                              0.0, 0.0, scale, 3.0,
+			                              0.0, 0.0, 0.0, 1.0])
+
+			self.assertEqual(mu.try_inverse(matrix) is None, mu.LUFactorization(matrix).singular, scale)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from Geometry.classes import Matrix
+from Geometry.classes import SparseMatrix
+from Geometry.utils import Matrix_Utils as mu
+from Geometry.utils import Iterative_Utils as iu
+
+
+def _laplacian(n):
+	"""
+	1D Laplacian with a small diagonal shift: symmetric positive definite and tridiagonal.
+	"""
+
+	coo = SparseMatrix.COOMatrix(n, n)
+
+	for i in range(n):
+		coo.add(i, i, 2.1)
+
+		if i > 0:
+			coo.add(i, i - 1, -1.0)
+			coo.add(i - 1, i, -1.0)
+
+	return coo.to_csr()
+
+
+class IterativeSolversTest(unittest.TestCase):
+	def setUp(self):
+		self.n = 30
+		self.sparse = _laplacian(self.n)
+		self.dense = self.sparse.to_dense()
+		self.b = [float((i * 7) % 5 - 2) for i in range(self.n)]
+		self.expected = mu.lu_factorization(self.dense).solve(self.b)
+
+	def assert_solves(self, solution, name):
+		self.assertTrue(solution.converged, (name, str(solution)))
+
+		for a, e in zip(solution.x, self.expected):
+			self.assertAlmostEqual(a, e, places=5, msg=name)
+
+	def test_converge_on_spd_system(self):
+		for matrix in (self.dense, self.sparse):
+			self.assert_solves(iu.conjugate_gradient(matrix, self.b), 'conjugate_gradient')
+			self.assert_solves(iu.conjugate_gradient(matrix, self.b, preconditioner=None), 'conjugate_gradient')
+			self.assert_solves(iu.gauss_seidel(matrix, self.b, max_iterations=5000), 'gauss_seidel')
+			self.assert_solves(iu.sor(matrix, self.b, omega=1.7, max_iterations=5000), 'sor')
+
+	def test_matrix_right_hand_side(self):
+		solution = iu.conjugate_gradient(self.sparse, Matrix.Matrix(self.n, 1, self.b))
+
+		self.assertEqual((solution.x.rows, solution.x.cols), (self.n, 1))
+		self.assertTrue(mu.matrix_equality(solution.x, Matrix.Matrix(self.n, 1, self.expected), tolerance=1e-5))
+
+	def test_sor_beats_gauss_seidel(self):
+		sweeps = iu.gauss_seidel(self.sparse, self.b, max_iterations=5000).iterations
+
+		self.assertLess(iu.sor(self.sparse, self.b, omega=1.7, max_iterations=5000).iterations, sweeps)
+
+	def test_warm_start(self):
+		for solver in (iu.conjugate_gradient, iu.gauss_seidel):
+			self.assertLessEqual(solver(self.sparse, self.b, x0=self.expected).iterations, 1, solver.__name__)
+
+	def test_budget_and_callback(self):
+		solution = iu.gauss_seidel(self.sparse, self.b, max_iterations=3)
+
+		self.assertFalse(solution.converged)
+		self.assertEqual(solution.iterations, 3)
+
+		calls = []
+		iu.conjugate_gradient(self.sparse, self.b, callback=lambda iteration, x, residual: calls.append(iteration) or True)
+
+		self.assertEqual(len(calls), 1)
+
+	def test_zero_diagonal(self):
+		self.assertRaises(Exception, iu.gauss_seidel, Matrix.Matrix(2, 2, [0, 1, 1, 0]), [1, 1])
+
+
+if __name__ == '__main__':
+	unittest.main()
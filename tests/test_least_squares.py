@@ -0,0 +1,76 @@
+import math
+import random
+import unittest
+
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_Utils as mu
+
+
+ELEMENTS = [1, 0, 0, 1, 1, 1, 1, -1]
+B = [1, 2, 3, 0]
+
+
+class QRFactorizationTest(unittest.TestCase):
+	def test_rank_test_is_relative(self):
+		expected = mu.lstsq(Matrix.Matrix(4, 2, ELEMENTS), B)
+
+		for scale in (1e-7, 1e-3, 1e5):
+			matrix = Matrix.Matrix(4, 2, [e * scale for e in ELEMENTS])
+
+			self.assertFalse(mu.qr_factorization(matrix).rank_deficient, scale)
+
+			for x, e in zip(mu.lstsq(matrix, [e * scale for e in B]), expected):
+				self.assertAlmostEqual(x, e, places=9, msg=scale)
+
+	def test_rank_deficient(self):
+		for scale in (1e-7, 1.0, 1e5):
+			matrix = Matrix.Matrix(3, 2, [e * scale for e in (1, 2, 2, 4, 3, 6)])
+
+			self.assertTrue(mu.qr_factorization(matrix).rank_deficient, scale)
+			self.assertRaises(Exception, mu.lstsq, matrix, [1, 2, 3])
+
+
+
+class LeastSquaresTest(unittest.TestCase):
+	def test_consistent_system_is_solved_exactly(self):
+		rnd = random.Random(1)
+		matrix = Matrix.Matrix(6, 3, [rnd.uniform(-1.0, 1.0) for __ in range(18)])
+		x = [0.5, -2.0, 3.0]
+		b = list(mu.matrix_prod(matrix, Matrix.Matrix(3, 1, x)).elements())
+		solution, residuals = mu.lstsq(matrix, b, residuals=True)
+
+		for a, e in zip(solution, x):
+			self.assertAlmostEqual(a, e, places=9)
+
+		self.assertAlmostEqual(residuals[0], 0.0, places=9)
+
+	def test_matches_normal_equations(self):
+		rnd = random.Random(2)
+		matrix = Matrix.Matrix(8, 3, [rnd.uniform(-1.0, 1.0) for __ in range(24)])
+		b = Matrix.Matrix(8, 2, [rnd.uniform(-1.0, 1.0) for __ in range(16)])
+		x, residuals = mu.lstsq(matrix, b, residuals=True)
+		transposed = mu.matrix_transpose(matrix)
+		expected = mu.lu_factorization(mu.matrix_prod(transposed, matrix)).solve_many(mu.matrix_prod(transposed, b))
+
+		self.assertTrue(mu.matrix_equality(x, expected, tolerance=1e-9))
+
+		for ci in range(2):
+			difference = mu.matrix_sub(mu.matrix_prod(matrix, Matrix.Matrix(3, 1, list(x.col_view(ci)))),
+			                           Matrix.Matrix(8, 1, list(b.col_view(ci))))
+
+			self.assertAlmostEqual(residuals[ci], math.sqrt(sum(e * e for e in difference.elements())), places=9)
+
+	def test_factors(self):
+		rnd = random.Random(3)
+		matrix = Matrix.Matrix(5, 3, [rnd.uniform(-1.0, 1.0) for __ in range(15)])
+		qr = mu.qr_factorization(matrix)
+		q = qr.q()
+
+		self.assertTrue(mu.matrix_equality(mu.matrix_prod(q, qr.r()), matrix, tolerance=1e-9))
+		self.assertTrue(mu.matrix_equality(mu.matrix_prod(mu.matrix_transpose(q), q), mu.matrix_identity(3), tolerance=1e-9))
+
+	def test_wide_matrix(self):
+		self.assertRaises(Exception, mu.qr_factorization, Matrix.Matrix(2, 3, [1, 2, 3, 4, 5, 6]))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,149 @@
+import math
+import random
+import unittest
+
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_Utils as mu
+
+
+ELEMENTS = [4, -2, 1, 3, 6, -4, 2, 1, 8, 1, -3, 2, 5, 2, 1, 7]
+
+
+def _random_system(order, seed):
+	rnd = random.Random(seed)
+	elements = [rnd.randint(-9, 9) for __ in range(order * order)]
+
+	for d in range(order):
+		''' Diagonally dominant, so it is never singular '''
+		elements[d * order + d] += 10 * order
+
+	return elements
+
+
+class SolveTest(unittest.TestCase):
+	def test_solve_residuals(self):
+		for order in (1, 2, 3, 4, 5, 8):
+			elements = _random_system(order, order)
+			b = [float(i - order) for i in range(order)]
+
+			for numeric in ('float', 'decimal', 'fraction'):
+				matrix = Matrix.Matrix(order, order, elements, numeric=numeric)
+				lu = mu.lu_factorization(matrix)
+				x = lu.solve(Matrix.Matrix(order, 1, b, numeric=numeric))
+
+				self.assertTrue(mu.matrix_equality(mu.matrix_prod(matrix, x), Matrix.Matrix(order, 1, b, numeric=numeric),
+				                                   tolerance=1e-4), (order, numeric))
+				self.assertTrue(mu.matrix_equality(Matrix.Matrix(order, 1, lu.solve(b), numeric=numeric), x, tolerance=1e-4),
+				                (order, numeric))
+
+	def test_fraction_solution_is_exact(self):
+		matrix = Matrix.Matrix(3, 3, _random_system(3, 7), numeric='fraction')
+		b = Matrix.Matrix(3, 1, [1, 2, 3], numeric='fraction')
+
+		self.assertEqual(list(mu.matrix_prod(matrix, mu.lu_factorization(matrix).solve(b)).elements()), [1, 2, 3])
+
+	def test_solve_many(self):
+		for order in (3, 4, 6):
+			matrix = Matrix.Matrix(order, order, _random_system(order, 10 + order))
+			lu = mu.lu_factorization(matrix)
+			b = Matrix.Matrix(order, 5, [float(i % 7 - 3) for i in range(order * 5)])
+			x = lu.solve_many(b)
+
+			self.assertEqual((x.rows, x.cols), (order, 5))
+			self.assertTrue(mu.matrix_equality(mu.matrix_prod(matrix, x), b), order)
+
+			for ci in range(5):
+				column = Matrix.Matrix(order, 1, list(b.col_view(ci)))
+
+				self.assertTrue(mu.matrix_equality(lu.solve(column), Matrix.Matrix(order, 1, list(x.col_view(ci)))))
+
+	def test_factors(self):
+		matrix = Matrix.Matrix(4, 4, [0, 2, 1, 3, 1, 1, 0, 2, 4, 0, 2, 1, 2, 3, 1, 0])
+		lu = mu.lu_factorization(matrix)
+		permuted = Matrix.Matrix(4, 4, [e for p in lu.permutation for e in matrix.row_view(p)])
+
+		self.assertTrue(mu.matrix_equality(mu.matrix_prod(lu.lower(), lu.upper()), permuted))
+
+	def test_singular(self):
+		lu = mu.lu_factorization(Matrix.Matrix(3, 3, [1, 2, 3, 2, 4, 6, 1, 0, 1]))
+
+		self.assertTrue(lu.singular)
+		self.assertRaises(Exception, lu.solve, [1, 2, 3])
+		self.assertRaises(Exception, mu.lu_factorization(mu.matrix_identity(3)).solve, [1, 2])
+
+
+class DeterminantTest(unittest.TestCase):
+	def test_known_determinants(self):
+		''' det(ELEMENTS) = -297, computed exactly by the Leibniz formula '''
+		for numeric in ('float', 'decimal', 'fraction'):
+			lu = mu.lu_factorization(Matrix.Matrix(4, 4, ELEMENTS, numeric=numeric))
+
+			self.assertAlmostEqual(float(lu.determinant()), -297.0, places=6, msg=numeric)
+			self.assertEqual(lu.determinant_sign(), -1)
+			self.assertAlmostEqual(lu.log_abs_determinant(), math.log(297.0), places=9, msg=numeric)
+
+		self.assertEqual(mu.lu_factorization(Matrix.Matrix(4, 4, ELEMENTS, numeric='fraction')).determinant(), -297)
+
+	def test_row_swap_flips_sign(self):
+		swapped = ELEMENTS[4:8] + ELEMENTS[:4] + ELEMENTS[8:]
+		lu = mu.lu_factorization(Matrix.Matrix(4, 4, swapped))
+
+		self.assertAlmostEqual(lu.determinant(), 297.0, places=9)
+		self.assertEqual(lu.determinant_sign(), 1)
+		self.assertAlmostEqual(lu.log_abs_determinant(), math.log(297.0), places=9)
+
+	def test_matches_matrix_determinant(self):
+		for order in (2, 3, 4, 5, 7):
+			matrix = Matrix.Matrix(order, order, _random_system(order, 20 + order))
+			determinant = mu.lu_factorization(matrix).determinant()
+
+			self.assertAlmostEqual(determinant / mu.matrix_determinant(matrix), 1.0, places=9, msg=order)
+
+	def test_singular(self):
+		lu = mu.lu_factorization(Matrix.Matrix(3, 3, [1, 2, 3, 2, 4, 6, 1, 0, 1]))
+
+		self.assertEqual(lu.determinant(), 0)
+		self.assertEqual(lu.determinant_sign(), 0)
+		self.assertEqual(lu.log_abs_determinant(), float('-inf'))
+
+	def test_log_determinant_beyond_float_range(self):
+		''' 200 x 1e3 and 200 x 1e-3 on the diagonal: the determinants are 1e600 and -1e-600 '''
+		for scale, sign in ((1e3, 1), (1e-3, -1)):
+			elements = [0.0] * (200 * 200)
+
+			for d in range(200):
+				elements[d * 200 + d] = scale
+
+			elements[0] = sign * scale
+			lu = mu.lu_factorization(Matrix.Matrix(200, 200, elements), tolerance=0.0)
+
+			self.assertEqual(lu.determinant_sign(), sign)
+			self.assertAlmostEqual(lu.log_abs_determinant(), 200 * math.log(scale), places=6)
+			self.assertAlmostEqual(mu.matrix_log_abs_determinant(Matrix.Matrix(200, 200, elements)), 200 * math.log(scale),
+			                       places=6)
+
+
+class ConditionEstimateTest(unittest.TestCase):
+	"""
+	The condition estimate and the log-determinant are floats whatever the numeric backend of the matrix factored.
+	"""
+
+	def test_exact_backends_match_float(self):
+		expected = mu.matrix_condition_estimate(Matrix.Matrix(4, 4, ELEMENTS))
+		log_determinant = mu.matrix_log_abs_determinant(Matrix.Matrix(4, 4, ELEMENTS))
+
+		for numeric in ('decimal', 'fraction'):
+			matrix = Matrix.Matrix(4, 4, ELEMENTS, numeric=numeric)
+
+			self.assertAlmostEqual(mu.matrix_condition_estimate(matrix), expected, places=9, msg=numeric)
+			self.assertAlmostEqual(mu.matrix_log_abs_determinant(matrix), log_determinant, places=9, msg=numeric)
+
+	def test_singular_exact_matrix(self):
+		for numeric in ('decimal', 'fraction'):
+			matrix = Matrix.Matrix(3, 3, [1, 2, 3, 2, 4, 6, 1, 0, 1], numeric=numeric)
+
+			self.assertTrue(math.isinf(mu.matrix_condition_estimate(matrix)), numeric)
+
+
+if __name__ == '__main__':
+	unittest.main()
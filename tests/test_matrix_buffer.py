@@ -0,0 +1,131 @@
+import mmap
+import unittest
+from array import array
+
+from Geometry.classes import Matrix
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+
+class FromBufferTest(unittest.TestCase):
+	"""
+	Matrix.from_buffer wraps float64 buffers without copying them: a write on either side is seen by the other.
+	"""
+
+	def test_array(self):
+		buffer = array('d', [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+		matrix = Matrix.Matrix.from_buffer(buffer, 2, 3)
+
+		buffer[4] = 50.0
+		self.assertEqual(matrix.get(1, 1), 50.0)
+
+		matrix.set(0, 2, 30.0)
+		self.assertEqual(buffer[2], 30.0)
+
+	def test_bytearray(self):
+		buffer = bytearray(array('d', [1.0, 2.0, 3.0, 4.0]).tobytes())
+		matrix = Matrix.Matrix.from_buffer(buffer, 2, 2)
+
+		matrix.set(1, 0, 7.5)
+		self.assertEqual(array('d', bytes(buffer))[2], 7.5)
+
+		buffer[0:8] = array('d', [-2.0]).tobytes()
+		self.assertEqual(matrix.get(0, 0), -2.0)
+
+	def test_mmap(self):
+		mapping = mmap.mmap(-1, 4 * 8)
+		matrix = Matrix.Matrix.from_buffer(mapping, 2, 2)
+
+		matrix.set(0, 1, 3.25)
+		self.assertEqual(array('d', mapping[8:16])[0], 3.25)
+
+		mapping[24:32] = array('d', [9.0]).tobytes()
+		self.assertEqual(matrix.get(1, 1), 9.0)
+
+		matrix.close()
+		mapping.close()
+
+	def test_other_types_are_copied(self):
+		buffer = array('i', [1, 2, 3, 4])
+		matrix = Matrix.Matrix.from_buffer(buffer, 2, 2)
+
+		buffer[0] = 10
+		self.assertEqual(matrix.get(0, 0), 1.0)
+
+	def test_size_mismatch(self):
+		with self.assertRaises(Exception):
+			Matrix.Matrix.from_buffer(array('d', [1.0, 2.0, 3.0]), 2, 2)
+
+
+class BufferTest(unittest.TestCase):
+	"""
+	Matrix.buffer() and __array_interface__ expose the matrix\'s own storage.
+	"""
+
+	def test_buffer_writes_matrix(self):
+		matrix = Matrix.Matrix(2, 2, [1.0, 2.0, 3.0, 4.0])
+		view = matrix.buffer()
+
+		self.assertEqual(view.shape, (2, 2))
+
+		view[1, 0] = 8.0
+		self.assertEqual(matrix.get(1, 0), 8.0)
+
+		matrix.set(0, 1, -1.0)
+		self.assertEqual(view[0, 1], -1.0)
+
+	def test_round_trip(self):
+		matrix = Matrix.Matrix(2, 3, [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+		other = Matrix.Matrix.from_buffer(matrix.buffer(), 2, 3)
+
+		other.set(1, 2, 60.0)
+		self.assertEqual(matrix.get(1, 2), 60.0)
+
+	def test_array_interface(self):
+		matrix = Matrix.Matrix(2, 2, [1.0, 2.0, 3.0, 4.0])
+		interface = matrix.__array_interface__
+
+		self.assertEqual(interface['shape'], (2, 2))
+		self.assertIs(interface['data'], matrix.elements())
+
+	def test_exact_matrices_have_no_buffer(self):
+		matrix = Matrix.Matrix(2, 2, [1, 2, 3, 4], numeric='fraction')
+
+		with self.assertRaises(Exception):
+			matrix.buffer()
+
+		with self.assertRaises(AttributeError):
+			matrix.__array_interface__
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class NumpyTest(unittest.TestCase):
+
+	def test_numpy_shares_matrix_memory(self):
+		matrix = Matrix.Matrix(2, 2, [1.0, 2.0, 3.0, 4.0])
+		values = numpy.asarray(matrix)
+
+		self.assertEqual(values.shape, (2, 2))
+
+		values[0, 0] = 11.0
+		self.assertEqual(matrix.get(0, 0), 11.0)
+
+		matrix.set(1, 1, 44.0)
+		self.assertEqual(values[1, 1], 44.0)
+
+	def test_matrix_shares_numpy_memory(self):
+		values = numpy.arange(6, dtype=numpy.float64).reshape(2, 3)
+		matrix = Matrix.Matrix.from_buffer(values, 2, 3)
+
+		values[1, 2] = 12.0
+		self.assertEqual(matrix.get(1, 2), 12.0)
+
+		matrix.set(0, 0, -3.0)
+		self.assertEqual(values[0, 0], -3.0)
+
+
+if __name__ == "__main__":
+	unittest.main()
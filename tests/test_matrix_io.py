@@ -0,0 +1,95 @@
+import io
+import struct
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_IO as mio
+from Geometry.utils import Matrix_Utils as mu
+
+
+class RoundTripTest(unittest.TestCase):
+	"""
+	Matrices come back from dump/load with the same numeric backend and exactly the same elements.
+	"""
+
+	def assertRoundTrip(self, matrix):
+		loaded = mio.loads(mio.dumps(matrix))
+
+		self.assertEqual((loaded.rows, loaded.cols), (matrix.rows, matrix.cols))
+		self.assertEqual(loaded.numeric.name, matrix.numeric.name)
+		self.assertEqual(list(loaded.elements()), list(matrix.elements()))
+		self.assertTrue(mu.matrix_equality(loaded, matrix))
+
+		return loaded
+
+	def test_float(self):
+		self.assertRoundTrip(Matrix.Matrix(2, 3, [0.1, -2.5, 1e-300, 3.0, 1e300, -0.0]))
+
+	def test_decimal(self):
+		self.assertRoundTrip(Matrix.Matrix(2, 2, [Decimal('0.1'), Decimal('-123456.789'), Decimal('0.000001'), 3], exact=True))
+
+	def test_fraction(self):
+		loaded = self.assertRoundTrip(Matrix.Matrix(2, 2, [Fraction(1, 3), Fraction(-2, 7), 5, Fraction(10 ** 12, 3)],
+		                                            numeric='fraction'))
+
+		self.assertEqual(loaded.get(0, 0), Fraction(1, 3))
+
+	def test_fraction_inverse(self):
+		matrix = Matrix.Matrix(3, 3, [2, 1, 1, 1, 3, 2, 1, 0, 0], numeric='fraction')
+
+		self.assertRoundTrip(mu.matrix_inverse(matrix))
+
+	def test_out_of_range_fraction_raises(self):
+		matrix = Matrix.Matrix(1, 1, [Fraction(1, 3 ** 50)], numeric='fraction')
+
+		with self.assertRaises(Exception):
+			mio.dumps(matrix)
+
+	def test_row_blocks(self):
+		for numeric in ('float', 'decimal', 'fraction'):
+			matrix = Matrix.Matrix(5, 2, [Fraction(i, 4) for i in range(10)], numeric=numeric)
+			data = io.BytesIO(mio.dumps(matrix))
+			elements = []
+
+			for start, block in mio.iter_row_blocks(data, block_rows=2):
+				self.assertEqual(block.numeric.name, numeric)
+				self.assertEqual(start, len(elements) // 2)
+				elements.extend(block.elements())
+
+			self.assertEqual(elements, list(matrix.elements()))
+
+	def test_decimal_backend_decimals(self):
+		for decimals in (0, 2, 9):
+			matrix = Matrix.Matrix(2, 2, [1.23456789, -4.5, 1000, 0], numeric=Matrix.DecimalNumeric(decimals))
+			loaded = self.assertRoundTrip(matrix)
+
+			self.assertEqual(loaded.numeric.decimals, decimals)
+			self.assertEqual(str(loaded.get(0, 0)), str(matrix.get(0, 0)))
+
+			''' Elements set after loading keep being rounded to the same decimals '''
+			loaded.set(1, 1, 0.123456789123)
+			matrix.set(1, 1, 0.123456789123)
+
+			self.assertEqual(loaded.get(1, 1), matrix.get(1, 1))
+
+		for start, block in mio.iter_row_blocks(io.BytesIO(mio.dumps(matrix)), block_rows=1):
+			self.assertEqual(block.numeric.decimals, 9)
+
+	def test_default_decimal_backend(self):
+		loaded = mio.loads(mio.dumps(Matrix.Matrix(1, 2, [1.5, 2], numeric='decimal')))
+
+		self.assertIs(loaded.numeric, Matrix.DECIMAL)
+		self.assertEqual(mio.read_header(io.BytesIO(mio.dumps(loaded))), (1, 2, 'decimal'))
+
+	def test_version_1_exact_matrices_still_load(self):
+		data = mio.HEADER.pack(mio.MAGIC, 1, mio.DTYPE_FLOAT64, mio.FLAG_FRACTION, 0, 1, 2) + struct.pack('<2d', 0.5, 0.25)
+		matrix = mio.loads(data)
+
+		self.assertEqual(matrix.numeric.name, 'fraction')
+		self.assertEqual(list(matrix.elements()), [Fraction(1, 2), Fraction(1, 4)])
+
+
+if __name__ == "__main__":
+	unittest.main()
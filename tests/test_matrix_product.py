@@ -0,0 +1,60 @@
+import random
+import unittest
+from fractions import Fraction
+
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_Utils as mu
+
+
+def _random_matrix(rows, cols, seed, numeric='float'):
+	rnd = random.Random(seed)
+
+	if numeric == 'fraction':
+		return Matrix.Matrix(rows, cols, [Fraction(rnd.randint(-9, 9), rnd.randint(1, 4)) for __ in range(rows * cols)],
+		                     numeric=numeric)
+
+	return Matrix.Matrix(rows, cols, [rnd.uniform(-1.0, 1.0) for __ in range(rows * cols)], numeric=numeric)
+
+
+''' (rows of A, cols of A, cols of B): even, odd and mixed dimensions, so the Strassen recursion pads '''
+SHAPES = [(8, 8, 8), (9, 9, 9), (5, 7, 3), (13, 6, 11), (16, 16, 16), (1, 5, 1)]
+
+
+class StrassenTest(unittest.TestCase):
+	"""
+	A small strassen_threshold forces the recursion on small matrices; its products equal the naive ones.
+	"""
+
+	def test_forced_threshold_matches_naive(self):
+		for seed, (rows, inner, cols) in enumerate(SHAPES):
+			matrix_a = _random_matrix(rows, inner, seed)
+			matrix_b = _random_matrix(inner, cols, seed + 100)
+			expected = mu._naive_matrix_prod(matrix_a, matrix_b)
+
+			for threshold in (1, 2, 3, 4):
+				product = mu.matrix_prod(matrix_a, matrix_b, strassen_threshold=threshold)
+
+				self.assertEqual((product.rows, product.cols), (rows, cols))
+				self.assertTrue(mu.matrix_equality(product, expected, tolerance=1e-9), (rows, inner, cols, threshold))
+
+			self.assertTrue(mu.matrix_equality(mu.matrix_prod(matrix_a, matrix_b, strassen_threshold=0), expected,
+			                                   tolerance=1e-12))
+
+	def test_exact_strassen(self):
+		matrix_a = _random_matrix(7, 6, 1, 'fraction')
+		matrix_b = _random_matrix(6, 5, 2, 'fraction')
+		product = mu.matrix_prod(matrix_a, matrix_b, strassen_threshold=2)
+
+		self.assertEqual(list(product.elements()), list(mu._naive_matrix_prod(matrix_a, matrix_b).elements()))
+
+	def test_out(self):
+		matrix_a = _random_matrix(6, 6, 3)
+		matrix_b = _random_matrix(6, 6, 4)
+		expected = mu._naive_matrix_prod(matrix_a, matrix_b)
+		mu.matrix_prod(matrix_a, matrix_b, out=matrix_a, strassen_threshold=2)
+
+		self.assertTrue(mu.matrix_equality(matrix_a, expected, tolerance=1e-9))
+
+
+if __name__ == '__main__':
+	unittest.main()
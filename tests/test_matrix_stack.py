@@ -0,0 +1,64 @@
+import random
+import unittest
+
+from Geometry.classes import Matrix
+from Geometry.classes import MatrixStack
+from Geometry.utils import Matrix_Utils as mu
+from Geometry.utils import Stack_Utils as stu
+
+
+def _random_matrices(count, order, seed):
+	rnd = random.Random(seed)
+
+	return [Matrix.Matrix(order, order, [rnd.uniform(-1.0, 1.0) for __ in range(order * order)]) for __ in range(count)]
+
+
+class StackTest(unittest.TestCase):
+	"""
+	Every stack operation matches the Matrix_Utils one applied matrix by matrix, for orders taking both the unrolled
+	3x3/4x4 kernels and the general loops.
+	"""
+
+	def test_prod(self):
+		for order in (2, 3, 4, 5):
+			matrices_a = _random_matrices(10, order, 1)
+			matrices_b = _random_matrices(10, order, 2)
+			stack_a = MatrixStack.MatrixStack.from_matrices(matrices_a)
+			stack_b = MatrixStack.MatrixStack.from_matrices(matrices_b)
+
+			product = stu.stack_prod(stack_a, stack_b)
+			left = stu.stack_prod(matrices_a[0], stack_b)
+			right = stu.stack_prod(stack_a, matrices_b[0])
+
+			for i in range(10):
+				self.assertTrue(mu.matrix_equality(product[i], mu.matrix_prod(matrices_a[i], matrices_b[i])))
+				self.assertTrue(mu.matrix_equality(left[i], mu.matrix_prod(matrices_a[0], matrices_b[i])))
+				self.assertTrue(mu.matrix_equality(right[i], mu.matrix_prod(matrices_a[i], matrices_b[0])))
+
+	def test_transpose_and_inverse(self):
+		for order in (2, 3, 4, 5):
+			matrices = _random_matrices(10, order, 3)
+			stack = MatrixStack.MatrixStack.from_matrices(matrices)
+
+			transposed = stu.stack_transpose(stack)
+			inverse = stu.stack_inverse(stack)
+
+			for i in range(10):
+				self.assertTrue(mu.matrix_equality(transposed[i], mu.matrix_transpose(matrices[i])))
+				self.assertTrue(mu.matrix_equality(inverse[i], mu.matrix_inverse(matrices[i])))
+
+	def test_inverse_singularity_matches_has_inverse(self):
+		for order in (2, 3, 4, 5):
+			for scale in (1e-5, 1e-4, 1.0):
+				matrix = mu.matrix_scalar_prod(mu.matrix_identity(order), scale)
+				stack = MatrixStack.MatrixStack.from_matrices([mu.matrix_identity(order), matrix])
+
+				if mu.has_inverse(matrix):
+					self.assertTrue(mu.matrix_equality(stu.stack_inverse(stack)[1], mu.matrix_inverse(matrix)))
+				else:
+					with self.assertRaises(Exception):
+						stu.stack_inverse(stack)
+
+
+if __name__ == "__main__":
+	unittest.main()
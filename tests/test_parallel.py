@@ -0,0 +1,74 @@
+import random
+import unittest
+
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_Utils as mu
+from Geometry.utils import Parallel_Utils as pu
+
+
+def _random_matrix(rows, cols, seed, numeric='float'):
+	rnd = random.Random(seed)
+
+	return Matrix.Matrix(rows, cols, [rnd.randint(-9, 9) / 4.0 for __ in range(rows * cols)], numeric=numeric)
+
+
+class ParallelExecutorTest(unittest.TestCase):
+	"""
+	Products and batched solves computed by the worker processes equal the serial ones.
+	"""
+
+	@classmethod
+	def setUpClass(cls):
+		cls.executor = pu.ParallelExecutor(workers=2, min_block=2)
+
+	@classmethod
+	def tearDownClass(cls):
+		cls.executor.shutdown()
+
+	def test_blocks(self):
+		self.assertEqual(self.executor.blocks(7), [(0, 4), (4, 7)])
+		self.assertEqual(self.executor.blocks(3), [(0, 2), (2, 3)])
+		self.assertEqual(self.executor.blocks(1), [(0, 1)])
+
+	def test_product_matches_serial(self):
+		for rows, inner, cols in ((9, 7, 5), (2, 3, 4), (1, 3, 3), (16, 16, 16)):
+			matrix_a = _random_matrix(rows, inner, rows)
+			matrix_b = _random_matrix(inner, cols, cols)
+			expected = mu.matrix_prod(matrix_a, matrix_b)
+
+			''' Quarter multiples: the blocks and the serial kernel add the same exact values '''
+			self.assertEqual(list(mu.matrix_prod(matrix_a, matrix_b, executor=self.executor).elements()),
+			                 list(expected.elements()), (rows, inner, cols))
+			self.assertEqual(list(self.executor.matrix_prod(matrix_a, matrix_b).elements()), list(expected.elements()))
+
+	def test_product_into_out(self):
+		matrix_a = _random_matrix(8, 8, 1)
+		matrix_b = _random_matrix(8, 8, 2)
+		expected = mu.matrix_prod(matrix_a, matrix_b)
+		mu.matrix_prod(matrix_a, matrix_b, out=matrix_a, executor=self.executor)
+
+		self.assertEqual(list(matrix_a.elements()), list(expected.elements()))
+
+	def test_solve_many_matches_serial(self):
+		matrix = _random_matrix(6, 6, 3)
+
+		for d in range(6):
+			matrix.set(d, d, matrix.get(d, d) + 20.0)
+
+		lu = mu.lu_factorization(matrix)
+		b = _random_matrix(6, 9, 4)
+
+		self.assertTrue(mu.matrix_equality(lu.solve_many(b, executor=self.executor), lu.solve_many(b), tolerance=1e-12))
+		self.assertTrue(mu.matrix_equality(self.executor.solve_many(lu, b), lu.solve_many(b), tolerance=1e-12))
+
+	def test_exact_matrices_stay_serial(self):
+		matrix_a = _random_matrix(6, 6, 5, numeric='fraction')
+		matrix_b = _random_matrix(6, 6, 6, numeric='fraction')
+		product = mu.matrix_prod(matrix_a, matrix_b, executor=self.executor)
+
+		self.assertEqual(product.numeric.name, 'fraction')
+		self.assertEqual(list(product.elements()), list(mu.matrix_prod(matrix_a, matrix_b).elements()))
+
+
+if __name__ == '__main__':
+	unittest.main()
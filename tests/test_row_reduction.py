@@ -0,0 +1,79 @@
+import random
+import unittest
+
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_Utils as mu
+
+
+def _low_rank(rows, cols, rank, seed):
+	rnd = random.Random(seed)
+	left = [[rnd.randint(-3, 3) for __ in range(rank)] for __ in range(rows)]
+	right = [[rnd.randint(-3, 3) for __ in range(cols)] for __ in range(rank)]
+
+	return [sum(left[ri][i] * right[i][ci] for i in range(rank)) for ri in range(rows) for ci in range(cols)]
+
+
+''' (rows, cols, rank of the product, seed) '''
+SHAPES = [(4, 4, 4, 1), (4, 4, 2, 2), (3, 5, 2, 3), (5, 3, 1, 4), (6, 6, 3, 5), (2, 2, 0, 6)]
+
+
+class RowReductionTest(unittest.TestCase):
+	def test_rank_nullity(self):
+		for rows, cols, rank, seed in SHAPES:
+			for numeric in ('float', 'decimal', 'fraction'):
+				reduction = mu.RowReduction(Matrix.Matrix(rows, cols, _low_rank(rows, cols, rank, seed), numeric=numeric))
+
+				self.assertLessEqual(reduction.rank, rank, (rows, cols, seed, numeric))
+				self.assertEqual(reduction.rank + reduction.nullity, cols)
+				self.assertEqual(reduction.rank, mu.matrix_rank(Matrix.Matrix(rows, cols, _low_rank(rows, cols, rank, seed))))
+
+	def test_null_space_basis(self):
+		for rows, cols, rank, seed in SHAPES:
+			for numeric in ('float', 'fraction'):
+				matrix = Matrix.Matrix(rows, cols, _low_rank(rows, cols, rank, seed), numeric=numeric)
+				basis = mu.null_space_basis(matrix)
+
+				self.assertEqual(len(basis), mu.RowReduction(matrix).nullity)
+
+				for vector in basis:
+					self.assertTrue(mu.matrix_equality(mu.matrix_prod(matrix, vector), Matrix.Matrix(rows, 1, numeric=numeric),
+					                                   tolerance=1e-9), (rows, cols, seed, numeric))
+
+				if basis:
+					''' The basis vectors are independent '''
+					vectors = Matrix.Matrix(cols, len(basis), [vector.get(ri, 0) for ri in range(cols) for vector in basis])
+
+					self.assertEqual(mu.matrix_rank(vectors), len(basis))
+
+	def test_column_and_row_space_bases(self):
+		for rows, cols, rank, seed in SHAPES:
+			matrix = Matrix.Matrix(rows, cols, _low_rank(rows, cols, rank, seed), numeric='fraction')
+			reduction = mu.row_reduction(matrix)
+			column_basis = reduction.column_space_basis()
+			row_basis = reduction.row_space_basis()
+
+			self.assertEqual(len(column_basis), reduction.rank)
+			self.assertEqual(len(row_basis), reduction.rank)
+
+			for ci, column in zip(reduction.pivots, column_basis):
+				self.assertEqual(list(column.elements()), list(matrix.col_view(ci)))
+
+			''' Every row of the matrix is a combination of the row basis: appending it doesn't raise the rank '''
+			basis_elements = [e for row in row_basis for e in row.elements()]
+
+			for ri in range(rows):
+				stacked = Matrix.Matrix(len(row_basis) + 1, cols, basis_elements + list(matrix.row_view(ri)), numeric='fraction')
+
+				self.assertEqual(mu.matrix_rank(stacked), reduction.rank, (rows, cols, seed, ri))
+
+	def test_shared_reduction(self):
+		matrix = Matrix.Matrix(3, 3, [1, 2, 3, 2, 4, 6, 1, 1, 1])
+		reduction = mu.row_reduction(matrix)
+
+		self.assertIs(mu.row_reduction(reduction), reduction)
+		self.assertEqual(len(mu.null_space_basis(reduction)), 1)
+		self.assertTrue(mu.matrix_equality(reduction.rref(), mu.row_reduced_echelon(matrix)))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,45 @@
+import math
+import random
+import unittest
+
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_Utils as mu
+from Geometry.utils import Vector_Utils as vu
+from Geometry.utils import Barycentric_Utils as bu
+
+
+class SimplexVolumesTest(unittest.TestCase):
+	def test_unit_simplices(self):
+		for n in range(2, 7):
+			simplex = [[0.0] * n] + [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+			mirrored = [simplex[0], simplex[2], simplex[1]] + simplex[3:]
+
+			self.assertAlmostEqual(vu.simplex_signed_volumes([simplex])[0], 1.0 / math.factorial(n), msg=n)
+			self.assertAlmostEqual(vu.simplex_signed_volumes([mirrored])[0], -1.0 / math.factorial(n), msg=n)
+
+	def test_matches_matrix_determinant(self):
+		rnd = random.Random(25)
+
+		for n in range(2, 7):
+			simplices = [[[rnd.uniform(-1.0, 1.0) for __ in range(n)] for __ in range(n + 1)] for __ in range(20)]
+
+			for simplex, volume in zip(simplices, vu.simplex_signed_volumes(simplices)):
+				edges = Matrix.Matrix(n, n, [c - o for point in simplex[1:] for c, o in zip(point, simplex[0])])
+
+				self.assertAlmostEqual(volume, mu.matrix_determinant(edges) / math.factorial(n), places=9, msg=n)
+
+	def test_degenerate_simplex(self):
+		self.assertEqual(vu.simplex_signed_volumes([[[0.0] * 5, [1.0] * 5, [2.0] * 5, [3.0] * 5, [4.0] * 5, [5.0] * 5]]), [0.0])
+
+	def test_tetrahedron_barycentric_coord(self):
+		tetrahedron = [[0.0, 0.0, 0.0], [2.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 0.0, 2.0]]
+		coords = bu.tetrahedron_barycentric_coord([0.5, 0.5, 0.5], tetrahedron)
+
+		for coord, expected in zip(coords, (0.25, 0.25, 0.25, 0.25)):
+			self.assertAlmostEqual(coord, expected)
+
+		self.assertRaises(Exception, bu.tetrahedron_barycentric_coord, [0.5, 0.5, 0.5], [[0.0] * 3] * 4)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+
+from Geometry.classes import Matrix
+from Geometry.classes import SparseMatrix
+from Geometry.utils import Matrix_Utils as mu
+from Geometry.utils import Sparse_Utils as su
+
+
+def _random_dense(rows, cols, seed, density=0.3):
+	rnd = random.Random(seed)
+
+	return Matrix.Matrix(rows, cols, [rnd.uniform(-2.0, 2.0) if rnd.random() < density else 0.0 for __ in range(rows * cols)])
+
+
+class SparseMatrixTest(unittest.TestCase):
+	"""
+	Every operation on sparse matrices gives the same elements as on their dense counterparts.
+	"""
+
+	def assert_same(self, result, expected):
+		self.assertEqual((result.rows, result.cols), (expected.rows, expected.cols))
+		self.assertTrue(mu.matrix_equality(Matrix.Matrix(result.rows, result.cols, list(result.elements())), expected,
+		                                   tolerance=1e-12))
+
+	def test_conversions(self):
+		dense = _random_dense(5, 7, 1)
+		sparse = SparseMatrix.SparseMatrix.from_dense(dense)
+
+		self.assertEqual(sparse.nnz(), sum(1 for e in dense.elements() if e != 0.0))
+		self.assert_same(sparse, dense)
+		self.assert_same(sparse.to_dense(), dense)
+
+		for ri in range(5):
+			for ci in range(7):
+				self.assertEqual(sparse.get(ri, ci), dense.get(ri, ci))
+
+	def test_from_coo_sums_duplicates(self):
+		sparse = SparseMatrix.SparseMatrix.from_coo(2, 3, [0, 1, 0, 1], [2, 0, 2, 1], [1.0, 4.0, 2.0, 0.0])
+
+		self.assertEqual(list(sparse.elements()), [0.0, 0.0, 3.0, 4.0, 0.0, 0.0])
+		self.assertEqual(sparse.nnz(), 2)
+		self.assertRaises(IndexError, SparseMatrix.SparseMatrix.from_coo, 2, 2, [2], [0], [1.0])
+
+	def test_operations_match_dense(self):
+		a = _random_dense(6, 5, 2)
+		b = _random_dense(6, 5, 3)
+		c = _random_dense(5, 4, 4)
+		sparse_a = SparseMatrix.SparseMatrix.from_dense(a)
+		sparse_b = SparseMatrix.SparseMatrix.from_dense(b)
+		sparse_c = SparseMatrix.SparseMatrix.from_dense(c)
+
+		self.assert_same(mu.matrix_scalar_prod(sparse_a, -1.5), mu.matrix_scalar_prod(a, -1.5))
+		self.assert_same(mu.matrix_scalar_prod(sparse_a, 0), mu.matrix_scalar_prod(a, 0))
+		self.assert_same(mu.matrix_transpose(sparse_a), mu.matrix_transpose(a))
+
+		for left, right in ((sparse_a, sparse_b), (sparse_a, b), (a, sparse_b)):
+			self.assert_same(mu.matrix_add(left, right), mu.matrix_add(a, b))
+			self.assert_same(mu.matrix_sub(left, right), mu.matrix_sub(a, b))
+
+		for left, right in ((sparse_a, sparse_c), (sparse_a, c), (a, sparse_c)):
+			self.assert_same(mu.matrix_prod(left, right), mu.matrix_prod(a, c))
+
+	def test_sparse_results_stay_sparse(self):
+		sparse_a = SparseMatrix.SparseMatrix.from_dense(_random_dense(4, 4, 5))
+		sparse_b = SparseMatrix.SparseMatrix.from_dense(_random_dense(4, 4, 6))
+
+		self.assertTrue(su.is_sparse(mu.matrix_prod(sparse_a, sparse_b)))
+		self.assertTrue(su.is_sparse(mu.matrix_add(sparse_a, sparse_b)))
+		self.assertTrue(su.is_sparse(mu.matrix_transpose(sparse_a)))
+
+	def test_cancellation_drops_entries(self):
+		sparse = SparseMatrix.SparseMatrix.from_dense(_random_dense(4, 4, 7))
+
+		self.assertEqual(mu.matrix_sub(sparse, sparse).nnz(), 0)
+
+	def test_dimension_mismatch(self):
+		sparse = SparseMatrix.SparseMatrix.from_dense(_random_dense(3, 4, 8))
+
+		self.assertRaises(Exception, mu.matrix_prod, sparse, sparse)
+		self.assertRaises(Exception, mu.matrix_add, sparse, SparseMatrix.SparseMatrix(4, 3))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,69 @@
+import random
+import unittest
+
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_Utils as mu
+
+
+def _random_matrix(order, seed):
+	rnd = random.Random(seed)
+	elements = [rnd.uniform(-1.0, 1.0) for __ in range(order * order)]
+
+	for d in range(order):
+		''' Diagonally dominant, so it stays well away from singular '''
+		elements[d * order + d] += order
+
+	return Matrix.Matrix(order, order, elements)
+
+
+class UpdatableInverseTest(unittest.TestCase):
+
+	def test_updates_match_inverse(self):
+		rnd = random.Random(2)
+		matrix = _random_matrix(6, 1)
+		updatable = mu.UpdatableInverse(matrix)
+
+		for i in range(10):
+			updatable.replace_row(i % 6, [rnd.uniform(-1.0, 1.0) + (6 if ci == i % 6 else 0) for ci in range(6)])
+
+			self.assertTrue(mu.matrix_equality(updatable.inverse(), mu.matrix_inverse(updatable.matrix())))
+
+		self.assertEqual(updatable.updates, 10)
+
+	def test_singular_update_leaves_state_unchanged(self):
+		updatable = mu.UpdatableInverse(mu.matrix_identity(3))
+		updatable.replace_row(2, [0.0, 0.0, 2.0])
+
+		matrix = updatable.matrix()
+		inverse = updatable.inverse()
+		updates = updatable.updates
+		refactorizations = updatable.refactorizations
+
+		''' Row 0 becomes a copy of row 1 '''
+		with self.assertRaises(Exception):
+			updatable.replace_row(0, [0.0, 1.0, 0.0])
+
+		self.assertEqual(list(updatable.matrix().elements()), list(matrix.elements()))
+		self.assertEqual(list(updatable.inverse().elements()), list(inverse.elements()))
+		self.assertEqual(updatable.updates, updates)
+		self.assertEqual(updatable.refactorizations, refactorizations)
+		self.assertTrue(mu.matrix_equality(mu.matrix_prod(updatable.matrix(), updatable.inverse()), mu.matrix_identity(3)))
+
+		''' The instance keeps working after the failed update '''
+		updatable.replace_row(0, [1.0, 1.0, 0.0])
+
+		self.assertTrue(mu.matrix_equality(updatable.inverse(), mu.matrix_inverse(updatable.matrix())))
+
+	def test_solve(self):
+		updatable = mu.UpdatableInverse(_random_matrix(5, 3))
+		updatable.replace_column(1, [0.5, 6.0, -0.25, 1.0, 0.0])
+		b = Matrix.Matrix(5, 2, [float(i) for i in range(10)])
+		x = updatable.solve(b)
+
+		self.assertEqual((x.rows, x.cols), (5, 2))
+		self.assertTrue(mu.matrix_equality(mu.matrix_prod(updatable.matrix(), x), b))
+		self.assertRaises(Exception, updatable.solve, Matrix.Matrix(4, 1, [1.0] * 4))
+
+
+if __name__ == "__main__":
+	unittest.main()
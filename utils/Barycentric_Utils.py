@@ -209,39 +209,21 @@ def generalized_barycentric_coordinates(point, polygon):
 
 
 def tetrahedron_barycentric_coord(point, tetrahedron):
-    lambdas  = [0.0 for __ in tetrahedron]      # Lambdas
-    volumes = [0.0 for __ in tetrahedron]      # Volumes
-
-    volumes_sum = 0.0
-
-    for i in range(len(tetrahedron)):
-        vtx = tetrahedron[i]
-
-        try:
-            next_vtx = tetrahedron[i + 1]
-        except IndexError:
-            next_vtx = tetrahedron[0]
-
-        try:
-            next_next_vtx = tetrahedron[i + 2]
-        except IndexError:
-            if i > 2:
-                next_next_vtx = tetrahedron[1]
-            else:
-                next_next_vtx = tetrahedron[0]
+    """
+    Each lambda is the signed volume of the tetrahedron with the corresponding vertex replaced by the point, divided by
+    the signed volume of the tetrahedron. All five volumes are computed in one call to Vector_Utils.simplex_signed_volumes.
 
-        vector_a = vu.vector_sub(vtx, point)
-        vector_b = vu.vector_sub(next_vtx, point)
-        vector_c = vu.vector_sub(next_next_vtx, point)
-        
-        # print( vu.outter_prod_3D(vector_a, vector_b, vector_c))
+        :param point: List or tuple of 3 floats
+        :param tetrahedron: List or tuple of 4 points
 
-        volumes[i - 1] = vu.outter_prod_3D(vector_a, vector_b, vector_c) * (1.0/math.factorial(3))
-        volumes_sum += volumes[i - 1]
+        :raise: Exception
+        :return: List of 4 floats
+    """
 
-    # print("Volume total: %f" % vol_t)
+    vertices = list(tetrahedron)
+    volumes = vu.simplex_signed_volumes([vertices] + [vertices[:i] + [point] + vertices[i + 1:] for i in range(len(vertices))])
 
-    for i in range(len(volumes)):
-        lambdas[i] = volumes[i]/volumes_sum
+    if volumes[0] == 0.0:
+        raise Exception("The tetrahedron is degenerate: its volume is zero. Exiting...")
 
-    return lambdas
+    return [volume / volumes[0] for volume in volumes[1:]]
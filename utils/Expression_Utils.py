@@ -0,0 +1,263 @@
+from Geometry.classes import Matrix
+from Geometry.classes import MatrixExpression as me
+from Geometry.utils import Matrix_Utils as mu
+from Geometry.utils import Fixed_Size_Utils as fsu
+from Geometry.utils import Sparse_Utils as su
+
+'''
+	Evaluation of lazy matrix expressions (see classes/MatrixExpression.py).
+
+	The tree is first flattened into a list of terms whose sum is the result:
+
+		- leaf terms (coefficient, operand): a scaled, possibly transposed, matrix
+		- product terms (coefficient, left operand, right operand): a scaled product of two of them
+
+	where an operand is a strided description of a matrix (buffer, row stride, col stride, rows, cols), so transposing
+	only swaps its strides and scaling only multiplies the term\'s coefficient. Products are computed by the kernels
+	matrix_prod uses (the unrolled 3x3/4x4 ones in Fixed_Size_Utils, the tiled one otherwise); the scaled operands and
+	products are then combined row by row in a single pass.
+
+	Only the operands of a product that are not plain (scaled or transposed) matrices are computed into an intermediate
+	buffer, e.g. the sum in (A + B) @ C, or the inner product in (A @ B) @ C.
+'''
+
+
+def lazy(matrix):
+	"""
+	Starts a lazy expression from the matrix received as argument.
+
+		:param matrix: Matrix, SparseMatrix or MatrixExpression instance
+
+		:return: MatrixExpression instance
+	"""
+
+	return me.as_expression(matrix)
+
+
+def lazy_add(matrix_a, matrix_b):
+	return me.MatrixSum(me.as_expression(matrix_a), me.as_expression(matrix_b))
+
+
+def lazy_sub(matrix_a, matrix_b):
+	return me.MatrixSum(me.as_expression(matrix_a), me.MatrixScale(me.as_expression(matrix_b), -1))
+
+
+def lazy_scalar_prod(matrix, scalar):
+	return me.MatrixScale(me.as_expression(matrix), scalar)
+
+
+def lazy_prod(matrix_a, matrix_b):
+	return me.MatrixProduct(me.as_expression(matrix_a), me.as_expression(matrix_b))
+
+
+def lazy_transpose(matrix):
+	return me.MatrixTranspose(me.as_expression(matrix))
+
+
+def _result_numeric(leaves):
+	"""
+	The least exact backend among the leaves is used for the whole expression, as Matrix_Utils does for two operands.
+	"""
+
+	numeric = leaves[0].numeric
+
+	for leaf in leaves[1:]:
+		if Matrix.NUMERIC_PRECEDENCE[leaf.numeric.name] < Matrix.NUMERIC_PRECEDENCE[numeric.name]:
+			numeric = leaf.numeric
+
+	return numeric
+
+
+def _leaf_operand(matrix, transposed, numeric):
+	if su.is_sparse(matrix):
+		elements = matrix.elements()
+	elif matrix.numeric is numeric:
+		elements = matrix.elements()
+	else:
+		elements = matrix.converted(numeric).elements()
+
+	if transposed:
+		return elements, 1, matrix.cols, matrix.cols, matrix.rows
+
+	return elements, matrix.cols, 1, matrix.rows, matrix.cols
+
+
+def _row(operand, ri):
+	"""
+	Returns row ri of a strided operand, as a slice of its buffer.
+	"""
+
+	buffer, row_stride, col_stride, __, cols = operand
+	start = ri * row_stride
+
+	return buffer[start:start + col_stride * (cols - 1) + 1:col_stride]
+
+
+def _col(operand, ci):
+	"""
+	Returns column ci of a strided operand, as a slice of its buffer.
+	"""
+
+	buffer, row_stride, col_stride, rows, __ = operand
+	start = ci * col_stride
+
+	return buffer[start:start + row_stride * (rows - 1) + 1:row_stride]
+
+
+def _flatten(node, coefficient, transposed, numeric, leaf_terms, prod_terms):
+	"""
+	Appends the terms of node, scaled by coefficient and transposed when requested, to leaf_terms and prod_terms.
+	"""
+
+	if isinstance(node, me.MatrixLeaf):
+		leaf_terms.append((coefficient, _leaf_operand(node.matrix, transposed, numeric)))
+
+	elif isinstance(node, me.MatrixTranspose):
+		_flatten(node.operand, coefficient, not transposed, numeric, leaf_terms, prod_terms)
+
+	elif isinstance(node, me.MatrixScale):
+		_flatten(node.operand, coefficient * numeric.coerce(node.scalar), transposed, numeric, leaf_terms, prod_terms)
+
+	elif isinstance(node, me.MatrixSum):
+		_flatten(node.left, coefficient, transposed, numeric, leaf_terms, prod_terms)
+		_flatten(node.right, coefficient, transposed, numeric, leaf_terms, prod_terms)
+
+	elif isinstance(node, me.MatrixProduct):
+		if transposed:
+			''' (A @ B)^T = B^T @ A^T '''
+			left, right = node.right, node.left
+		else:
+			left, right = node.left, node.right
+
+		left_coefficient, left_operand = _product_operand(left, transposed, numeric)
+		right_coefficient, right_operand = _product_operand(right, transposed, numeric)
+
+		prod_terms.append((coefficient * left_coefficient * right_coefficient, left_operand, right_operand))
+
+	else:
+		raise Exception("Unknown expression node: %s. Exiting..." % type(node).__name__)
+
+
+def _product_operand(node, transposed, numeric):
+	"""
+	Returns a (coefficient, operand) pair for one side of a product. Plain (scaled or transposed) matrices are used in
+	place; anything else is computed into an intermediate buffer first.
+	"""
+
+	leaf_terms = []
+	prod_terms = []
+	_flatten(node, numeric.coerce(1), transposed, numeric, leaf_terms, prod_terms)
+
+	if len(leaf_terms) == 1 and len(prod_terms) == 0:
+		return leaf_terms[0]
+
+	rows, cols = (node.cols, node.rows) if transposed else (node.rows, node.cols)
+
+	return numeric.coerce(1), (_compute(rows, cols, leaf_terms, prod_terms, numeric), cols, 1, rows, cols)
+
+
+def _row_major(operand):
+	"""
+	Returns the elements of a strided operand in row-major order, as its own buffer when it already is.
+	"""
+
+	buffer, row_stride, col_stride, rows, cols = operand
+
+	if col_stride == 1 and row_stride == cols:
+		return buffer
+
+	return [buffer[ri * row_stride + ci * col_stride] for ri in range(rows) for ci in range(cols)]
+
+
+def _product(left, right, numeric):
+	"""
+	Multiplies two strided operands with the kernels Matrix_Utils.matrix_prod uses: the unrolled 3x3/4x4 ones for float
+	operands of those orders, the tiled one otherwise.
+
+		:return: List with the row-major elements of the product
+	"""
+
+	rows = left[3]
+	order = left[4]
+	cols = right[4]
+
+	if rows == order == cols and rows in fsu.PRODUCTS and not numeric.exact:
+		return fsu.PRODUCTS[rows](_row_major(left), _row_major(right))
+
+	''' Lists of Python numbers, as _dense_matrix_prod passes them: dot products over them skip boxing every element '''
+	product_rows = mu._tiled_prod([list(_row(left, ri)) for ri in range(rows)],
+	                              [list(_col(right, ci)) for ci in range(cols)])
+
+	return [e for row in product_rows for e in row]
+
+
+def _compute(rows, cols, leaf_terms, prod_terms, numeric):
+	"""
+	Computes the sum of the terms received as argument. Every product is computed first, by _product; the scaled
+	operands are then combined row by row, in one pass.
+
+		:return: List with the rows * cols row-major elements
+	"""
+
+	one = numeric.coerce(1)
+	terms = list(leaf_terms)
+
+	for c, left, right in prod_terms:
+		terms.append((c, (_product(left, right, numeric), cols, 1, rows, cols)))
+
+	if not leaf_terms and len(terms) == 1 and terms[0][0] == one:
+		''' A lone product is already the result '''
+		return terms[0][1][0]
+
+	elements = []
+
+	for ri in range(rows):
+		if terms:
+			c, operand = terms[0]
+			row = _row(operand, ri)
+			row = list(row) if c == one else [c * e for e in row]
+
+			for c, operand in terms[1:]:
+				if c == one:
+					row = [a + b for a, b in zip(row, _row(operand, ri))]
+				elif c == -one:
+					row = [a - b for a, b in zip(row, _row(operand, ri))]
+				else:
+					row = [a + c * b for a, b in zip(row, _row(operand, ri))]
+		else:
+			row = [numeric.coerce(0)] * cols
+
+		elements.extend(row)
+
+	return elements
+
+
+def evaluate(expression, out=None):
+	"""
+	Computes a lazy expression in one fused pass. Transposes become index swaps, scalars are folded into the
+	coefficient of every term and additions of scaled matrices share a single loop. Exact backends round every element
+	once, when the result is stored, instead of after every intermediate operation.
+
+		:param expression: MatrixExpression instance (a Matrix is returned as a copy)
+		:param out: Optional Matrix instance with the expression\'s dimension to write the result into. It can be one of
+				the leaves.
+
+		:return: Matrix instance
+
+		:raise: Exception
+	"""
+
+	expression = me.as_expression(expression)
+	numeric = _result_numeric(expression.leaves())
+	leaf_terms = []
+	prod_terms = []
+
+	_flatten(expression, numeric.coerce(1), False, numeric, leaf_terms, prod_terms)
+
+	elements = _compute(expression.rows, expression.cols, leaf_terms, prod_terms, numeric)
+
+	if out is not None:
+		''' Every element was computed before writing, so out can alias any of the leaves '''
+		return mu._write_into(out, expression.rows, expression.cols, elements)
+
+	return Matrix.Matrix(expression.rows, expression.cols, elements, numeric=numeric)
@@ -0,0 +1,338 @@
+"""
+Unrolled kernels for 3x3 and 4x4 matrices.
+
+Every function receives and returns flat, row-major sequences of 9 or 16 floats (e.g. Matrix.elements()), so they can
+be used on Matrix, MatrixStack slices or plain lists alike. Vectors and points are treated as column vectors, i.e. they
+are transformed as matrix * vector, the same convention used by Matrix_Utils.column_space.
+"""
+
+DEFAULT_TOLERANCE = 0.0001
+
+
+def m3_prod(a, b):
+	a00, a01, a02, a10, a11, a12, a20, a21, a22 = a
+	b00, b01, b02, b10, b11, b12, b20, b21, b22 = b
+
+	return [
+		a00 * b00 + a01 * b10 + a02 * b20, a00 * b01 + a01 * b11 + a02 * b21, a00 * b02 + a01 * b12 + a02 * b22,
+		a10 * b00 + a11 * b10 + a12 * b20, a10 * b01 + a11 * b11 + a12 * b21, a10 * b02 + a11 * b12 + a12 * b22,
+		a20 * b00 + a21 * b10 + a22 * b20, a20 * b01 + a21 * b11 + a22 * b21, a20 * b02 + a21 * b12 + a22 * b22,
+	]
+
+
+def m4_prod(a, b):
+	a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = a
+	b00, b01, b02, b03, b10, b11, b12, b13, b20, b21, b22, b23, b30, b31, b32, b33 = b
+
+	return [
+		a00 * b00 + a01 * b10 + a02 * b20 + a03 * b30,
+		a00 * b01 + a01 * b11 + a02 * b21 + a03 * b31,
+		a00 * b02 + a01 * b12 + a02 * b22 + a03 * b32,
+		a00 * b03 + a01 * b13 + a02 * b23 + a03 * b33,
+		a10 * b00 + a11 * b10 + a12 * b20 + a13 * b30,
+		a10 * b01 + a11 * b11 + a12 * b21 + a13 * b31,
+		a10 * b02 + a11 * b12 + a12 * b22 + a13 * b32,
+		a10 * b03 + a11 * b13 + a12 * b23 + a13 * b33,
+		a20 * b00 + a21 * b10 + a22 * b20 + a23 * b30,
+		a20 * b01 + a21 * b11 + a22 * b21 + a23 * b31,
+		a20 * b02 + a21 * b12 + a22 * b22 + a23 * b32,
+		a20 * b03 + a21 * b13 + a22 * b23 + a23 * b33,
+		a30 * b00 + a31 * b10 + a32 * b20 + a33 * b30,
+		a30 * b01 + a31 * b11 + a32 * b21 + a33 * b31,
+		a30 * b02 + a31 * b12 + a32 * b22 + a33 * b32,
+		a30 * b03 + a31 * b13 + a32 * b23 + a33 * b33,
+	]
+
+
+def m3_transpose(a):
+	a00, a01, a02, a10, a11, a12, a20, a21, a22 = a
+
+	return [a00, a10, a20, a01, a11, a21, a02, a12, a22]
+
+
+def m4_transpose(a):
+	a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = a
+
+	return [a00, a10, a20, a30, a01, a11, a21, a31, a02, a12, a22, a32, a03, a13, a23, a33]
+
+
+def m3_determinant(a):
+	a00, a01, a02, a10, a11, a12, a20, a21, a22 = a
+
+	return a00 * (a11 * a22 - a12 * a21) - a01 * (a10 * a22 - a12 * a20) + a02 * (a10 * a21 - a11 * a20)
+
+
+def _m4_minors(a):
+	"""
+	Returns the 2x2 minors of the two upper rows (s0-s5) and of the two lower rows (c0-c5) of a 4x4 matrix, from which
+	both its determinant and its inverse are expanded.
+	"""
+
+	a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = a
+
+	s = (a00 * a11 - a10 * a01, a00 * a12 - a10 * a02, a00 * a13 - a10 * a03,
+	     a01 * a12 - a11 * a02, a01 * a13 - a11 * a03, a02 * a13 - a12 * a03)
+	c = (a20 * a31 - a30 * a21, a20 * a32 - a30 * a22, a20 * a33 - a30 * a23,
+	     a21 * a32 - a31 * a22, a21 * a33 - a31 * a23, a22 * a33 - a32 * a23)
+
+	return s, c
+
+
+def m4_determinant(a):
+	(s0, s1, s2, s3, s4, s5), (c0, c1, c2, c3, c4, c5) = _m4_minors(a)
+
+	return s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+
+''' Bound on the product of all but one pivot of a partial-pivoting elimination, in units of the largest element '''
+_PIVOT_GROWTH = {3: 2.0 ** 3, 4: 2.0 ** 6}
+
+
+def _has_zero_pivot(a, order, tolerance):
+	"""
+	Runs the elimination with partial pivoting Matrix_Utils.LUFactorization performs and weighs whether any of its
+	pivots rounds to zero at tolerance.
+	"""
+
+	rows = [list(a[ri * order:(ri + 1) * order]) for ri in range(order)]
+	half = tolerance / 2.0
+
+	for k in range(order):
+		p = max(range(k, order), key=lambda ri: abs(rows[ri][k]))
+
+		if abs(rows[p][k]) <= half:
+			return True
+
+		rows[k], rows[p] = rows[p], rows[k]
+		tail = rows[k][k + 1:]
+		inverse = 1 / rows[k][k]
+
+		for ri in range(k + 1, order):
+			row = rows[ri]
+			factor = row[k] * inverse
+
+			if factor != 0:
+				row[k + 1:] = [e - factor * t for e, t in zip(row[k + 1:], tail)]
+
+	return False
+
+
+def is_singular(a, order, determinant, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Weighs whether a 3x3 or 4x4 matrix is singular under the same test Matrix_Utils applies to any other order: a
+	pivot of its LU factorization with partial pivoting rounds to zero at tolerance (its magnitude is at most
+	tolerance / 2).
+
+	With partial pivoting no pivot grows past 2^k times the largest element, so a determinant larger than the bound
+	_PIVOT_GROWTH gives for the product of the other pivots proves the smallest one can\'t round to zero. Only the
+	matrices failing that check, i.e. close to singular, run the elimination.
+
+		:param a: Flat, row-major sequence of floats
+		:param order: 3 or 4
+		:param determinant: Float. The matrix\'s determinant
+		:param tolerance: Float
+
+		:return: Boolean
+	"""
+
+	largest = max(map(abs, a))
+
+	if abs(determinant) > tolerance / 2.0 * _PIVOT_GROWTH[order] * largest ** (order - 1):
+		return False
+
+	return _has_zero_pivot(a, order, tolerance)
+
+
+def m3_inverse(a, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Inverts a 3x3 matrix through its adjugate.
+
+		:param a: Flat, row-major sequence of 9 floats
+		:param tolerance: Float
+
+		:return: List of 9 floats
+
+		:raise: Exception
+	"""
+
+	a00, a01, a02, a10, a11, a12, a20, a21, a22 = a
+
+	c00 = a11 * a22 - a12 * a21
+	c01 = a12 * a20 - a10 * a22
+	c02 = a10 * a21 - a11 * a20
+	det = a00 * c00 + a01 * c01 + a02 * c02
+
+	if is_singular(a, 3, det, tolerance):
+		raise Exception("The 3x3 matrix received does\'nt have an inverse. Exiting...")
+
+	inv_det = 1.0 / det
+
+	return [
+		c00 * inv_det, (a02 * a21 - a01 * a22) * inv_det, (a01 * a12 - a02 * a11) * inv_det,
+		c01 * inv_det, (a00 * a22 - a02 * a20) * inv_det, (a02 * a10 - a00 * a12) * inv_det,
+		c02 * inv_det, (a01 * a20 - a00 * a21) * inv_det, (a00 * a11 - a01 * a10) * inv_det,
+	]
+
+
+def m4_inverse(a, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Inverts a 4x4 matrix through its adjugate, expanded from the 2x2 minors of its upper and lower rows.
+
+		:param a: Flat, row-major sequence of 16 floats
+		:param tolerance: Float
+
+		:return: List of 16 floats
+
+		:raise: Exception
+	"""
+
+	a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = a
+	(s0, s1, s2, s3, s4, s5), (c0, c1, c2, c3, c4, c5) = _m4_minors(a)
+
+	det = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+	if is_singular(a, 4, det, tolerance):
+		raise Exception("The 4x4 matrix received does\'nt have an inverse. Exiting...")
+
+	inv_det = 1.0 / det
+
+	return [
+		(a11 * c5 - a12 * c4 + a13 * c3) * inv_det,
+		(-a01 * c5 + a02 * c4 - a03 * c3) * inv_det,
+		(a31 * s5 - a32 * s4 + a33 * s3) * inv_det,
+		(-a21 * s5 + a22 * s4 - a23 * s3) * inv_det,
+		(-a10 * c5 + a12 * c2 - a13 * c1) * inv_det,
+		(a00 * c5 - a02 * c2 + a03 * c1) * inv_det,
+		(-a30 * s5 + a32 * s2 - a33 * s1) * inv_det,
+		(a20 * s5 - a22 * s2 + a23 * s1) * inv_det,
+		(a10 * c4 - a11 * c2 + a13 * c0) * inv_det,
+		(-a00 * c4 + a01 * c2 - a03 * c0) * inv_det,
+		(a30 * s4 - a31 * s2 + a33 * s0) * inv_det,
+		(-a20 * s4 + a21 * s2 - a23 * s0) * inv_det,
+		(-a10 * c3 + a11 * c1 - a12 * c0) * inv_det,
+		(a00 * c3 - a01 * c1 + a02 * c0) * inv_det,
+		(-a30 * s3 + a31 * s1 - a32 * s0) * inv_det,
+		(a20 * s3 - a21 * s1 + a22 * s0) * inv_det,
+	]
+
+
+def m4_is_affine(a):
+	"""
+	Weighs whether a 4x4 matrix is affine, i.e. whether its bottom row is exactly (0, 0, 0, 1).
+
+		:param a: Flat, row-major sequence of 16 floats
+
+		:return: Boolean
+	"""
+
+	return a[12] == 0.0 and a[13] == 0.0 and a[14] == 0.0 and a[15] == 1.0
+
+
+def m4_affine_inverse(a, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Inverts an affine 4x4 matrix (see m4_is_affine): the inverse of its 3x3 linear part, and its translation
+	transformed by that inverse and negated. Cheaper than m4_inverse and exact in the bottom row.
+
+		:param a: Flat, row-major sequence of 16 floats
+		:param tolerance: Float
+
+		:return: List of 16 floats
+
+		:raise: Exception
+	"""
+
+	r00, r01, r02, r10, r11, r12, r20, r21, r22 = m3_inverse((a[0], a[1], a[2], a[4], a[5], a[6], a[8], a[9], a[10]),
+	                                                         tolerance)
+	tx = a[3]
+	ty = a[7]
+	tz = a[11]
+
+	return [
+		r00, r01, r02, -(r00 * tx + r01 * ty + r02 * tz),
+		r10, r11, r12, -(r10 * tx + r11 * ty + r12 * tz),
+		r20, r21, r22, -(r20 * tx + r21 * ty + r22 * tz),
+		0.0, 0.0, 0.0, 1.0,
+	]
+
+
+def m4_rigid_inverse(a):
+	"""
+	Inverts a rigid 4x4 transform (rotation and translation only): the rotation is transposed and the translation is
+	rotated back and negated. The rotation is assumed to be orthonormal, which is not checked; use m4_affine_inverse
+	for transforms that may carry scale or shear.
+
+		:param a: Flat, row-major sequence of 16 floats
+
+		:return: List of 16 floats
+	"""
+
+	a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23 = a[:12]
+
+	return [
+		a00, a10, a20, -(a00 * a03 + a10 * a13 + a20 * a23),
+		a01, a11, a21, -(a01 * a03 + a11 * a13 + a21 * a23),
+		a02, a12, a22, -(a02 * a03 + a12 * a13 + a22 * a23),
+		0.0, 0.0, 0.0, 1.0,
+	]
+
+
+def m3_transform_vector(a, vector):
+	"""
+	Returns a * vector for a 3x3 matrix and a three-element vector.
+
+		:param a: Flat, row-major sequence of 9 floats
+		:param vector: List or tuple of 3 floats
+
+		:return: List of 3 floats
+	"""
+
+	a00, a01, a02, a10, a11, a12, a20, a21, a22 = a
+	x, y, z = vector
+
+	return [a00 * x + a01 * y + a02 * z, a10 * x + a11 * y + a12 * z, a20 * x + a21 * y + a22 * z]
+
+
+def m4_transform_vector(a, vector):
+	"""
+	Transforms a direction by a 4x4 matrix (w = 0): translation does not apply.
+
+		:param a: Flat, row-major sequence of 16 floats
+		:param vector: List or tuple of 3 floats
+
+		:return: List of 3 floats
+	"""
+
+	x, y, z = vector
+
+	return [a[0] * x + a[1] * y + a[2] * z, a[4] * x + a[5] * y + a[6] * z, a[8] * x + a[9] * y + a[10] * z]
+
+
+def m4_transform_point(a, point):
+	"""
+	Transforms a position by a 4x4 matrix (w = 1). When the matrix is projective the result is divided by the resulting
+	w.
+
+		:param a: Flat, row-major sequence of 16 floats
+		:param point: List or tuple of 3 floats
+
+		:return: List of 3 floats
+	"""
+
+	a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = a
+	x, y, z = point
+
+	px = a00 * x + a01 * y + a02 * z + a03
+	py = a10 * x + a11 * y + a12 * z + a13
+	pz = a20 * x + a21 * y + a22 * z + a23
+	w = a30 * x + a31 * y + a32 * z + a33
+
+	if w != 1.0 and w != 0.0:
+		return [px / w, py / w, pz / w]
+
+	return [px, py, pz]
+
+
+PRODUCTS = {3: m3_prod, 4: m4_prod}
+TRANSPOSES = {3: m3_transpose, 4: m4_transpose}
+DETERMINANTS = {3: m3_determinant, 4: m4_determinant}
+INVERSES = {3: m3_inverse, 4: m4_inverse}
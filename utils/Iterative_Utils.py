@@ -0,0 +1,276 @@
+import math
+from operator import mul
+from Geometry.classes import Matrix
+from Geometry.utils import Sparse_Utils as su
+
+DEFAULT_TOLERANCE = 1e-8
+DEFAULT_MAX_ITERATIONS = 1000
+
+'''
+	Iterative solvers for large, sparse systems A * x = b, e.g. Laplacian or weight-smoothing systems with tens of
+	thousands of unknowns, where a dense elimination is out of reach:
+
+		- conjugate_gradient, with Jacobi (diagonal) preconditioning, for symmetric positive definite matrices
+		- gauss_seidel and sor (successive over-relaxation), for diagonally dominant or symmetric positive definite ones
+
+	A can be a dense Matrix or a SparseMatrix; every iteration only goes over the stored elements of each row. All of
+	them accept:
+
+		- x0: a previous solution to start from (warm start), e.g. the one of the last frame
+		- callback: called as callback(iteration, x, residual_norm) after every iteration; returning True stops early
+		- max_iterations: the iteration budget
+
+	and stop once the norm of the residual b - A * x is at most tolerance times the norm of b. They work in floats and
+	return an IterativeSolution, which also reports whether they converged within the budget.
+'''
+
+
+class IterativeSolution(object):
+	"""
+	Result of an iterative solver.
+
+		- x: n x 1 Matrix instance (or list of n floats when b was a list or tuple)
+		- iterations: Integer. Iterations run
+		- residual_norm: Float. Norm of b - A * x at the last iteration (for sor, the estimate from its last sweep
+		  unless it converged)
+		- converged: Boolean. Whether the residual reached the tolerance requested within the iteration budget
+	"""
+
+	def __init__(self, x, iterations, residual_norm, converged):
+		super(IterativeSolution, self).__init__()
+
+		self.x = x
+		self.iterations = iterations
+		self.residual_norm = residual_norm
+		self.converged = converged
+
+	def __str__(self):
+		return "<IterativeSolution iterations={} residual_norm={:.3e} converged={}>".format(
+			self.iterations, self.residual_norm, self.converged)
+
+
+def _operator_rows(matrix):
+	"""
+	Returns the rows of the square matrix received as argument as (column indices, values) pairs holding only the stored
+	elements. Dense rows get None as column indices, meaning every column.
+
+		:return: List of tuples
+
+		:raise: Exception
+	"""
+
+	try:
+		assert matrix.rows == matrix.cols
+	except AssertionError:
+		raise Exception("Iterative solvers expect a square matrix, got a %ix%i one. Exiting..." % (matrix.rows, matrix.cols))
+
+	if su.is_sparse(matrix):
+		indptr, indices, data = matrix.indptr, matrix.indices, matrix.data
+
+		return [(list(indices[indptr[ri]:indptr[ri + 1]]), list(data[indptr[ri]:indptr[ri + 1]]))
+		        for ri in range(matrix.rows)]
+
+	elements = matrix.elements()
+	n = matrix.cols
+
+	return [(None, [float(e) for e in elements[ri * n:(ri + 1) * n]]) for ri in range(matrix.rows)]
+
+
+def _row_dot(row, x):
+	indices, values = row
+
+	if indices is None:
+		return sum(map(mul, values, x))
+
+	return sum(map(mul, values, map(x.__getitem__, indices)))
+
+
+def _diagonal(rows):
+	"""
+	:raise: Exception when a diagonal element is zero
+	"""
+
+	diagonal = []
+
+	for ri, (indices, values) in enumerate(rows):
+		if indices is None:
+			value = values[ri]
+		else:
+			value = values[indices.index(ri)] if ri in indices else 0.0
+
+		if value == 0.0:
+			raise Exception("The diagonal element of row %i is zero. Exiting..." % ri)
+
+		diagonal.append(value)
+
+	return diagonal
+
+
+def _vector(values, n, name):
+	"""
+	Returns the n x 1 Matrix or sequence received as argument as a list of floats.
+
+		:raise: Exception
+	"""
+
+	if hasattr(values, 'cols'):
+		try:
+			assert values.rows == n and values.cols == 1
+		except AssertionError:
+			raise Exception("Expected %s to be a %ix1 matrix, got a %ix%i one. Exiting..." % (name, n, values.rows, values.cols))
+
+		values = values.elements()
+
+	values = [float(e) for e in values]
+
+	try:
+		assert len(values) == n
+	except AssertionError:
+		raise Exception("Expected %s to hold %i values, got %i instead. Exiting..." % (name, n, len(values)))
+
+	return values
+
+
+def _norm(values):
+	return math.sqrt(sum(map(mul, values, values)))
+
+
+def _solution(b, x, iterations, residual_norm, converged):
+	if hasattr(b, 'cols'):
+		x = Matrix.Matrix(len(x), 1, x)
+
+	return IterativeSolution(x, iterations, residual_norm, converged)
+
+
+def conjugate_gradient(matrix, b, x0=None, tolerance=DEFAULT_TOLERANCE, max_iterations=DEFAULT_MAX_ITERATIONS,
+                       preconditioner='jacobi', callback=None):
+	"""
+	Solves A * x = b by the (preconditioned) conjugate gradient method. A is expected to be symmetric positive definite,
+	which is not verified. Every iteration costs one product by A.
+
+		:param matrix: Square Matrix or SparseMatrix instance
+		:param b: n x 1 Matrix instance, or a list or tuple of n numbers
+		:param x0: Optional n x 1 Matrix instance or sequence to start from. Defaults to zeros
+		:param tolerance: Float. Relative residual norm to reach
+		:param max_iterations: Integer
+		:param preconditioner: 'jacobi' to scale the residual by the inverse of the diagonal of A, or None
+		:param callback: Optional callable(iteration, x, residual_norm). Returning True stops the iterations
+
+		:return: IterativeSolution instance
+
+		:raise: Exception
+	"""
+
+	rows = _operator_rows(matrix)
+	n = len(rows)
+	values = _vector(b, n, 'b')
+	x = _vector(x0, n, 'x0') if x0 is not None else [0.0] * n
+
+	if preconditioner == 'jacobi':
+		inverse_diagonal = [1.0 / d for d in _diagonal(rows)]
+	elif preconditioner is None:
+		inverse_diagonal = None
+	else:
+		raise Exception("Unknown preconditioner: %s. Use 'jacobi' or None. Exiting..." % preconditioner)
+
+	target = tolerance * (_norm(values) or 1.0)
+	r = [e - _row_dot(row, x) for e, row in zip(values, rows)]
+	residual_norm = _norm(r)
+	z = r if inverse_diagonal is None else list(map(mul, inverse_diagonal, r))
+	p = list(z)
+	rz = sum(map(mul, r, z))
+	iteration = 0
+
+	while residual_norm > target and iteration < max_iterations:
+		ap = [_row_dot(row, p) for row in rows]
+		pap = sum(map(mul, p, ap))
+
+		if pap <= 0.0:
+			raise Exception("The matrix is not positive definite: p * A * p = %g. Exiting..." % pap)
+
+		alpha = rz / pap
+		x = [a + alpha * e for a, e in zip(x, p)]
+		r = [a - alpha * e for a, e in zip(r, ap)]
+		residual_norm = _norm(r)
+		iteration += 1
+
+		if callback is not None and callback(iteration, x, residual_norm):
+			break
+
+		z = r if inverse_diagonal is None else list(map(mul, inverse_diagonal, r))
+		rz_next = sum(map(mul, r, z))
+		beta = rz_next / rz
+		rz = rz_next
+		p = [a + beta * e for a, e in zip(z, p)]
+
+	return _solution(b, x, iteration, residual_norm, residual_norm <= target)
+
+
+def sor(matrix, b, omega=1.0, x0=None, tolerance=DEFAULT_TOLERANCE, max_iterations=DEFAULT_MAX_ITERATIONS,
+        callback=None):
+	"""
+	Solves A * x = b by successive over-relaxation: every sweep goes over the rows in order and moves x[i] by omega
+	times the Gauss-Seidel correction (b[i] - A[i] * x) / A[i,i], using the elements of x already updated in the same
+	sweep. It converges for any omega in (0, 2) when A is symmetric positive definite, and for omega = 1 (Gauss-Seidel)
+	when A is strictly diagonally dominant. Omega between 1 and 2 usually needs far fewer sweeps on Laplacians.
+
+	The corrections of a sweep give the residual norm without an extra product by A; it is recomputed exactly once it
+	reaches the tolerance, before stopping.
+
+		:param matrix: Square Matrix or SparseMatrix instance with a nonzero diagonal
+		:param b: n x 1 Matrix instance, or a list or tuple of n numbers
+		:param omega: Float. Relaxation factor
+		:param x0: Optional n x 1 Matrix instance or sequence to start from. Defaults to zeros
+		:param tolerance: Float. Relative residual norm to reach
+		:param max_iterations: Integer. Maximum number of sweeps
+		:param callback: Optional callable(iteration, x, residual_norm). Returning True stops the iterations
+
+		:return: IterativeSolution instance
+
+		:raise: Exception
+	"""
+
+	try:
+		assert 0.0 < omega < 2.0
+	except AssertionError:
+		raise Exception("The relaxation factor is expected to be in (0, 2), got %g instead. Exiting..." % omega)
+
+	rows = _operator_rows(matrix)
+	n = len(rows)
+	values = _vector(b, n, 'b')
+	x = _vector(x0, n, 'x0') if x0 is not None else [0.0] * n
+	scales = [omega / d for d in _diagonal(rows)]
+	target = tolerance * (_norm(values) or 1.0)
+	residual_norm = _norm([e - _row_dot(row, x) for e, row in zip(values, rows)])
+	iteration = 0
+
+	while residual_norm > target and iteration < max_iterations:
+		accum = 0.0
+
+		for i in range(n):
+			residual = values[i] - _row_dot(rows[i], x)
+			x[i] += scales[i] * residual
+			accum += residual * residual
+
+		''' The sweep\'s residuals were taken while x was changing; confirm the estimate before stopping '''
+		residual_norm = math.sqrt(accum)
+
+		if residual_norm <= target:
+			residual_norm = _norm([e - _row_dot(row, x) for e, row in zip(values, rows)])
+
+		iteration += 1
+
+		if callback is not None and callback(iteration, x, residual_norm):
+			break
+
+	return _solution(b, x, iteration, residual_norm, residual_norm <= target)
+
+
+def gauss_seidel(matrix, b, x0=None, tolerance=DEFAULT_TOLERANCE, max_iterations=DEFAULT_MAX_ITERATIONS, callback=None):
+	"""
+	Solves A * x = b by Gauss-Seidel sweeps, i.e. sor with omega = 1. See sor.
+
+		:return: IterativeSolution instance
+	"""
+
+	return sor(matrix, b, omega=1.0, x0=x0, tolerance=tolerance, max_iterations=max_iterations, callback=callback)
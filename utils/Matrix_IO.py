@@ -0,0 +1,278 @@
+import io
+import sys
+import struct
+from array import array
+from decimal import Decimal
+from fractions import Fraction
+from Geometry.classes import Matrix
+
+'''
+	Binary layout (version 2), all integers little-endian:
+
+		offset  size  field
+		0       4     magic: b'GMTX'
+		4       2     format version (the lowest version able to read the file: 1 for float64 elements, 2 otherwise)
+		6       2     dtype code (see below)
+		8       2     flags (bit 0: the matrix used the 'decimal' backend, bit 1: the 'fraction' backend, bit 2: the
+		              'decimal' backend had its own decimals, given by scale)
+		10      2     scale: for dtype 2, the decimals every element was scaled by. 0 otherwise
+		12      8     rows
+		20      8     cols
+		28      4     padding, so the elements start 8-byte aligned
+		32      ...   the elements, row-major
+
+	The elements are written in a form that keeps the matrix\'s numeric backend exact:
+
+		- 1 (float64): rows * cols little-endian doubles. Float matrices
+		- 2 (scaled int64): rows * cols little-endian int64, every element times 10 ** scale. Decimal matrices
+		- 3 (ratio int64): rows * cols pairs of little-endian int64 (numerator, denominator). Fraction matrices
+
+	Version 1 files wrote exact matrices as float64 with the backend flags set; they are still read that way.
+
+	Loading float64 elements copies them straight into the matrix\'s array, 80-300x faster than parsing the text form.
+	Exact elements can\'t be copied: every one becomes its own Decimal (or Fraction) object, which bounds their loads
+	to about 5-10x faster than parsing text (see Matrix_Benchmarks.bench_serialization).
+'''
+
+MAGIC = b'GMTX'
+VERSION = 2
+DTYPE_FLOAT64 = 1
+DTYPE_SCALED_INT64 = 2
+DTYPE_RATIO_INT64 = 3
+FLAG_EXACT = 1
+FLAG_FRACTION = 2
+FLAG_FIXED_DECIMALS = 4
+
+''' Header flags for every numeric backend other than float '''
+NUMERIC_FLAGS = {'decimal': FLAG_EXACT, 'fraction': FLAG_FRACTION}
+
+''' Array type code and values stored per element for every dtype '''
+DTYPE_LAYOUTS = {DTYPE_FLOAT64: ('d', 1), DTYPE_SCALED_INT64: ('q', 1), DTYPE_RATIO_INT64: ('q', 2)}
+
+HEADER = struct.Struct('<4sHHHHQQ4x')
+
+DEFAULT_BLOCK_ROWS = 256
+
+
+def _little_endian(elements, typecode='d'):
+	elements = array(typecode, elements)
+
+	if sys.byteorder == 'big':
+		elements.byteswap()
+
+	return elements
+
+
+def _int64(values, matrix):
+	try:
+		return _little_endian(values, 'q')
+	except OverflowError:
+		raise Exception("The elements of the %ix%i matrix received don\'t fit in 64-bit integers and can\'t be written. Exiting..." % (
+			matrix.rows, matrix.cols))
+
+
+def _fixed_decimals(numeric):
+	return getattr(numeric, 'decimals', None) is not None and numeric.decimals >= 0
+
+
+def _encode(matrix):
+	"""
+	Returns the dtype code, the scale and the little-endian array of elements dump writes for the matrix received.
+	"""
+
+	elements = matrix.elements()
+	name = matrix.numeric.name
+
+	if name == 'decimal':
+		''' The decimals of the most precise element, so every element scales to an integer exactly '''
+		scale = max([0] + [-e.as_tuple().exponent for e in elements])
+
+		if _fixed_decimals(matrix.numeric):
+			''' The backend rounds every element to its decimals, so they are the scale load restores it from '''
+			scale = max(scale, matrix.numeric.decimals)
+
+		return DTYPE_SCALED_INT64, scale, _int64([int(e.scaleb(scale)) for e in elements], matrix)
+	elif name == 'fraction':
+		return DTYPE_RATIO_INT64, 0, _int64([v for e in elements for v in (e.numerator, e.denominator)], matrix)
+
+	if sys.byteorder == 'big' or not isinstance(elements, (array, memoryview)):
+		''' Frozen matrices keep their elements in a tuple, which isn\'t a buffer '''
+		elements = _little_endian(elements)
+
+	return DTYPE_FLOAT64, 0, elements
+
+
+def dump(matrix, fp):
+	"""
+	Writes the matrix received as argument to the binary file object fp. Float elements are written as float64, Decimal
+	ones as scaled 64-bit integers and Fraction ones as pairs of 64-bit integers, so load restores them exactly along
+	with the numeric backend, including the decimals of a DecimalNumeric created with its own.
+
+		:param matrix: Matrix instance
+		:param fp: File object opened in binary write mode
+
+		:return: Integer. The number of bytes written
+
+		:raise: Exception when an exact element doesn\'t fit in 64-bit integers
+	"""
+
+	dtype, scale, elements = _encode(matrix)
+	version = 1 if dtype == DTYPE_FLOAT64 else VERSION
+	flags = NUMERIC_FLAGS.get(matrix.numeric.name, 0)
+
+	if dtype == DTYPE_SCALED_INT64 and _fixed_decimals(matrix.numeric):
+		flags |= FLAG_FIXED_DECIMALS
+
+	fp.write(HEADER.pack(MAGIC, version, dtype, flags, scale, matrix.rows, matrix.cols))
+	fp.write(memoryview(elements).cast('B'))
+
+	return HEADER.size + len(elements) * 8
+
+
+def dumps(matrix):
+	"""
+	Returns the binary representation of the matrix received as argument.
+
+		:param matrix: Matrix instance
+
+		:return: Bytes
+	"""
+
+	fp = io.BytesIO()
+	dump(matrix, fp)
+
+	return fp.getvalue()
+
+
+def _read_header(fp):
+	"""
+	:return: Tuple (rows, cols, numeric backend, dtype code, scale)
+	"""
+
+	data = fp.read(HEADER.size)
+
+	if len(data) < HEADER.size:
+		raise Exception("Unexpected end of file while reading the matrix header. Exiting...")
+
+	magic, version, dtype, flags, scale, rows, cols = HEADER.unpack(data)
+
+	if magic != MAGIC:
+		raise Exception("The data received is not a binary matrix (magic %r). Exiting..." % magic)
+	elif version > VERSION:
+		raise Exception("Unsupported binary matrix version: %i > %i. Exiting..." % (version, VERSION))
+	elif dtype not in DTYPE_LAYOUTS:
+		raise Exception("Unsupported element type code: %i. Exiting..." % dtype)
+
+	if flags & FLAG_FRACTION:
+		numeric = Matrix.FRACTION
+	elif flags & FLAG_FIXED_DECIMALS:
+		numeric = Matrix.DecimalNumeric(scale)
+	elif flags & FLAG_EXACT:
+		numeric = Matrix.DECIMAL
+	else:
+		numeric = Matrix.FLOAT
+
+	return rows, cols, numeric, dtype, scale
+
+
+def read_header(fp):
+	"""
+	Reads and validates the header of a binary matrix from fp.
+
+		:param fp: File object opened in binary read mode
+
+		:return: Tuple (rows, cols, numeric backend name)
+
+		:raise: Exception
+	"""
+
+	rows, cols, numeric = _read_header(fp)[:3]
+
+	return rows, cols, numeric.name
+
+
+def _read_elements(fp, count, typecode='d'):
+	elements = array(typecode, [0]) * count
+	view = memoryview(elements).cast('B')
+	read = 0
+
+	while read < len(view):
+		chunk = fp.readinto(view[read:])
+
+		if not chunk:
+			raise Exception("Unexpected end of file: expected %i values, got %i. Exiting..." % (count, read // 8))
+
+		read += chunk
+
+	if sys.byteorder == 'big':
+		elements.byteswap()
+
+	return elements
+
+
+def _read_matrix(fp, rows, cols, numeric, dtype, scale):
+	"""
+	Reads rows * cols elements of the given dtype from fp and returns them in a matrix using the numeric backend
+	instance received.
+	"""
+
+	typecode, values = DTYPE_LAYOUTS[dtype]
+	raw = _read_elements(fp, rows * cols * values, typecode)
+
+	if dtype == DTYPE_SCALED_INT64:
+		''' Multiplying by 1E-scale is exact and gives every Decimal the scale\'s exponent, as rounding does '''
+		elements = list(map(Decimal(1).scaleb(-scale).__mul__, map(Decimal, raw)))
+
+		if scale == (Matrix.Matrix.decimals if numeric.decimals is None else numeric.decimals):
+			''' Already rounded to the decimals the backend stores, so they are adopted without a second rounding '''
+			return Matrix.Matrix.from_stored(rows, cols, elements, numeric)
+	elif dtype == DTYPE_RATIO_INT64:
+		elements = list(map(Fraction, raw[0::2], raw[1::2]))
+	else:
+		elements = raw
+
+	return Matrix.Matrix(rows, cols, elements, numeric=numeric)
+
+
+def load(fp):
+	"""
+	Reads a matrix written by dump from the binary file object fp.
+
+		:param fp: File object opened in binary read mode
+
+		:return: Matrix instance
+
+		:raise: Exception
+	"""
+
+	return _read_matrix(fp, *_read_header(fp))
+
+
+def loads(data):
+	"""
+	Creates a matrix from the bytes returned by dumps.
+
+		:param data: Bytes
+
+		:return: Matrix instance
+	"""
+
+	return load(io.BytesIO(data))
+
+
+def iter_row_blocks(fp, block_rows=DEFAULT_BLOCK_ROWS):
+	"""
+	Reads a matrix written by dump block by block, without loading the whole matrix in memory.
+
+		:param fp: File object opened in binary read mode
+		:param block_rows: Integer. Rows in every block (the last one may have less)
+
+		:return: Generator of tuples (first row index, Matrix instance with the block\'s rows)
+
+		:raise: Exception
+	"""
+
+	rows, cols, numeric, dtype, scale = _read_header(fp)
+
+	for start in range(0, rows, block_rows):
+		yield start, _read_matrix(fp, min(block_rows, rows - start), cols, numeric, dtype, scale)
@@ -1,8 +1,15 @@
 import math
-from decimal import Decimal
+from array import array
+from operator import add, mul, sub
 from Geometry.classes import Matrix
+from Geometry.classes import FrozenMatrix
+from Geometry.utils import Sparse_Utils as su
+from Geometry.utils import Fixed_Size_Utils as fsu
 
 DEFAULT_TOLERANCE = 0.0001
+DEFAULT_BLOCK_ROWS = 256
+PRODUCT_TILE = 64
+STRASSEN_THRESHOLD = 512
 
 
 def is_matrix_addition_defined(matrix_a, matrix_b):
@@ -13,22 +20,110 @@ def is_matrix_prod_defined(matrix_a, matrix_b):
 	return matrix_a.cols == matrix_b.rows
 
 
+def _match_numeric(matrix_a, matrix_b):
+	"""
+	When matrices with different numeric backends are combined, the least exact backend wins (float, then decimal,
+	then fraction; see Matrix.NUMERIC_PRECEDENCE), so the other operand is copied into that backend. Matrices that
+	already share the same backend are returned untouched.
+
+		:param matrix_a: Matrix instance
+		:param matrix_b: Matrix instance
+
+		:return: Tuple with both matrices
+	"""
+
+	numeric_a = matrix_a.numeric
+	numeric_b = matrix_b.numeric
+
+	if numeric_a is numeric_b:
+		return matrix_a, matrix_b
+
+	if Matrix.NUMERIC_PRECEDENCE[numeric_a.name] <= Matrix.NUMERIC_PRECEDENCE[numeric_b.name]:
+		return matrix_a, matrix_b.converted(numeric_a)
+
+	return matrix_a.converted(numeric_b), matrix_b
+
+
+def _with_numeric(matrix, numeric):
+	"""
+	Returns the matrix received as argument when numeric is None or already its backend. Otherwise returns a copy of
+	it in the numeric backend requested, so a single call can run in a different backend than the matrix\'s own.
+	"""
+
+	if numeric is None or Matrix.get_numeric(numeric) is matrix.numeric:
+		return matrix
+
+	return matrix.converted(numeric)
+
+
+def _memoized(name, matrix, compute, *args):
+	"""
+	Returns the result named name derived from a frozen matrix (and from args), computing it with compute only when it
+	is not in FrozenMatrix.CACHE yet. Matrix results are frozen before they are cached, since every later caller gets
+	the same instance.
+	"""
+
+	def compute_frozen():
+		result = compute()
+
+		return result.freeze() if hasattr(result, 'freeze') else result
+
+	return FrozenMatrix.CACHE.lookup((name, matrix) + args, compute_frozen)
+
+
+def _is_zero(value, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Weighs whether value rounds to zero at the number of decimals given by tolerance. Works alike for floats, Decimals
+	and Fractions. A tolerance of 0 only accepts exact zeros.
+	"""
+
+	return abs(value) <= tolerance / 2.0
+
+
+def _fixed_order(*matrices):
+	"""
+	Returns the order (3 or 4) shared by the matrices received as argument when all of them are dense, float, square
+	matrices of that order, i.e. when the unrolled kernels in Fixed_Size_Utils can be used. Returns None otherwise.
+
+		:param matrices: Matrix instances
+
+		:return: Integer or None
+	"""
+
+	order = matrices[0].rows
+
+	if order not in fsu.PRODUCTS:
+		return None
+
+	for matrix in matrices:
+		if not (matrix.rows == order and matrix.cols == order) or matrix.exact or su.is_sparse(matrix):
+			return None
+
+	return order
+
+
 def is_identity_row(row, tolerance=DEFAULT_TOLERANCE):
-	accum = 0.0
+	"""
+	:return: Boolean. True when one element of the row is 1 and all the others are 0, as in the rows of the identity
+	"""
+
+	ones = 0
 
 	for e in row:
-		accum += e
+		if _is_zero(e - 1, tolerance):
+			ones += 1
+		elif not _is_zero(e, tolerance):
+			return False
 
-	return round(Decimal(str(accum)), int(math.log(1.0/tolerance, 10))) == 1.0
+	return ones == 1
 
 
 def is_zero_row(row, tolerance=DEFAULT_TOLERANCE):
-	accum = 0.0
-
 	for e in row:
-		accum += e
+		if not _is_zero(e, tolerance):
+			return False
 
-	return round(Decimal(str(accum)), int(math.log(1.0/tolerance, 10))) == 0.0
+	return True
 
 
 def row_equivalence(matrix_a, matrix_b, tolerance=DEFAULT_TOLERANCE):
@@ -81,17 +176,15 @@ def col_equivalence(matrix_a, matrix_b, tolerance=DEFAULT_TOLERANCE):
 		return True
 
 
-def null_space(matrix):
+def null_space(matrix, tolerance=DEFAULT_TOLERANCE):
 	"""
 	Finds the solution space (null space) = { X(n x 1) | matrix * X = 0 } of the matrix received as argument
 		:param matrix: Matrix instance
-		:return: n x 1 Matrix instance, where n = # of columns of the matrix received as argument.
+		:return: List with a basis of n x 1 Matrix instances, where n = # of columns of the matrix received as argument.
+				Empty when the only solution is X = 0
 	"""
 
-	aug_matrix = matrix_augment(matrix, Matrix.Matrix(matrix.rows, 1, [0.0 for __ in range(matrix.rows)]))
-	matrix_rref = row_reduced_echelon(aug_matrix)
-
-	pass
+	return null_space_basis(matrix, tolerance)
 
 
 def row_space(matrix, y=None):
@@ -115,7 +208,7 @@ def row_space(matrix, y=None):
 		except AttributeError:
 			raise ValueError("Argument for parameter y is expected to be of type Matrix. Exiting...")
 
-		return matrix_prod(y, matrix)
+	return matrix_prod(y, matrix)
 
 
 def in_row_space(k, matrix):
@@ -124,18 +217,17 @@ def in_row_space(k, matrix):
 		:param k: Matrix instance with dimension 1 x m, where m = matrix\'s # of rows
 		:param matrix: Matrix instance
 
-		:return: Boolean
+		:return: Tuple (True, 1 x m Matrix y with y * matrix = k), or (False, None)
 	"""
 
 	matrix_t = matrix_transpose(matrix)
 	k_t = matrix_transpose(k)
+	in_space, solution_matrix = in_column_space(k_t, matrix_t)
 
-	try:
-		__, solution_matrix = in_column_space(k_t, matrix_t)
+	if not in_space:
+		return False, None
 
-		return True, matrix_transpose(solution_matrix)
-	except Exception:
-		return False
+	return True, matrix_transpose(solution_matrix)
 
 
 def column_space(matrix, x=None):
@@ -162,53 +254,109 @@ def column_space(matrix, x=None):
 	return matrix_prod( matrix, x )
 
 
-def in_column_space(k, matrix, tolerance=DEFAULT_TOLERANCE):
+def in_column_space(k, matrix, tolerance=DEFAULT_TOLERANCE, numeric=None):
 	"""
 	Finds weather matrix k is in the column space = { k(m x 1} | matrix * x = k } of the matrix passed as the second argument.
+	Same as in_column_space_many with a single column.
 		:param k: Matrix instance with dimension m x 1, where m = matrix\'s # of rows
 		:param matrix: Matrix instance
+		:param numeric: Optional numeric backend ('float', 'decimal', 'fraction') to row reduce in
 
-		:return: Boolean
-	"""
+		:return: Tuple (True, n x 1 Matrix x with matrix * x = k), or (False, None)
 
-	matrix_augm_rref = row_reduced_echelon(matrix_augment(matrix, k), tolerance=tolerance)
-	x_elements = []
+		:raise: Exception
+	"""
 
-	for ri in range(matrix_augm_rref.rows):
-		matrix_augm_rref_row = [matrix_augm_rref.get(ri, ci) for ci in range(matrix_augm_rref.cols)]
+	try:
+		assert k.cols == 1
+	except AssertionError:
+		raise Exception("Expected a vector with 1 column, got a %ix%i matrix. Exiting..." % (k.rows, k.cols))
 
-		if is_identity_row(matrix_augm_rref_row[0:-1]) is True:
-			x_elements.append(matrix_augm_rref_row[-1])
-		else:
-			if is_zero_row(matrix_augm_rref_row[0:-1]) is True:
-				result = matrix_augm_rref_row[-1]
-
-				if not round(Decimal(str(result)), int(math.log(1.0/tolerance, 10))) == 0.0:
-					''' A zero-row cannot have non-zero element in the k-augmented-part '''
-					return False
-				else:
-					continue
-			else:
-				continue
+	flags, matrix_x = in_column_space_many(k, matrix, tolerance=tolerance, numeric=numeric)
 
-	matrix_x = Matrix.Matrix(matrix.cols, 1, x_elements)
+	if not flags[0]:
+		return False, None
 
 	return True, matrix_x
-	try:
-		matrix_times_x = matrix_prod(matrix, matrix_x)
-	except Exception:
-		''' matrix * matrix_x is not defined... '''
-		return False
+
+
+def _column_space_transform(matrix, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Row reduces [matrix | I] once. The right half then holds T with T * matrix = rref(matrix), so for any k:
+
+		- the rows of T past the rank span the vectors y with y * matrix = 0: k is in the column space if and only if
+		  every one of them gives y * k = 0
+		- the first rank rows give the solution: x takes (T * k)[i] at the pivot column of row i and 0 elsewhere
+
+	The reduction of frozen matrices is memoized.
+
+		:return: Tuple (pivot columns, solution rows of T, check rows of T)
+	"""
+
+	if getattr(matrix, 'frozen', False):
+		return _memoized('column_space_transform', matrix, lambda: _column_space_transform(matrix.copy(), tolerance),
+		                 tolerance)
+
+	m = matrix.rows
+	n = matrix.cols
+	one = matrix.numeric.coerce(1)
+	zero = matrix.numeric.coerce(0)
+	rows = [row + [one if ci == ri else zero for ci in range(m)] for ri, row in enumerate(_matrix_rows(matrix))]
+	pivots = [c for c in _gauss_jordan(rows, n + m, tolerance) if c < n]
+	transform = [row[n:] for row in rows]
+
+	return pivots, transform[:len(pivots)], transform[len(pivots):]
+
+
+def in_column_space_many(k, matrix, tolerance=DEFAULT_TOLERANCE, numeric=None):
+	"""
+	Finds weather every column of k is in the column space = { k(m x 1) | matrix * x = k } of matrix, reducing matrix
+	only once (see _column_space_transform) instead of once per column as in_column_space does. Every column then
+	costs O(m^2) dot products.
+
+		:param k: m x c Matrix instance, where m = matrix\'s # of rows. Every column is a vector to test
+		:param matrix: Matrix instance
+		:param tolerance: Float
+		:param numeric: Optional numeric backend ('float', 'decimal', 'fraction') to row reduce in
+
+		:return: Tuple (list with c Booleans, n x c Matrix instance holding a solution x of matrix * x = k for every
+				column of k in the column space, and zeros for the others)
+
+		:raise: Exception
+	"""
 
 	try:
-		assert matrix_equality(matrix_times_x, k, 0.0001)
-	except(AssertionError, Exception) as exc:
-		print("Matrix solution is incorrect: %s" % exc.message)
-		print("-- {}".format(matrix_times_x))
-		print("-- {}".format(k))
-		return False
-	else:
-		return True, matrix_x
+		assert k.rows == matrix.rows
+	except AssertionError:
+		raise Exception("Expected vectors with %i rows, got a %ix%i matrix. Exiting..." % (matrix.rows, k.rows, k.cols))
+
+	matrix = _with_numeric(matrix, numeric)
+	numeric = matrix.numeric
+	k = k if k.numeric is numeric else k.converted(numeric)
+	pivots, solution_rows, check_rows = _column_space_transform(matrix, tolerance)
+	zero = numeric.coerce(0)
+	elements = k.elements()
+	count = k.cols
+	flags = []
+	solutions = []
+
+	for ci in range(count):
+		values = elements[ci::count]
+		x = [zero] * matrix.cols
+
+		for row in check_rows:
+			if not _is_zero(sum(map(mul, row, values)), tolerance):
+				flags.append(False)
+				break
+		else:
+			flags.append(True)
+
+			for pivot, row in zip(pivots, solution_rows):
+				x[pivot] = sum(map(mul, row, values))
+
+		solutions.append(x)
+
+	return flags, Matrix.Matrix(matrix.cols, count, [x[ri] for ri in range(matrix.cols) for x in solutions], numeric=numeric)
 
 
 def elementary_row_operation_1(matrix, row_i_index, row_j_index):
@@ -224,9 +372,8 @@ def elementary_row_operation_1(matrix, row_i_index, row_j_index):
 		:raise: IndexError
 	"""
 
-	matrix_cp = Matrix.Matrix(matrix.rows, matrix.cols, matrix.elements())
-	matrix_cp.set_row(row_i_index, [e for e in matrix.row(row_j_index)])
-	matrix_cp.set_row(row_j_index, [e for e in matrix.row(row_i_index)])
+	matrix_cp = matrix.copy()
+	matrix_cp.row_view(row_i_index).swap(matrix_cp.row_view(row_j_index))
 
 	return matrix_cp
 
@@ -244,15 +391,16 @@ def elementary_row_operation_2(matrix, row_index, scalar):
 		:raise: ValueError
 	"""
 
-	scalar = float(scalar)
+	scalar = matrix.coerce(scalar)
 	'''try:
 		assert not scalar == 0.0
 	except AssertionError:
 		raise ValueError("Scalar must be greater or less but not equal to 0. Exiting...")'''
 
-	elements = [re * scalar for re in matrix.row(row_index)]
+	matrix_cp = matrix.copy()
+	matrix_cp.row_view(row_index).scale(scalar)
 
-	return Matrix.Matrix(matrix.rows, matrix.cols, matrix.elements()).set_row(row_index, elements)
+	return matrix_cp
 
 
 def elementary_row_operation_3(matrix, row_i_index, row_j_index, scalar_k ):
@@ -269,323 +417,2249 @@ def elementary_row_operation_3(matrix, row_i_index, row_j_index, scalar_k ):
 		:raise: ValueError
 	"""
 
-	matrix_cp = Matrix.Matrix(matrix.rows, matrix.cols, matrix.elements())
-
-	row_i = elementary_row_operation_2(matrix_cp, row_i_index, scalar_k ).row( row_i_index)
-	row_j = matrix_cp.row(row_j_index)
-
-	matrix_cp.set_row(row_j_index, [row_i[ci] + row_j[ci] for ci in range( matrix_cp.cols)])
+	matrix_cp = matrix.copy()
+	matrix_cp.row_view(row_j_index).add_scaled(matrix_cp.row_view(row_i_index), scalar_k)
 
 	return matrix_cp
 
 
-def row_reduced_echelon(matrix, tolerance=DEFAULT_TOLERANCE):
+def _gauss_jordan(rows, cols, tolerance=DEFAULT_TOLERANCE):
 	"""
-	Finds the row-reduced-echelon form for the matrix received as argument.
+	Reduces the rows received as argument to row-reduced-echelon form in place, with partial pivoting: the pivot of
+	every column is the remaining row with the largest magnitude in it. Rows are swapped by reference, and scaled and
+	eliminated only over the columns right of the pivot, so no other buffer is allocated.
 
-		:param matrix: Matrix instance
-		:return: Matrix instance
+	The elimination runs in two passes: the forward pass clears the entries below every pivot and the backward pass the
+	entries above them. By then, the pivot rows only have nonzeros in the non-pivot columns, so the backward pass only
+	updates those (none for a nonsingular square matrix, the right half for an inverse\'s [A | I]).
+
+		:param rows: List of lists of numbers (floats, Decimals or Fractions), all of length cols
+		:param cols: Integer
+		:param tolerance: Float. Pivots whose magnitude rounds to zero at this tolerance are skipped
+
+		:return: List with the pivot column of every nonzero row, in order
 	"""
-	matrix_cp = Matrix.Matrix(matrix.rows, matrix.cols, matrix.elements())
 
-	for ri in range(matrix_cp.rows):
-		''' Row pivot '''
-		ci = ri
-		# print("**** Start Row %i *****" % ri)
-		try:
-			elements = matrix_cp.elements()
-			ri_acum = ri
-			row_col_value = matrix_cp.get(ri, ci)
-			# print("---- Row-column value: {} | Rounded: {}".format(row_col_value, round(Decimal(str(row_col_value)), int(math.log(1.0/tolerance, 10)))))
-
-			while round(Decimal(str(row_col_value)), int(math.log(1.0/tolerance, 10))) == 0.0:
-				ri_acum += 1
-
-				try:
-					matrix_cp = elementary_row_operation_1(matrix_cp, ri, ri_acum)
-				except IndexError:
-					''' Reset matrix before row operations '''
-					matrix_cp.set_elements(elements)
-					ri_acum = ri
-					ci += 1
-
-				row_col_value = matrix_cp.get(ri, ci)
-
-		except IndexError as exc:
-			''' Row at ri is a zero row '''
+	count = len(rows)
+	pivots = []
+	r = 0
+
+	for c in range(cols):
+		if r == count:
 			break
 
-		# print("---- Prev: {}".format(matrix_cp))
-		# matrix_cp = elementary_row_operation_2(matrix_cp, ri, 1.0/round(Decimal(str(matrix_cp.get(ri, ci))), 4))
-		matrix_cp = elementary_row_operation_2(matrix_cp, ri, 1.0/matrix_cp.get(ri, ci))
-		# print("-- ERO2: {}".format(matrix_cp))
-		''' Zero pivot column '''
-		rows = [i for i in range(ri)]
-
-		for i in range(ri + 1, matrix_cp.rows):
-			rows.append(i)
-
-		for rii in rows:
-			matrix_cp = elementary_row_operation_3(matrix_cp, ri, rii, 0.0 - matrix_cp.get(rii, ci))
-			# print("-- ERO 3: {}".format(matrix_cp))
-		# print("**** End Row %i *****" % ri)
-		# print("**********************")
-	return matrix_cp
+		p = max(range(r, count), key=lambda ri: abs(rows[ri][c]))
+		pivot = rows[p][c]
 
+		if _is_zero(pivot, tolerance):
+			continue
 
-def elementary_column_operation_1(matrix, col_i_index, col_j_index):
-	"""
-	Performs an elementary row operation (ERO) of type I: Column i and column j are interchanged
+		if p != r:
+			rows[r], rows[p] = rows[p], rows[r]
 
-		:param matrix: Matrix instance
-		:param col_i_index: Integer
-		:param col_j_index: Integer
+		pivot_row = rows[r]
+		inverse = 1 / pivot
+		tail = [e * inverse for e in pivot_row[c + 1:]]
+		pivot_row[c + 1:] = tail
+		pivot_row[c] = pivot * inverse
+		zero = pivot - pivot
 
-		:return: Matrix instance
+		for ri in range(r + 1, count):
+			row = rows[ri]
+			factor = row[c]
 
-		:raise: IndexError
-	"""
+			if factor != 0:
+				row[c + 1:] = [a - factor * b for a, b in zip(row[c + 1:], tail)]
+				row[c] = zero
 
-	matrix_cp = Matrix.Matrix(matrix.rows, matrix.cols, matrix.elements())
-	matrix_cp.set_col(col_i_index, [ e for e in matrix.col( col_j_index)])
-	matrix_cp.set_col(col_j_index, [ e for e in matrix.col( col_i_index)])
+		pivots.append(c)
+		r += 1
 
-	return matrix_cp
+	for r in range(len(pivots) - 1, 0, -1):
+		c = pivots[r]
+		pivot_row = rows[r]
+		nonzero = [ci for ci in range(c + 1, cols) if pivot_row[ci] != 0]
+		dense = nonzero and len(nonzero) * 4 > cols - nonzero[0]
 
+		if dense:
+			start = nonzero[0]
+			tail = pivot_row[start:]
 
-def elementary_column_operation_2(matrix, col_index, scalar):
-	"""
-	Performs an elementary column operation (ECO) of type II: Column i is multiplied by scalar (scalar != 0 ).
+		for ri in range(r):
+			row = rows[ri]
+			factor = row[c]
 
-		:param matrix: Matrix instance
-		:param col_index: Integer
-		:param scalar: Float
+			if factor == 0:
+				continue
 
-		:return: Matrix instance
+			if dense:
+				row[start:] = [a - factor * b for a, b in zip(row[start:], tail)]
+			else:
+				for ci in nonzero:
+					row[ci] -= factor * pivot_row[ci]
 
-		:raise: ValueError
-	"""
+			row[c] = factor - factor
 
-	scalar = float(scalar)
+	return pivots
 
-	'''try:
-		assert not scalar == 0.0
-	except AssertionError:
-		raise ValueError("Scalar must be greater or less but not equal to 0. Exiting...")'''
 
-	elements = [ ce * scalar for ce in matrix.col( col_index ) ]
+def _matrix_rows(matrix):
+	elements = matrix.elements()
+	cols = matrix.cols
 
-	return Matrix.Matrix( matrix.rows, matrix.cols, matrix.elements() ).set_col( col_index, elements )
+	return [list(elements[ri * cols:(ri + 1) * cols]) for ri in range(matrix.rows)]
 
 
-def elementary_column_operation_3(matrix, col_i_index, col_j_index, scalar_k):
+def _matrix_cols(matrix):
+	elements = matrix.elements()
+
+	return [list(elements[ci::matrix.cols]) for ci in range(matrix.cols)]
+
+
+def row_reduced_echelon(matrix, tolerance=DEFAULT_TOLERANCE, numeric=None):
 	"""
-	Performs an elementary column operation (ECO) of type III: Column j is replaced by itself plus k times Column i
+	Finds the row-reduced-echelon form for the matrix received as argument, by Gauss-Jordan elimination with partial
+	pivoting on a single working copy of its rows (see _gauss_jordan). Exact backends are rounded once, when the
+	result is stored.
 
 		:param matrix: Matrix instance
-		:param col_i_index: Integer
-		:param col_j_index: Integer
-		:param scalar_k: Float
+		:param numeric: Optional numeric backend ('float', 'decimal', 'fraction') to row reduce in. Defaults to the
+				matrix\'s own
+		:return: Matrix instance (FrozenMatrix for frozen matrices, whose result is memoized)
+	"""
+	if getattr(matrix, 'frozen', False):
+		return _memoized('row_reduced_echelon', matrix, lambda: row_reduced_echelon(matrix.copy(), tolerance, numeric),
+		                 tolerance, numeric)
 
-		:return: Matrix instance
+	matrix = _with_numeric(matrix, numeric)
+	rows = _matrix_rows(matrix)
 
-		:raise: ValueError
+	_gauss_jordan(rows, matrix.cols, tolerance)
+
+	return Matrix.Matrix(matrix.rows, matrix.cols, [e for row in rows for e in row], numeric=matrix.numeric)
+
+
+class RowReduction(object):
 	"""
+	Row-reduced-echelon form of a matrix together with its pivot columns, from a single Gauss-Jordan elimination (see
+	_gauss_jordan). The rank, the bases of the null, column and row spaces and the reduced matrix itself are all read
+	from it, so callers needing several of them only pay for one reduction:
 
-	matrix_cp = Matrix.Matrix(matrix.rows, matrix.cols, matrix.elements())
+		reduction = RowReduction(matrix)
+		reduction.rank, reduction.null_space_basis(), reduction.column_space_basis()
 
-	col_i = elementary_column_operation_2(matrix_cp, col_i_index, scalar_k ).col(col_i_index)
-	col_j = matrix_cp.col(col_j_index)
+	The arithmetic follows the numeric backend of the matrix reduced.
+	"""
 
-	matrix_cp.set_col(col_j_index, [col_i[ri] + col_j[ri] for ri in range( matrix_cp.rows)])
+	def __init__(self, matrix, tolerance=DEFAULT_TOLERANCE):
+		"""
+			:param matrix: Matrix instance
+			:param tolerance: Float. Pivots whose magnitude rounds to zero at this tolerance are skipped
+		"""
 
-	return matrix_cp
+		super(RowReduction, self).__init__()
 
+		elements = matrix.elements()
+		cols = matrix.cols
+		rows = _matrix_rows(matrix)
+		pivots = _gauss_jordan(rows, cols, tolerance)
 
-def column_reduced_echelon(matrix, tolerance=DEFAULT_TOLERANCE):
-	"""
-	Finds the column-reduced-echelon form for the matrix received as argument.
+		self.rows = matrix.rows
+		self.cols = cols
+		self.numeric = matrix.numeric
+		self.pivots = pivots
+		self.rank = len(pivots)
+		self.nullity = cols - len(pivots)
+		self.__reduced = rows
+		''' The column space is spanned by the pivot columns of the matrix itself, not by those of its reduced form '''
+		self.__pivot_cols = [list(elements[ci::cols]) for ci in pivots]
 
-		:param matrix: Matrix instance
-		:return: Matrix instance
+	def rref(self):
+		"""
+		:return: Matrix instance. The row-reduced-echelon form
+		"""
+
+		return Matrix.Matrix(self.rows, self.cols, [e for row in self.__reduced for e in row], numeric=self.numeric)
+
+	def null_space_basis(self):
+		"""
+		Every non-pivot (free) column gives one vector of the basis: 1 at the free column, minus the free column\'s entry
+		of every pivot row at that row\'s pivot column, and 0 everywhere else.
+
+			:return: List with nullity n x 1 Matrix instances (empty when the null space is {0})
+		"""
+
+		one = self.numeric.coerce(1)
+		zero = self.numeric.coerce(0)
+		pivots = self.pivots
+		basis = []
+
+		for free in sorted(set(range(self.cols)).difference(pivots)):
+			elements = [zero] * self.cols
+			elements[free] = one
+
+			for row, pivot in zip(self.__reduced, pivots):
+				elements[pivot] = -row[free]
+
+			basis.append(Matrix.Matrix(self.cols, 1, elements, numeric=self.numeric))
+
+		return basis
+
+	def column_space_basis(self):
+		"""
+		:return: List with rank m x 1 Matrix instances: the pivot columns of the matrix reduced
+		"""
+
+		return [Matrix.Matrix(self.rows, 1, col, numeric=self.numeric) for col in self.__pivot_cols]
+
+	def row_space_basis(self):
+		"""
+		:return: List with rank 1 x n Matrix instances: the nonzero rows of the row-reduced-echelon form
+		"""
+
+		return [Matrix.Matrix(1, self.cols, row, numeric=self.numeric) for row in self.__reduced[:self.rank]]
+
+
+def row_reduction(matrix, tolerance=DEFAULT_TOLERANCE):
 	"""
-	matrix_cp = Matrix.Matrix(matrix.rows, matrix.cols, matrix.elements())
+	Row reduces the matrix received as argument. The reduction of frozen matrices is memoized, so it is only computed
+	once per matrix. RowReduction instances are returned untouched.
 
-	for ci in range(matrix_cp.cols):
-		''' Column pivot '''
-		ri = ci
+		:param matrix: Matrix or RowReduction instance
+		:param tolerance: Float
 
-		try:
-			elements = matrix_cp.elements()
-			ci_acum = ci
-			row_col_value = matrix_cp.get(ri, ci)
+		:return: RowReduction instance
+	"""
 
-			while round(Decimal(str(row_col_value)), int(math.log(1.0/tolerance, 10))) == 0.0:
-				ci_acum += 1
+	if isinstance(matrix, RowReduction):
+		return matrix
 
-				try:
-					matrix_cp = elementary_column_operation_1(matrix_cp, ci, ci_acum)
-				except IndexError:
-					''' Reset matrix before column operations '''
-					matrix_cp.set_elements(elements)
-					ci_acum = ci
-					ri += 1
+	if getattr(matrix, 'frozen', False):
+		return _memoized('row_reduction', matrix, lambda: RowReduction(matrix, tolerance), tolerance)
 
-				row_col_value = matrix_cp.get(ri, ci)
+	return RowReduction(matrix, tolerance)
 
-		except IndexError:
-			''' Row at ri is a zero row '''
-			break
 
-		matrix_cp = elementary_column_operation_2(matrix_cp, ci, 1.0/float(matrix_cp.get(ri, ci)))
+def null_space_basis(matrix, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Finds a basis of the null space = { X(n x 1) | matrix * X = 0 } of the matrix received as argument.
 
-		''' Zero pivot column '''
-		cols = [i for i in range( ci )]
-		cols.extend([j for j in range(ci + 1, matrix_cp.cols)])
+		:param matrix: Matrix instance, or a RowReduction of it to share a single elimination between several calls
+		:param tolerance: Float
 
-		for cii in cols:
-			matrix_cp = elementary_column_operation_3( matrix_cp, ci, cii, 0.0 - float(matrix_cp.get( ri, cii )) )
+		:return: List of n x 1 Matrix instances, where n = # of columns of the matrix
+	"""
 
-	return matrix_cp
+	return row_reduction(matrix, tolerance).null_space_basis()
 
 
-def has_inverse(matrix):
+def column_space_basis(matrix, tolerance=DEFAULT_TOLERANCE):
 	"""
-	Only square matrices can have an inverse but not all square matrices have an inverse
+	Finds a basis of the column space = { K(m x 1) | matrix * x = K } of the matrix received as argument.
 
-		:param matrix: Matrix instance
+		:param matrix: Matrix instance, or a RowReduction of it to share a single elimination between several calls
+		:param tolerance: Float
 
-		:return: Boolean
+		:return: List of m x 1 Matrix instances, where m = # of rows of the matrix
 	"""
 
-	try:
-		''' Matrix has to be square to proceed...'''
-		assert matrix.rows == matrix.cols
+	return row_reduction(matrix, tolerance).column_space_basis()
 
-		''' Matrix has to be row equivalent to the identity '''
-		assert row_equivalence( matrix, matrix_identity( matrix.rows ) )
-	except AssertionError:
-		return False
-	else:
-		return True
 
+def row_space_basis(matrix, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Finds a basis of the row space = { K(1 x n) | y * matrix = K } of the matrix received as argument.
 
-def matrix_equality(matrix_a, matrix_b, tolerance=None):
+		:param matrix: Matrix instance, or a RowReduction of it to share a single elimination between several calls
+		:param tolerance: Float
+
+		:return: List of 1 x n Matrix instances, where n = # of columns of the matrix
 	"""
-	Compares both matrices and weighs weather they are equal.
 
-		:param matrix_a: Matrix instance
-		:param matrix_b: Matrix instance
+	return row_reduction(matrix, tolerance).row_space_basis()
 
-		:return: Boolean
 
-		:raise: Exception
+class IncrementalEchelon(object):
+	"""
+	Row-reduced-echelon form kept up to date while rows are appended one at a time, e.g. while building a constraint
+	system interactively. It keeps the reduced basis rows and their pivot columns and absorbs every new row in
+	O(n * rank), so rank and membership queries don\'t reduce the whole system again.
+
+	Every basis row also keeps its combination of the rows appended, and every appended row found to be dependent keeps
+	the combination of rows that cancels it (a vector y with y * A = 0). Those give the coefficients of in_row_space
+	and decide in_column_space: k is in the column space of A if and only if y * k = 0 for all of them. Keeping them
+	adds O(m * rank) per row, where m is the number of rows appended.
 	"""
 
-	matrix_a_elements = matrix_a.elements()
-	matrix_b_elements = matrix_b.elements()
+	def __init__(self, columns, tolerance=DEFAULT_TOLERANCE, numeric=None):
+		"""
+			:param columns: Integer. Length of the rows to append
+			:param tolerance: Float. Entries whose magnitude rounds to zero at this tolerance are taken as zeros
+			:param numeric: Optional numeric backend ('float', 'decimal', 'fraction'). Defaults to float
+		"""
 
-	try:
-		assert matrix_a.rows == matrix_b.rows and matrix_a.cols == matrix_b.cols and len(matrix_a_elements) == len(matrix_b_elements)
-	except AssertionError:
-		if not matrix_a.rows == matrix_b.rows:
-			raise Exception("The number of rows on both matrices are not equal")
-		elif not matrix_a.cols == matrix_b.cols:
-			raise Exception("The number of columns on both matrices are not equal")
-		else:
-			raise Exception("The number of elements on both matrices are not equal")
-	else:
-		if tolerance is not None:
-			try:
-				for i in range(len(matrix_a_elements)):
-					assert abs(matrix_a_elements[i] - matrix_b_elements[i]) <= tolerance
-			except AssertionError:
-				raise Exception("Values differ between matrices")
-			else:
-				return True
+		super(IncrementalEchelon, self).__init__()
+
+		self.cols = columns
+		self.rows = 0
+		self.tolerance = tolerance
+		self.numeric = Matrix.get_numeric(numeric if numeric is not None else 'float')
+		self.pivots = []
+		self.__basis = []
+		self.__combinations = []
+		self.__dependencies = []
+
+	@property
+	def rank(self):
+		return len(self.pivots)
+
+	def __values(self, row, length, name):
+		if hasattr(row, 'cols'):
+			row = (row if row.numeric is self.numeric else row.converted(self.numeric)).elements()
+
+		try:
+			assert len(row) == length
+		except AssertionError:
+			raise Exception("Expected %s with %i elements, got %i instead. Exiting..." % (name, length, len(row)))
+
+		store = self.numeric.store
+
+		return list(row) if store is None else [store(e) for e in row]
+
+	def __reduce(self, values, combination):
+		"""
+		Subtracts from values (and from its combination of appended rows) every basis row times the entry of values at
+		the row\'s pivot column, which leaves values with zeros at every pivot column.
+		"""
+
+		for pivot, basis_row, basis_combination in zip(self.pivots, self.__basis, self.__combinations):
+			factor = values[pivot]
+
+			if factor != 0:
+				values = [a - factor * b for a, b in zip(values, basis_row)]
+				combination[:len(basis_combination)] = [a - factor * b for a, b in zip(combination, basis_combination)]
+
+		return values
+
+	def append(self, row):
+		"""
+		Appends a row to the system.
+
+			:param row: 1 x n Matrix instance, or a list or tuple of n numbers
+
+			:return: Boolean. True when the row raised the rank, False when it depends on the rows appended before
+
+			:raise: Exception
+		"""
+
+		values = self.__values(row, self.cols, 'a row')
+		zero = self.numeric.coerce(0)
+		combination = [zero] * self.rows + [self.numeric.coerce(1)]
+		values = self.__reduce(values, combination)
+		self.rows += 1
+
+		for pivot, value in enumerate(values):
+			if not _is_zero(value, self.tolerance):
+				break
 		else:
-			return matrix_a_elements == matrix_b_elements
+			self.__dependencies.append(combination)
+			return False
 
-def matrix_scalar_prod( matrix, scalar ):
-	return Matrix.Matrix( matrix.rows, matrix.cols, [ e * scalar for e in matrix.elements() ] )
+		inverse = 1 / value
+		values = [e * inverse for e in values]
+		combination = [e * inverse for e in combination]
 
+		''' Clear the new pivot column from the basis rows, so the basis stays fully reduced '''
+		for bi, basis_row in enumerate(self.__basis):
+			factor = basis_row[pivot]
 
-def matrix_add( matrix_a, matrix_b ):
-	try:
-		assert is_matrix_addition_defined( matrix_a, matrix_b )
-	except AssertionError:
-		raise Exception("Matrix addition is not defined for matrices A(%ix%i) and B(%ix%i)" % (matrix_a.rows, matrix_a.cols, matrix_b.rows, matrix_b.cols) )
+			if factor != 0:
+				self.__basis[bi] = [a - factor * b for a, b in zip(basis_row, values)]
+				basis_combination = self.__combinations[bi]
+				basis_combination = basis_combination + [zero] * (len(combination) - len(basis_combination))
+				self.__combinations[bi] = [a - factor * b for a, b in zip(basis_combination, combination)]
 
-	elements = []
-	rows = matrix_a.rows
-	cols = matrix_a.cols
+		self.pivots.append(pivot)
+		self.__basis.append(values)
+		self.__combinations.append(combination)
 
-	[ [ elements.append( matrix_a.get(ri, ci) + matrix_b.get( ri, ci ) ) for ri in range( matrix_a.rows ) ] for ci in range( matrix_a.cols ) ]
+		return True
 
-	return Matrix.Matrix( rows, cols, elements )
+	def extend(self, matrix):
+		"""
+		Appends every row of the matrix received as argument, in order.
 
+			:param matrix: Matrix instance with n columns
 
-def matrix_prod( matrix_a, matrix_b ):
-	try:
-		assert is_matrix_prod_defined( matrix_a, matrix_b )
-	except AssertionError:
-		raise Exception( "Matrix product for matrices A(%ix%i) and B(%ix%i) is not defined" )
+			:return: Integer. Number of rows that raised the rank
+		"""
 
-	elements = []
+		return sum(1 for ri in range(matrix.rows) if self.append(list(matrix.row_view(ri))))
 
-	for a_ri in range( matrix_a.rows ):
-		for b_ci in range( matrix_b.cols ):
-			t = 0.0
+	def in_row_space(self, k):
+		"""
+		Finds whether k is a combination of the rows appended, in O(n * rank + m * rank).
 
-			for a_ci in range( matrix_a.cols ):
-				t += matrix_a.get( a_ri, a_ci ) * matrix_b.get( a_ci, b_ci )
+			:param k: 1 x n Matrix instance, or a list or tuple of n numbers
 
-			elements.append( t )
+			:return: Tuple (True, 1 x m Matrix y with y * A = k), or (False, None)
+		"""
 
-	return Matrix.Matrix( matrix_a.rows, matrix_b.cols, elements )
+		values = self.__values(k, self.cols, 'k')
+		zero = self.numeric.coerce(0)
+		combination = [zero] * self.rows
 
+		for pivot, basis_combination in zip(self.pivots, self.__combinations):
+			factor = values[pivot]
 
-def matrix_transpose( matrix ):
-	elements = []
+			if factor != 0:
+				combination[:len(basis_combination)] = [a + factor * b for a, b in zip(combination, basis_combination)]
 
-	[ [ elements.append( matrix.get( ri, ci ) ) for ri in range( matrix.rows ) ] for ci in range( matrix.cols ) ]
+		residual = self.__reduce(values, [zero] * self.rows)
 
-	return Matrix.Matrix( matrix.cols, matrix.rows, elements )
+		for value in residual:
+			if not _is_zero(value, self.tolerance):
+				return False, None
 
+		return True, Matrix.Matrix(1, self.rows, combination, numeric=self.numeric)
 
-def matrix_augment( matrix_a, matrix_b ):
-	try:
-		assert matrix_a.rows == matrix_b.rows
-	except AssertionError:
-		raise Exception( "The number of rows of both matrices are not equal: A(%ix%i) B(%ix%i)" % ( matrix_a.rows, matrix_a.cols, matrix_b.rows, matrix_b.cols ) )
+	def in_column_space(self, k):
+		"""
+		Finds whether A * x = k has a solution, where A holds the rows appended, in O(m * m).
 
-	elements = []
+			:param k: m x 1 Matrix instance, or a list or tuple of m numbers, where m = # of rows appended
 
-	for ri in range( matrix_a.rows ):
-		[ elements.append(e) for e in matrix_a.row(ri) ]
-		[ elements.append(e) for e in matrix_b.row(ri) ]
+			:return: Tuple (True, n x 1 Matrix x with A * x = k), or (False, None)
+		"""
 
-	return Matrix.Matrix( matrix_a.rows, matrix_a.cols + matrix_b.cols, elements )
+		values = self.__values(k, self.rows, 'k')
 
+		for dependency in self.__dependencies:
+			if not _is_zero(sum(map(mul, dependency, values)), self.tolerance):
+				return False, None
 
-def matrix_identity( order ):
-	identity = Matrix.Matrix( order, order, [0.0 for i in range( order * order )] )
+		''' Free columns are set to 0; every pivot column takes the combination of k that made its basis row '''
+		x = [self.numeric.coerce(0)] * self.cols
 
-	for ri in range( identity.rows ):
-		identity.set( ri, ri, 1.0)
+		for pivot, basis_combination in zip(self.pivots, self.__combinations):
+			x[pivot] = sum(map(mul, basis_combination, values))
 
-	return identity
+		return True, Matrix.Matrix(self.cols, 1, x, numeric=self.numeric)
 
+	def rref(self):
+		"""
+		:return: m x n Matrix instance. The row-reduced-echelon form of the rows appended
+		"""
 
-def matrix_inverse( matrix ):
-	try:
-		assert has_inverse( matrix )
-	except AssertionError:
-		raise Exception( "The %ix%i matrix received does\'nt have an inverse. Exiting..." % ( matrix.rows, matrix.cols ) )
+		zero = self.numeric.coerce(0)
+		ordered = sorted(zip(self.pivots, self.__basis))
+		elements = [e for __, row in ordered for e in row]
+		elements.extend([zero] * ((self.rows - len(ordered)) * self.cols))
 
-	rref_matrix 	= row_reduced_echelon( matrix_augment( matrix, matrix_identity( matrix.rows ) ) )
-	inv_matrix 		= Matrix.Matrix( matrix.rows, matrix.cols )
+		return Matrix.Matrix(self.rows, self.cols, elements, numeric=self.numeric)
 
-	[ [ inv_matrix.set( ri - matrix.rows, ci - matrix.cols, rref_matrix.get(ri, ci) ) for ci in range( matrix.cols, rref_matrix.cols ) ] for ri in range( rref_matrix.rows ) ]
+	def row_equivalent(self, matrix):
+		"""
+		Same as row_equivalence(A, matrix), where A holds the rows appended, without reducing A again.
 
-	return inv_matrix
+			:param matrix: Matrix instance
+
+			:return: Boolean
+		"""
+
+		if matrix.rows != self.rows or matrix.cols != self.cols:
+			return False
+
+		return matrix_equality(self.rref(), matrix, tolerance=self.tolerance)
+
+
+def elementary_column_operation_1(matrix, col_i_index, col_j_index):
+	"""
+	Performs an elementary row operation (ERO) of type I: Column i and column j are interchanged
+
+		:param matrix: Matrix instance
+		:param col_i_index: Integer
+		:param col_j_index: Integer
+
+		:return: Matrix instance
+
+		:raise: IndexError
+	"""
+
+	matrix_cp = matrix.copy()
+	matrix_cp.col_view(col_i_index).swap(matrix_cp.col_view(col_j_index))
+
+	return matrix_cp
+
+
+def elementary_column_operation_2(matrix, col_index, scalar):
+	"""
+	Performs an elementary column operation (ECO) of type II: Column i is multiplied by scalar (scalar != 0 ).
+
+		:param matrix: Matrix instance
+		:param col_index: Integer
+		:param scalar: Float
+
+		:return: Matrix instance
+
+		:raise: ValueError
+	"""
+
+	scalar = matrix.coerce(scalar)
+
+	'''try:
+		assert not scalar == 0.0
+	except AssertionError:
+		raise ValueError("Scalar must be greater or less but not equal to 0. Exiting...")'''
+
+	matrix_cp = matrix.copy()
+	matrix_cp.col_view(col_index).scale(scalar)
+
+	return matrix_cp
+
+
+def elementary_column_operation_3(matrix, col_i_index, col_j_index, scalar_k):
+	"""
+	Performs an elementary column operation (ECO) of type III: Column j is replaced by itself plus k times Column i
+
+		:param matrix: Matrix instance
+		:param col_i_index: Integer
+		:param col_j_index: Integer
+		:param scalar_k: Float
+
+		:return: Matrix instance
+
+		:raise: ValueError
+	"""
+
+	matrix_cp = matrix.copy()
+	matrix_cp.col_view(col_j_index).add_scaled(matrix_cp.col_view(col_i_index), scalar_k)
+
+	return matrix_cp
+
+
+def column_reduced_echelon(matrix, tolerance=DEFAULT_TOLERANCE, numeric=None):
+	"""
+	Finds the column-reduced-echelon form for the matrix received as argument: the same elimination as
+	row_reduced_echelon, run over the matrix\'s columns.
+
+		:param matrix: Matrix instance
+		:param numeric: Optional numeric backend ('float', 'decimal', 'fraction') to column reduce in. Defaults to the
+				matrix\'s own
+		:return: Matrix instance
+	"""
+	matrix = _with_numeric(matrix, numeric)
+	cols = _matrix_cols(matrix)
+
+	_gauss_jordan(cols, matrix.rows, tolerance)
+
+	return Matrix.Matrix(matrix.rows, matrix.cols, [col[ri] for ri in range(matrix.rows) for col in cols],
+	                     numeric=matrix.numeric)
+
+
+def has_inverse(matrix, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Only square matrices can have an inverse but not all square matrices have an inverse. A matrix is singular when a
+	pivot of its LU factorization rounds to zero at tolerance, whatever its order (see Fixed_Size_Utils.is_singular for
+	the 3x3 and 4x4 ones), the same test matrix_inverse and try_inverse apply.
+
+		:param matrix: Matrix instance
+		:param tolerance: Float
+
+		:return: Boolean
+	"""
+
+	if getattr(matrix, 'frozen', False):
+		return _memoized('has_inverse', matrix, lambda: has_inverse(matrix.copy(), tolerance), tolerance)
+
+	order = _fixed_order(matrix)
+
+	if order is not None:
+		elements = matrix.elements()
+
+		return not fsu.is_singular(elements, order, fsu.DETERMINANTS[order](elements), tolerance)
+
+	if matrix.rows != matrix.cols:
+		''' Matrix has to be square to proceed...'''
+		return False
+
+	return not LUFactorization(matrix, tolerance).singular
+
+
+def matrix_rank(matrix, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Counts the pivots of the row-reduced-echelon form of the matrix received as argument.
+
+		:param matrix: Matrix instance, or a RowReduction of it to share a single elimination with other calls
+		:param tolerance: Float
+
+		:return: Integer
+	"""
+
+	return row_reduction(matrix, tolerance).rank
+
+
+def matrix_determinant(matrix):
+	"""
+	Computes the determinant of a square matrix from its LU factorization (unrolled for 3x3 and 4x4 float matrices).
+
+		:param matrix: Matrix instance, or its LUFactorization to reuse it
+
+		:return: Float, Decimal or Fraction
+
+		:raise: Exception
+	"""
+
+	if isinstance(matrix, LUFactorization):
+		return matrix.determinant()
+
+	if getattr(matrix, 'frozen', False):
+		return _memoized('determinant', matrix, lambda: matrix_determinant(matrix.copy()))
+
+	try:
+		assert matrix.rows == matrix.cols
+	except AssertionError:
+		raise Exception("The determinant is only defined for square matrices, got a %ix%i one. Exiting..." % (matrix.rows, matrix.cols))
+
+	order = _fixed_order(matrix)
+
+	if order is not None:
+		return fsu.DETERMINANTS[order](matrix.elements())
+
+	return LUFactorization(matrix, tolerance=0.0).determinant()
+
+
+def matrix_log_abs_determinant(matrix, tolerance=0.0):
+	"""
+	Computes the natural logarithm of the magnitude of the determinant from an LU factorization, without over or
+	underflowing when the determinant itself would (see LUFactorization.log_abs_determinant).
+
+		:param matrix: Square Matrix instance, or its LUFactorization to reuse it
+		:param tolerance: Float. Pivots whose magnitude rounds to zero at this tolerance make the matrix singular
+
+		:return: Float (-inf for singular matrices)
+
+		:raise: Exception
+	"""
+
+	if not isinstance(matrix, LUFactorization):
+		matrix = lu_factorization(matrix, tolerance)
+
+	return matrix.log_abs_determinant()
+
+
+def matrix_condition_estimate(matrix, tolerance=0.0):
+	"""
+	Estimates the 1-norm condition number of a square matrix from an LU factorization, in O(n^2) once factored (see
+	LUFactorization.condition_estimate). Large values warn that solutions and inverses of the matrix lose about
+	log10(condition) significant digits.
+
+		:param matrix: Square Matrix instance, or its LUFactorization to reuse it
+		:param tolerance: Float. Pivots whose magnitude rounds to zero at this tolerance make the matrix singular. The
+				default only takes exact zeros, so nearly singular matrices get a (large) estimate instead of inf
+
+		:return: Float (inf for singular matrices)
+
+		:raise: Exception
+	"""
+
+	if not isinstance(matrix, LUFactorization):
+		matrix = lu_factorization(matrix, tolerance)
+
+	return matrix.condition_estimate()
+
+
+def _lu_substitute(lu, permutation, values):
+	"""
+	Forward and backward substitution of a single right-hand side through the rows of an LU factorization (see
+	LUFactorization), one dot product per row.
+	"""
+
+	n = len(lu)
+	y = []
+
+	for i, p in enumerate(permutation):
+		''' map stops at the shortest sequence, i.e. at the i elements of y solved so far '''
+		y.append(values[p] - sum(map(mul, lu[i], y)))
+
+	x = [0] * n
+
+	for i in range(n - 1, -1, -1):
+		row = lu[i]
+		x[i] = (y[i] - sum(map(mul, row[i + 1:], x[i + 1:]))) / row[i]
+
+	return x
+
+
+class LUFactorization(object):
+	"""
+	LU factorization with partial pivoting, P * A = L * U, of a square matrix: L is unit lower triangular, U is upper
+	triangular and P permutes the rows of A so every pivot is the largest remaining entry of its column. Both factors
+	share a single buffer (L below the diagonal, U on and above it).
+
+	Factoring costs O(n^3) once; every right-hand side solved afterwards costs O(n^2) (forward substitution through L,
+	backward substitution through U), so the factorization is worth keeping when solving the same system many times.
+
+	The arithmetic follows the numeric backend of the matrix factored. Exact backends are rounded once, when results
+	are stored.
+	"""
+
+	''' solve_many substitutes whole rows of the right-hand sides up to this order and column by column above it '''
+	row_substitution_order = 16
+
+	def __init__(self, matrix, tolerance=DEFAULT_TOLERANCE):
+		"""
+			:param matrix: Square Matrix instance
+			:param tolerance: Float. Pivots whose magnitude rounds to zero at this tolerance make the matrix singular
+
+			:raise: Exception
+		"""
+
+		super(LUFactorization, self).__init__()
+
+		try:
+			assert matrix.rows == matrix.cols
+		except AssertionError:
+			raise Exception("LU factorization is only defined for square matrices, got a %ix%i one. Exiting..." % (matrix.rows, matrix.cols))
+
+		n = matrix.rows
+		lu = _matrix_rows(matrix)
+		''' The 1-norm (largest column sum of magnitudes) of the matrix, for condition_estimate '''
+		norm = max([sum(abs(row[ci]) for row in lu) for ci in range(n)] or [0])
+		permutation = list(range(n))
+		sign = 1
+		singular = False
+
+		for k in range(n):
+			p = max(range(k, n), key=lambda ri: abs(lu[ri][k]))
+
+			if _is_zero(lu[p][k], tolerance):
+				singular = True
+				continue
+
+			if p != k:
+				lu[k], lu[p] = lu[p], lu[k]
+				permutation[k], permutation[p] = permutation[p], permutation[k]
+				sign = -sign
+
+			pivot_row = lu[k]
+			tail = pivot_row[k + 1:]
+			inverse = 1 / pivot_row[k]
+
+			for ri in range(k + 1, n):
+				row = lu[ri]
+				factor = row[k] * inverse
+				row[k] = factor
+
+				if factor != 0:
+					row[k + 1:] = [a - factor * b for a, b in zip(row[k + 1:], tail)]
+
+		self.order = n
+		self.numeric = matrix.numeric
+		self.permutation = permutation
+		self.singular = singular
+		self.__sign = sign
+		self.__norm = norm
+		self.__lu = lu
+
+	def __check_solvable(self, rows):
+		if self.singular:
+			raise Exception("The %ix%i matrix factored is singular: the system has no unique solution. Exiting..." % (self.order, self.order))
+
+		try:
+			assert rows == self.order
+		except AssertionError:
+			raise Exception("Expected a right-hand side with %i rows, got %i instead. Exiting..." % (self.order, rows))
+
+	def lower(self):
+		"""
+		:return: Matrix instance. The unit lower triangular factor L
+		"""
+
+		n = self.order
+		lu = self.__lu
+		one = self.numeric.coerce(1)
+		zero = self.numeric.coerce(0)
+
+		return Matrix.Matrix(n, n, [lu[ri][ci] if ci < ri else (one if ci == ri else zero) for ri in range(n) for ci in range(n)],
+		                     numeric=self.numeric)
+
+	def upper(self):
+		"""
+		:return: Matrix instance. The upper triangular factor U
+		"""
+
+		n = self.order
+		lu = self.__lu
+		zero = self.numeric.coerce(0)
+
+		return Matrix.Matrix(n, n, [lu[ri][ci] if ci >= ri else zero for ri in range(n) for ci in range(n)],
+		                     numeric=self.numeric)
+
+	def solve(self, b):
+		"""
+		Solves A * x = b.
+
+			:param b: n x 1 Matrix instance, or a list or tuple of n numbers
+			:return: n x 1 Matrix instance, or a list of n numbers when b is a list or tuple
+
+			:raise: Exception
+		"""
+
+		numeric = self.numeric
+		store = numeric.store
+
+		if hasattr(b, 'cols'):
+			try:
+				assert b.cols == 1
+			except AssertionError:
+				raise Exception("Expected a %ix1 right-hand side, got a %ix%i one. Use solve_many instead. Exiting..." % (self.order, b.rows, b.cols))
+
+			values = (b if b.numeric is numeric else b.converted(numeric)).elements()
+		else:
+			values = b if store is None else [store(e) for e in b]
+
+		self.__check_solvable(len(values))
+
+		x = _lu_substitute(self.__lu, self.permutation, values)
+
+		if hasattr(b, 'cols'):
+			return Matrix.Matrix(self.order, 1, x, numeric=numeric)
+
+		return x if store is None else [store(e) for e in x]
+
+	def solve_many(self, b, executor=None):
+		"""
+		Solves A * X = B for every column of B at once, in O(n^2) per column. Small systems substitute whole rows of B
+		at a time (one loop per pair of rows instead of one per column); larger ones substitute column by column, where
+		every step is a single dot product.
+
+			:param b: n x k Matrix instance
+			:param executor: Optional Parallel_Utils.ParallelExecutor instance. Float systems are then solved in blocks
+					of columns of B by its worker processes
+			:return: n x k Matrix instance
+
+			:raise: Exception
+		"""
+
+		self.__check_solvable(b.rows)
+
+		numeric = self.numeric
+		n = self.order
+		b = b if b.numeric is numeric else b.converted(numeric)
+
+		if executor is not None and not numeric.exact:
+			return executor.substitution(self.__lu, self.permutation, b)
+
+		if n > self.row_substitution_order:
+			elements = b.elements()
+			cols = [_lu_substitute(self.__lu, self.permutation, elements[ci::b.cols]) for ci in range(b.cols)]
+
+			return Matrix.Matrix(n, b.cols, [col[ri] for ri in range(n) for col in cols], numeric=numeric)
+
+		rows = _matrix_rows(b)
+		lu = self.__lu
+		y = []
+
+		for i, p in enumerate(self.permutation):
+			row = rows[p]
+
+			for j in range(i):
+				factor = lu[i][j]
+
+				if factor != 0:
+					row = [a - factor * e for a, e in zip(row, y[j])]
+
+			y.append(row)
+
+		for i in range(n - 1, -1, -1):
+			row = y[i]
+
+			for j in range(i + 1, n):
+				factor = lu[i][j]
+
+				if factor != 0:
+					row = [a - factor * e for a, e in zip(row, y[j])]
+
+			pivot = lu[i][i]
+			y[i] = [e / pivot for e in row]
+
+		return Matrix.Matrix(n, b.cols, [e for row in y for e in row], numeric=numeric)
+
+	def determinant(self):
+		"""
+		:return: Float, Decimal or Fraction. The product of the pivots, with the sign of the row permutation
+		"""
+
+		if self.singular:
+			return self.numeric.coerce(0)
+
+		determinant = self.__sign
+
+		for i in range(self.order):
+			determinant *= self.__lu[i][i]
+
+		return self.numeric.coerce(determinant)
+
+	def determinant_sign(self):
+		"""
+		:return: Integer. -1, 0 or 1, the sign of the determinant, even when the determinant itself over or underflows
+		"""
+
+		if self.singular:
+			return 0
+
+		sign = self.__sign
+
+		for i in range(self.order):
+			if self.__lu[i][i] < 0:
+				sign = -sign
+
+		return sign
+
+	def log_abs_determinant(self):
+		"""
+		Sums the logarithms of the pivots instead of multiplying them, so the result neither overflows nor underflows for
+		large matrices, e.g. when comparing the volumes of many-dimensional systems or likelihoods.
+
+			:return: Float. The natural logarithm of the magnitude of the determinant (-inf when the matrix is singular)
+		"""
+
+		if self.singular:
+			return float('-inf')
+
+		return math.fsum(math.log(abs(self.__lu[i][i])) for i in range(self.order))
+
+	def __solve_transposed(self, lu, values):
+		"""
+		Solves At * x = b through the factors lu: P * A = L * U gives At = Ut * Lt * P, so Ut * w = b is solved by
+		forward substitution, Lt * v = w by backward substitution, and x is v permuted back.
+		"""
+
+		n = self.order
+		w = []
+
+		for i in range(n):
+			w.append((values[i] - sum(lu[j][i] * w[j] for j in range(i))) / lu[i][i])
+
+		v = [0] * n
+
+		for i in range(n - 1, -1, -1):
+			v[i] = w[i] - sum(lu[j][i] * v[j] for j in range(i + 1, n))
+
+		x = [0] * n
+
+		for i, p in enumerate(self.permutation):
+			x[p] = v[i]
+
+		return x
+
+	def condition_estimate(self):
+		"""
+		Estimates the 1-norm condition number, norm(A) * norm(A^-1), without computing A^-1: norm(A^-1) is estimated by
+		Hager\'s method (as refined by Higham), which maximizes norm(A^-1 * x) over a few x chosen with solves by A and
+		At through the factors. Every step costs O(n^2), so the estimate is O(n^2) on top of the factorization. The
+		estimate is a lower bound, and usually within a factor of 3 of the exact value.
+
+			:return: Float. inf when the matrix is singular
+		"""
+
+		if self.singular:
+			return float('inf')
+
+		n = self.order
+		''' The estimate is a float whatever the backend, so exact factors are copied to floats once '''
+		lu = [[float(e) for e in row] for row in self.__lu]
+		permutation = self.permutation
+		x = [1.0 / n] * n
+		estimate = 0.0
+		previous = None
+
+		for __ in range(5):
+			y = _lu_substitute(lu, permutation, x)
+			estimate = sum(abs(e) for e in y)
+			signs = [1.0 if e >= 0 else -1.0 for e in y]
+
+			if signs == previous:
+				break
+
+			z = self.__solve_transposed(lu, signs)
+			j = max(range(n), key=lambda i: abs(z[i]))
+
+			if abs(z[j]) <= sum(map(mul, z, x)):
+				break
+
+			x = [0.0] * n
+			x[j] = 1.0
+			previous = signs
+
+		''' Higham\'s alternating vector catches the matrices where the iteration above stops too early '''
+		alternating = [(-1) ** i * (1.0 + i / float(max(1, n - 1))) for i in range(n)]
+		estimate = max(estimate, 2.0 * sum(abs(e) for e in _lu_substitute(lu, permutation, alternating)) / (3.0 * n))
+
+		return float(self.__norm) * estimate
+
+	def inverse(self):
+		"""
+		:return: Matrix instance. The inverse of the matrix factored, solved against the identity
+
+		:raise: Exception
+		"""
+
+		return self.solve_many(matrix_identity(self.order, numeric=self.numeric))
+
+
+def lu_factorization(matrix, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Factors the matrix received as argument. The factorization of frozen matrices is memoized, so it is only computed
+	once per matrix.
+
+		:param matrix: Square Matrix instance
+		:param tolerance: Float
+
+		:return: LUFactorization instance
+
+		:raise: Exception
+	"""
+
+	if getattr(matrix, 'frozen', False):
+		return _memoized('lu_factorization', matrix, lambda: LUFactorization(matrix, tolerance), tolerance)
+
+	return LUFactorization(matrix, tolerance)
+
+
+class QRFactorization(object):
+	"""
+	Householder QR factorization, A = Q * R, of a matrix with at least as many rows (m) as columns (n): Q has n
+	orthonormal columns and R is n x n upper triangular. Q is never formed; the n Householder reflections that make it
+	are kept and applied to every right-hand side instead.
+
+	Least-squares solutions (see solve and lstsq) come from R * x = Qt * b, so the normal equations At * A * x = At * b
+	are never formed: their condition number is the square of A\'s, which loses half the significant digits on the
+	tall, nearly dependent systems of noisy fits. Factoring costs O(m * n^2) once; every right-hand side solved
+	afterwards costs O(m * n).
+
+	Reflections need square roots, so exact matrices are factored as floats.
+	"""
+
+	def __init__(self, matrix, tolerance=DEFAULT_TOLERANCE):
+		"""
+			:param matrix: Matrix instance with rows >= columns
+			:param tolerance: Float. Diagonal entries of R at most tolerance times the largest column norm of the
+					matrix make it rank deficient, so the test doesn't depend on the scale of the matrix
+
+			:raise: Exception
+		"""
+
+		super(QRFactorization, self).__init__()
+
+		try:
+			assert matrix.rows >= matrix.cols
+		except AssertionError:
+			raise Exception("QR factorization expects at least as many rows as columns, got a %ix%i matrix. Exiting..." % (matrix.rows, matrix.cols))
+
+		if matrix.exact:
+			matrix = matrix.converted('float')
+
+		m = matrix.rows
+		n = matrix.cols
+		cols = _matrix_cols(matrix)
+		reflections = []
+		rank_deficient = False
+		threshold = tolerance * max([math.sqrt(sum(map(mul, col, col))) for col in cols] + [0.0])
+
+		for k in range(n):
+			x = cols[k][k:]
+			norm = math.sqrt(sum(map(mul, x, x)))
+
+			if norm == 0.0:
+				''' Nothing to reflect: the column is already zero below the diagonal '''
+				reflections.append(None)
+				rank_deficient = True
+				continue
+
+			alpha = -math.copysign(norm, x[0])
+			v = x
+			v[0] -= alpha
+			beta = 2.0 / sum(map(mul, v, v))
+			reflections.append((v, beta))
+
+			for j in range(k + 1, n):
+				col = cols[j]
+				factor = beta * sum(map(mul, v, col[k:]))
+
+				if factor != 0.0:
+					col[k:] = [a - factor * b for a, b in zip(col[k:], v)]
+
+			cols[k][k:] = [alpha] + [0.0] * (m - k - 1)
+
+			if abs(alpha) <= threshold:
+				rank_deficient = True
+
+		self.rows = m
+		self.cols = n
+		self.rank_deficient = rank_deficient
+		self.__reflections = reflections
+		''' Rows of R, taken from the upper triangle of the reduced columns '''
+		self.__r = [[cols[j][i] for j in range(i, n)] for i in range(n)]
+
+	def r(self):
+		"""
+		:return: n x n Matrix instance. The upper triangular factor R
+		"""
+
+		n = self.cols
+
+		return Matrix.Matrix(n, n, [self.__r[i][j - i] if j >= i else 0.0 for i in range(n) for j in range(n)])
+
+	def q(self):
+		"""
+		:return: m x n Matrix instance. The first n columns of Q, with orthonormal columns
+		"""
+
+		m = self.rows
+		n = self.cols
+		cols = []
+
+		for j in range(n):
+			col = [0.0] * m
+			col[j] = 1.0
+			cols.append(self.__apply(col, reverse=True))
+
+		return Matrix.Matrix(m, n, [col[i] for i in range(m) for col in cols])
+
+	def __apply(self, values, reverse=False):
+		"""
+		Applies the reflections of Qt (or, reversed, of Q) to a column of m values, in place.
+		"""
+
+		reflections = list(enumerate(self.__reflections))
+
+		if reverse:
+			reflections.reverse()
+
+		for k, reflection in reflections:
+			if reflection is None:
+				continue
+
+			v, beta = reflection
+			factor = beta * sum(map(mul, v, values[k:]))
+
+			if factor != 0.0:
+				values[k:] = [a - factor * b for a, b in zip(values[k:], v)]
+
+		return values
+
+	def __check_solvable(self, rows):
+		if self.rank_deficient:
+			raise Exception("The %ix%i matrix factored is rank deficient: the least-squares solution is not unique. Exiting..." % (self.rows, self.cols))
+
+		try:
+			assert rows == self.rows
+		except AssertionError:
+			raise Exception("Expected a right-hand side with %i rows, got %i instead. Exiting..." % (self.rows, rows))
+
+	def __solve_column(self, values):
+		"""
+		Returns the least-squares solution of a single right-hand side and its residual norm.
+		"""
+
+		qtb = self.__apply([float(e) for e in values])
+		r = self.__r
+		n = self.cols
+		x = [0.0] * n
+
+		for i in range(n - 1, -1, -1):
+			row = r[i]
+			x[i] = (qtb[i] - sum(map(mul, row[1:], x[i + 1:]))) / row[0]
+
+		''' The last m - n entries of Qt * b are the part of b outside the column space of A '''
+		residual = qtb[n:]
+
+		return x, math.sqrt(sum(map(mul, residual, residual)))
+
+	def solve(self, b, residuals=False):
+		"""
+		Finds the x minimizing the norm of A * x - b, for every column of b at once.
+
+			:param b: m x k Matrix instance, or a list or tuple of m numbers
+			:param residuals: Boolean. When True, the norm of A * x - b of every column is returned as well
+
+			:return: n x k Matrix instance (a list of n numbers when b is a list or tuple), or a tuple with it and the
+					list of residual norms when residuals is True
+
+			:raise: Exception
+		"""
+
+		if hasattr(b, 'cols'):
+			self.__check_solvable(b.rows)
+
+			elements = b.elements()
+			solutions = [self.__solve_column(elements[ci::b.cols]) for ci in range(b.cols)]
+			x = Matrix.Matrix(self.cols, b.cols, [solution[0][ri] for ri in range(self.cols) for solution in solutions])
+		else:
+			self.__check_solvable(len(b))
+
+			solutions = [self.__solve_column(b)]
+			x = solutions[0][0]
+
+		if residuals:
+			return x, [solution[1] for solution in solutions]
+
+		return x
+
+
+def qr_factorization(matrix, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Factors the matrix received as argument. The factorization of frozen matrices is memoized, so it is only computed
+	once per matrix.
+
+		:param matrix: Matrix instance with rows >= columns
+		:param tolerance: Float
+
+		:return: QRFactorization instance
+
+		:raise: Exception
+	"""
+
+	if getattr(matrix, 'frozen', False):
+		return _memoized('qr_factorization', matrix, lambda: QRFactorization(matrix, tolerance), tolerance)
+
+	return QRFactorization(matrix, tolerance)
+
+
+def lstsq(matrix, b, tolerance=DEFAULT_TOLERANCE, residuals=False):
+	"""
+	Least-squares solution of matrix * x = b through a Householder QR factorization, e.g. the transform best fitting a
+	set of noisy point correspondences. Every column of b is solved at once.
+
+		:param matrix: Matrix instance with rows >= columns, or its QRFactorization to reuse it across calls
+		:param b: m x k Matrix instance, or a list or tuple of m numbers
+		:param tolerance: Float
+		:param residuals: Boolean. When True, the norm of matrix * x - b of every column is returned as well
+
+		:return: n x k Matrix instance (a list of n numbers when b is a list or tuple), or a tuple with it and the list
+				of residual norms when residuals is True
+
+		:raise: Exception
+	"""
+
+	if not isinstance(matrix, QRFactorization):
+		matrix = qr_factorization(matrix, tolerance)
+
+	return matrix.solve(b, residuals=residuals)
+
+
+def matrix_equality(matrix_a, matrix_b, tolerance=None):
+	"""
+	Compares both matrices and weighs weather they are equal.
+
+		:param matrix_a: Matrix instance
+		:param matrix_b: Matrix instance
+
+		:return: Boolean
+
+		:raise: Exception
+	"""
+
+	matrix_a, matrix_b = _match_numeric(matrix_a, matrix_b)
+	matrix_a_elements = matrix_a.elements()
+	matrix_b_elements = matrix_b.elements()
+
+	if tolerance is None and not matrix_a.exact:
+		''' Float matrices are not rounded when stored, so the tolerance is applied here instead '''
+		tolerance = Matrix.Matrix.tolerance()
+
+	try:
+		assert matrix_a.rows == matrix_b.rows and matrix_a.cols == matrix_b.cols and len(matrix_a_elements) == len(matrix_b_elements)
+	except AssertionError:
+		if not matrix_a.rows == matrix_b.rows:
+			raise Exception("The number of rows on both matrices are not equal")
+		elif not matrix_a.cols == matrix_b.cols:
+			raise Exception("The number of columns on both matrices are not equal")
+		else:
+			raise Exception("The number of elements on both matrices are not equal")
+	else:
+		if tolerance is not None:
+			try:
+				for i in range(len(matrix_a_elements)):
+					assert abs(matrix_a_elements[i] - matrix_b_elements[i]) <= tolerance
+			except AssertionError:
+				raise Exception("Values differ between matrices")
+			else:
+				return True
+		else:
+			return matrix_a_elements == matrix_b_elements
+
+def _check_out(out, rows, cols):
+	if getattr(out, 'frozen', False):
+		raise Exception(Matrix.FROZEN_MESSAGE)
+
+	try:
+		assert out.rows == rows and out.cols == cols
+	except AssertionError:
+		raise Exception("Expected an output matrix with dimension %ix%i, got a %ix%i one instead. Exiting..." % (rows, cols, out.rows, out.cols))
+
+	return out
+
+
+def _write_into(out, rows, cols, elements):
+	"""
+	Copies the row-major elements received as argument into the preallocated out matrix, in place.
+
+		:param out: Matrix instance
+		:param rows: Integer. Rows of the result being written
+		:param cols: Integer. Columns of the result being written
+		:param elements: Sequence of numbers
+
+		:return: Matrix instance (out)
+
+		:raise: Exception
+	"""
+
+	_check_out(out, rows, cols)
+
+	if out.exact:
+		return out.set_elements(elements)
+
+	buffer = out.elements()
+
+	for i in range(len(buffer)):
+		buffer[i] = elements[i]
+
+	return out
+
+
+def matrix_scalar_prod(matrix, scalar, out=None):
+	"""
+	Multiplies every element of the matrix by the scalar received as argument.
+
+		:param matrix: Matrix or SparseMatrix instance
+		:param scalar: Integer, float or Decimal
+		:param out: Optional Matrix instance with the same dimension. When provided, the result is written into it and
+				no new matrix is allocated. It can be the matrix itself.
+
+		:return: Matrix instance
+	"""
+
+	if su.is_sparse(matrix):
+		result = su.sparse_scalar_prod(matrix, scalar)
+
+		return result if out is None else _write_into(out, result.rows, result.cols, result.elements())
+
+	scalar = matrix.coerce(scalar)
+
+	if out is not None and not out.exact:
+		_check_out(out, matrix.rows, matrix.cols)
+		elements = matrix.elements()
+		buffer = out.elements()
+
+		for i in range(len(buffer)):
+			buffer[i] = elements[i] * scalar
+
+		return out
+
+	elements = [e * scalar for e in matrix.elements()]
+
+	if out is not None:
+		return _write_into(out, matrix.rows, matrix.cols, elements)
+
+	return Matrix.Matrix(matrix.rows, matrix.cols, elements, numeric=matrix.numeric)
+
+
+def matrix_add(matrix_a, matrix_b, out=None):
+	"""
+	Adds both matrices.
+
+		:param matrix_a: Matrix or SparseMatrix instance
+		:param matrix_b: Matrix or SparseMatrix instance
+		:param out: Optional Matrix instance with the same dimension. When provided, the result is written into it and
+				no new matrix is allocated. It can be one of the operands.
+
+		:return: Matrix or SparseMatrix instance
+
+		:raise: Exception
+	"""
+
+	return _matrix_add(matrix_a, matrix_b, 1, out)
+
+
+def matrix_sub(matrix_a, matrix_b, out=None):
+	"""
+	Subtracts matrix_b from matrix_a.
+
+		:param matrix_a: Matrix or SparseMatrix instance
+		:param matrix_b: Matrix or SparseMatrix instance
+		:param out: Optional Matrix instance with the same dimension. When provided, the result is written into it and
+				no new matrix is allocated. It can be one of the operands.
+
+		:return: Matrix or SparseMatrix instance
+
+		:raise: Exception
+	"""
+
+	return _matrix_add(matrix_a, matrix_b, -1, out)
+
+
+def _matrix_add(matrix_a, matrix_b, sign, out):
+	try:
+		assert is_matrix_addition_defined( matrix_a, matrix_b )
+	except AssertionError:
+		raise Exception("Matrix addition is not defined for matrices A(%ix%i) and B(%ix%i)" % (matrix_a.rows, matrix_a.cols, matrix_b.rows, matrix_b.cols) )
+
+	if su.is_sparse(matrix_a) or su.is_sparse(matrix_b):
+		if sign < 0:
+			matrix_b = matrix_scalar_prod(matrix_b, -1)
+
+		if su.is_sparse(matrix_a):
+			if su.is_sparse(matrix_b):
+				result = su.sparse_add(matrix_a, matrix_b)
+			else:
+				result = su.sparse_dense_add(matrix_a, _match_numeric(matrix_a, matrix_b)[1])
+		else:
+			result = su.sparse_dense_add(matrix_b, _match_numeric(matrix_a, matrix_b)[0])
+
+		return result if out is None else _write_into(out, result.rows, result.cols, result.elements())
+
+	matrix_a, matrix_b = _match_numeric(matrix_a, matrix_b)
+	a_elements = matrix_a.elements()
+	b_elements = matrix_b.elements()
+
+	if out is not None and not out.exact:
+		''' Element-wise, so writing into one of the operands is safe '''
+		_check_out(out, matrix_a.rows, matrix_a.cols)
+		buffer = out.elements()
+
+		if sign > 0:
+			for i in range(len(buffer)):
+				buffer[i] = a_elements[i] + b_elements[i]
+		else:
+			for i in range(len(buffer)):
+				buffer[i] = a_elements[i] - b_elements[i]
+
+		return out
+
+	if sign > 0:
+		elements = [a + b for a, b in zip(a_elements, b_elements)]
+	else:
+		elements = [a - b for a, b in zip(a_elements, b_elements)]
+
+	if out is not None:
+		return _write_into(out, matrix_a.rows, matrix_a.cols, elements)
+
+	return Matrix.Matrix(matrix_a.rows, matrix_a.cols, elements, numeric=matrix_a.numeric)
+
+
+def matrix_prod(matrix_a, matrix_b, out=None, strassen_threshold=None, executor=None):
+	"""
+	Multiplies matrix_a by matrix_b.
+
+		:param matrix_a: Matrix or SparseMatrix instance
+		:param matrix_b: Matrix or SparseMatrix instance
+		:param out: Optional Matrix instance with dimension rows(A) x cols(B). When provided, the result is written into
+				it instead of a new matrix. It can be one of the operands.
+		:param strassen_threshold: Optional integer. Dense products whose dimensions are all at least this big use the
+				Strassen recursion. Defaults to STRASSEN_THRESHOLD; 0 always uses the tiled kernel.
+		:param executor: Optional Parallel_Utils.ParallelExecutor instance. Dense float products are then split in blocks
+				of rows computed by its worker processes
+
+		:return: Matrix or SparseMatrix instance
+
+		:raise: Exception
+	"""
+
+	try:
+		assert is_matrix_prod_defined( matrix_a, matrix_b )
+	except AssertionError:
+		raise Exception("Matrix product for matrices A(%ix%i) and B(%ix%i) is not defined" % (matrix_a.rows, matrix_a.cols, matrix_b.rows, matrix_b.cols))
+
+	order = _fixed_order(matrix_a, matrix_b)
+
+	if order is not None:
+		elements = fsu.PRODUCTS[order](matrix_a.elements(), matrix_b.elements())
+
+		if out is not None:
+			return _write_into(out, order, order, elements)
+
+		return Matrix.Matrix(order, order, elements)
+
+	matrix_a, matrix_b = _match_numeric(matrix_a, matrix_b)
+
+	if su.is_sparse(matrix_a):
+		if su.is_sparse(matrix_b):
+			result = su.sparse_prod(matrix_a, matrix_b)
+		else:
+			result = su.sparse_dense_prod(matrix_a, matrix_b)
+	elif su.is_sparse(matrix_b):
+		result = su.dense_sparse_prod(matrix_a, matrix_b)
+	else:
+		if executor is not None and not matrix_a.exact:
+			result = executor.product(matrix_a, matrix_b)
+		else:
+			result = _dense_matrix_prod(matrix_a, matrix_b, strassen_threshold)
+
+	if out is not None:
+		return _write_into(out, result.rows, result.cols, result.elements())
+
+	return result
+
+
+def _dense_matrix_prod(matrix_a, matrix_b, strassen_threshold=None):
+	"""
+	General product kernel for dense matrices of any dimension sharing the same storage mode. The operands are split
+	into rows of A and columns of B (rows of B transposed), so every element of the result is a single dot product over
+	two contiguous sequences. Large products switch to the Strassen recursion (see _strassen_prod).
+	"""
+
+	if strassen_threshold is None:
+		strassen_threshold = STRASSEN_THRESHOLD
+
+	if min(matrix_a.rows, matrix_a.cols, matrix_b.cols) >= strassen_threshold > 0:
+		result_rows = _strassen_prod(_matrix_rows(matrix_a), _matrix_rows(matrix_b), strassen_threshold)
+	else:
+		result_rows = _tiled_prod(_matrix_rows(matrix_a), _matrix_cols(matrix_b))
+
+	elements = []
+
+	for row in result_rows:
+		elements.extend(row)
+
+	return Matrix.Matrix(matrix_a.rows, matrix_b.cols, elements, numeric=matrix_a.numeric)
+
+
+def _naive_matrix_prod(matrix_a, matrix_b):
+	"""
+	Previous product kernel: a triple loop reading every element through Matrix.get. Kept as the baseline for the
+	benchmarks.
+	"""
+
+	elements = []
+
+	for a_ri in range( matrix_a.rows ):
+		for b_ci in range( matrix_b.cols ):
+			t = 0
+
+			for a_ci in range( matrix_a.cols ):
+				t += matrix_a.get( a_ri, a_ci ) * matrix_b.get( a_ci, b_ci )
+
+			elements.append( t )
+
+	return Matrix.Matrix(matrix_a.rows, matrix_b.cols, elements, numeric=matrix_a.numeric)
+
+
+def _tiled_prod(a_rows, b_cols, tile=PRODUCT_TILE):
+	"""
+	Multiplies the matrix given by its rows a_rows by the one given by its columns b_cols. The result is computed in
+	tiles of tile x tile elements, so the columns of B in use stay in cache while every row of A in the tile goes over
+	them.
+
+		:return: List with the rows of the result
+	"""
+
+	result_rows = [[] for __ in a_rows]
+
+	for start in range(0, len(b_cols), tile):
+		cols_tile = b_cols[start:start + tile]
+
+		for ri in range(0, len(a_rows), tile):
+			for a_row, result_row in zip(a_rows[ri:ri + tile], result_rows[ri:ri + tile]):
+				result_row.extend([sum(map(mul, a_row, b_col)) for b_col in cols_tile])
+
+	return result_rows
+
+
+def _add_rows(rows_a, rows_b):
+	return [list(map(add, row_a, row_b)) for row_a, row_b in zip(rows_a, rows_b)]
+
+
+def _sub_rows(rows_a, rows_b):
+	return [list(map(sub, row_a, row_b)) for row_a, row_b in zip(rows_a, rows_b)]
+
+
+def _strassen_prod(a_rows, b_rows, threshold):
+	"""
+	Strassen recursion over matrices given by their rows: the product of two matrices split into 2 x 2 blocks takes 7
+	block products instead of 8, at the cost of 18 block additions. Blocks with any dimension below threshold (or below
+	2, which can\'t be split) are multiplied by the tiled kernel. Odd dimensions are padded with a row or column of zeros, which is dropped from the
+	result.
+
+		:return: List with the rows of the result
+	"""
+
+	rows = len(a_rows)
+	inner = len(b_rows)
+	cols = len(b_rows[0])
+
+	if min(rows, inner, cols) < max(threshold, 2):
+		return _tiled_prod(a_rows, [list(col) for col in zip(*b_rows)])
+
+	if rows % 2 or inner % 2:
+		a_rows = [row + [0] * (inner % 2) for row in a_rows]
+		a_rows += [[0] * len(a_rows[0])] * (rows % 2)
+
+	if inner % 2 or cols % 2:
+		b_rows = [row + [0] * (cols % 2) for row in b_rows]
+		b_rows += [[0] * len(b_rows[0])] * (inner % 2)
+
+	h_rows = (rows + 1) // 2
+	h_inner = (inner + 1) // 2
+	h_cols = (cols + 1) // 2
+
+	a11 = [row[:h_inner] for row in a_rows[:h_rows]]
+	a12 = [row[h_inner:] for row in a_rows[:h_rows]]
+	a21 = [row[:h_inner] for row in a_rows[h_rows:]]
+	a22 = [row[h_inner:] for row in a_rows[h_rows:]]
+	b11 = [row[:h_cols] for row in b_rows[:h_inner]]
+	b12 = [row[h_cols:] for row in b_rows[:h_inner]]
+	b21 = [row[:h_cols] for row in b_rows[h_inner:]]
+	b22 = [row[h_cols:] for row in b_rows[h_inner:]]
+
+	m1 = _strassen_prod(_add_rows(a11, a22), _add_rows(b11, b22), threshold)
+	m2 = _strassen_prod(_add_rows(a21, a22), b11, threshold)
+	m3 = _strassen_prod(a11, _sub_rows(b12, b22), threshold)
+	m4 = _strassen_prod(a22, _sub_rows(b21, b11), threshold)
+	m5 = _strassen_prod(_add_rows(a11, a12), b22, threshold)
+	m6 = _strassen_prod(_sub_rows(a21, a11), _add_rows(b11, b12), threshold)
+	m7 = _strassen_prod(_sub_rows(a12, a22), _add_rows(b21, b22), threshold)
+
+	c11 = _add_rows(_sub_rows(_add_rows(m1, m4), m5), m7)
+	c12 = _add_rows(m3, m5)
+	c21 = _add_rows(m2, m4)
+	c22 = _add_rows(_add_rows(_sub_rows(m1, m2), m3), m6)
+
+	result_rows = [left + right for left, right in zip(c11, c12)] + [left + right for left, right in zip(c21, c22)]
+
+	return [row[:cols] for row in result_rows[:rows]]
+
+
+def matrix_transpose( matrix ):
+	if su.is_sparse(matrix):
+		return su.sparse_transpose(matrix)
+
+	order = _fixed_order(matrix)
+
+	if order is not None:
+		return Matrix.Matrix(order, order, fsu.TRANSPOSES[order](matrix.elements()))
+
+	return _dense_matrix_transpose(matrix)
+
+
+def _dense_matrix_transpose(matrix):
+	elements = []
+
+	[ [ elements.append( matrix.get( ri, ci ) ) for ri in range( matrix.rows ) ] for ci in range( matrix.cols ) ]
+
+	return Matrix.Matrix(matrix.cols, matrix.rows, elements, numeric=matrix.numeric)
+
+
+def _check_streamable(*matrices):
+	for matrix in matrices:
+		if matrix.exact or su.is_sparse(matrix):
+			raise Exception("Streamed operations expect dense float matrices. Exiting...")
+
+
+def matrix_prod_streamed(matrix_a, matrix_b, out=None, block_rows=DEFAULT_BLOCK_ROWS):
+	"""
+	Multiplies matrix_a by matrix_b reading matrix_a in blocks of block_rows rows and matrix_b one row at a time, in
+	order, so memory-mapped operands are paged in sequentially and never held in memory at once. Only block_rows rows
+	of the result are kept in memory before being written to out.
+
+		:param matrix_a: Matrix instance (float)
+		:param matrix_b: Matrix instance (float)
+		:param out: Optional Matrix instance with dimension rows(A) x cols(B), e.g. a memory-mapped one. It can\'t be one
+				of the operands.
+		:param block_rows: Integer
+
+		:return: Matrix instance
+
+		:raise: Exception
+	"""
+
+	try:
+		assert is_matrix_prod_defined(matrix_a, matrix_b)
+	except AssertionError:
+		raise Exception("Matrix product for matrices A(%ix%i) and B(%ix%i) is not defined" % (matrix_a.rows, matrix_a.cols, matrix_b.rows, matrix_b.cols))
+
+	_check_streamable(matrix_a, matrix_b)
+
+	if out is None:
+		out = Matrix.Matrix(matrix_a.rows, matrix_b.cols)
+	else:
+		_check_streamable(out)
+		_check_out(out, matrix_a.rows, matrix_b.cols)
+
+	a_elements = matrix_a.elements()
+	b_elements = matrix_b.elements()
+	out_elements = out.elements()
+	inner = matrix_a.cols
+	cols = matrix_b.cols
+
+	for start in range(0, matrix_a.rows, block_rows):
+		end = min(start + block_rows, matrix_a.rows)
+		a_block = a_elements[start * inner:end * inner]
+		block = [array('d', [0.0]) * cols for __ in range(end - start)]
+
+		for k in range(inner):
+			b_row = b_elements[k * cols:(k + 1) * cols]
+
+			for ri in range(end - start):
+				a_value = a_block[ri * inner + k]
+
+				if a_value != 0.0:
+					block[ri] = array('d', [e + a_value * b for e, b in zip(block[ri], b_row)])
+
+		for ri in range(end - start):
+			out_elements[(start + ri) * cols:(start + ri + 1) * cols] = block[ri]
+
+	return out
+
+
+def matrix_transpose_streamed(matrix, out=None, block_rows=DEFAULT_BLOCK_ROWS):
+	"""
+	Transposes the matrix reading it in blocks of block_rows rows, so a memory-mapped matrix is paged in sequentially.
+
+		:param matrix: Matrix instance (float)
+		:param out: Optional Matrix instance with dimension cols x rows, e.g. a memory-mapped one. It can\'t be the
+				matrix itself.
+		:param block_rows: Integer
+
+		:return: Matrix instance
+
+		:raise: Exception
+	"""
+
+	_check_streamable(matrix)
+
+	if out is None:
+		out = Matrix.Matrix(matrix.cols, matrix.rows)
+	else:
+		_check_streamable(out)
+		_check_out(out, matrix.cols, matrix.rows)
+
+	elements = matrix.elements()
+	out_elements = out.elements()
+	rows = matrix.rows
+	cols = matrix.cols
+
+	for start in range(0, rows, block_rows):
+		end = min(start + block_rows, rows)
+		block = elements[start * cols:end * cols]
+
+		for ci in range(cols):
+			out_elements[ci * rows + start:ci * rows + end] = array('d', block[ci::cols])
+
+	return out
+
+
+def matrix_augment( matrix_a, matrix_b ):
+	try:
+		assert matrix_a.rows == matrix_b.rows
+	except AssertionError:
+		raise Exception( "The number of rows of both matrices are not equal: A(%ix%i) B(%ix%i)" % ( matrix_a.rows, matrix_a.cols, matrix_b.rows, matrix_b.cols ) )
+
+	matrix_a, matrix_b = _match_numeric(matrix_a, matrix_b)
+
+	augmented = Matrix.Matrix(matrix_a.rows, matrix_a.cols + matrix_b.cols, numeric=matrix_a.numeric)
+	augmented.submatrix_view(0, 0, matrix_a.rows, matrix_a.cols).assign(matrix_a)
+	augmented.submatrix_view(0, matrix_a.cols, matrix_b.rows, matrix_b.cols).assign(matrix_b)
+
+	return augmented
+
+
+def matrix_identity(order, exact=False, numeric=None):
+	identity = Matrix.Matrix(order, order, [0.0 for i in range(order * order)], exact=exact, numeric=numeric)
+
+	for ri in range( identity.rows ):
+		identity.set( ri, ri, 1.0)
+
+	return identity
+
+
+def matrix_inverse(matrix, numeric=None, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Inverts the matrix received as argument.
+
+		:param matrix: Matrix instance
+		:param numeric: Optional numeric backend ('float', 'decimal', 'fraction') to invert in. Defaults to the
+				matrix\'s own, e.g. 'fraction' gives the exact inverse of an integer matrix
+		:param tolerance: Float
+
+		:return: Matrix instance (FrozenMatrix for frozen matrices, whose inverse is memoized)
+
+		:raise: Exception
+	"""
+
+	inverse = try_inverse(matrix, numeric=numeric, tolerance=tolerance)
+
+	if inverse is None:
+		raise Exception("The %ix%i matrix received does\'nt have an inverse. Exiting..." % (matrix.rows, matrix.cols))
+
+	return inverse
+
+
+def try_inverse(matrix, numeric=None, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Inverts the matrix received as argument, returning None instead of raising when it has no inverse. Singularity is
+	detected by the same elimination that computes the inverse (an LU factorization), so the matrix is only reduced
+	once. Affine 4x4 float matrices take the cheaper Fixed_Size_Utils.m4_affine_inverse path.
+
+		:param matrix: Matrix instance
+		:param numeric: Optional numeric backend ('float', 'decimal', 'fraction') to invert in
+		:param tolerance: Float
+
+		:return: Matrix instance or None
+	"""
+
+	if getattr(matrix, 'frozen', False):
+		return _memoized('inverse', matrix, lambda: try_inverse(matrix.copy(), numeric, tolerance), numeric, tolerance)
+
+	if matrix.rows != matrix.cols:
+		return None
+
+	matrix = _with_numeric(matrix, numeric)
+	order = _fixed_order(matrix)
+
+	if order is not None:
+		elements = matrix.elements()
+
+		try:
+			if order == 4 and fsu.m4_is_affine(elements):
+				return Matrix.Matrix(4, 4, fsu.m4_affine_inverse(elements, tolerance))
+
+			return Matrix.Matrix(order, order, fsu.INVERSES[order](elements, tolerance))
+		except Exception:
+			''' The kernels raise when the matrix is singular '''
+			return None
+
+	lu = LUFactorization(matrix, tolerance)
+
+	if lu.singular:
+		return None
+
+	return lu.inverse()
+
+
+def matrix_affine_inverse(matrix, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Inverts an affine 4x4 transform (bottom row 0, 0, 0, 1; any linear part): inverts its 3x3 linear part and maps its
+	translation back through it.
+
+		:param matrix: 4x4 Matrix instance
+		:param tolerance: Float
+
+		:return: Matrix instance
+
+		:raise: Exception
+	"""
+
+	elements = _check_transform(matrix)
+
+	if matrix.exact:
+		return matrix_inverse(matrix, tolerance=tolerance)
+
+	return Matrix.Matrix(4, 4, fsu.m4_affine_inverse(elements, tolerance))
+
+
+def matrix_rigid_inverse(matrix):
+	"""
+	Inverts a rigid 4x4 transform (orthonormal rotation and translation) by transposing its rotation and negating its
+	translation. Whether the rotation is orthonormal is not checked; use matrix_affine_inverse when it may carry scale
+	or shear.
+
+		:param matrix: 4x4 Matrix instance
+
+		:return: Matrix instance
+
+		:raise: Exception
+	"""
+
+	elements = _check_transform(matrix)
+
+	return Matrix.Matrix(4, 4, fsu.m4_rigid_inverse(elements), numeric=matrix.numeric)
+
+
+def _check_transform(matrix):
+	try:
+		assert matrix.rows == 4 and matrix.cols == 4 and fsu.m4_is_affine(matrix.elements())
+	except AssertionError:
+		raise Exception("Expected an affine 4x4 matrix (bottom row 0, 0, 0, 1), got a %ix%i one. Exiting..." % (matrix.rows, matrix.cols))
+
+	return matrix.elements()
+
+
+def _rref_matrix_inverse(matrix):
+	"""
+	Previous general inverse, kept as the baseline of the benchmarks: checks that the matrix is row equivalent to the
+	identity and then row reduces it again, augmented with the identity.
+	"""
+
+	try:
+		assert matrix.rows == matrix.cols and row_equivalence(matrix, matrix_identity(matrix.rows, numeric=matrix.numeric))
+	except AssertionError:
+		raise Exception( "The %ix%i matrix received does\'nt have an inverse. Exiting..." % ( matrix.rows, matrix.cols ) )
+
+	rref_matrix 	= row_reduced_echelon(matrix_augment(matrix, matrix_identity(matrix.rows, numeric=matrix.numeric)))
+	inv_matrix 		= Matrix.Matrix(matrix.rows, matrix.cols, numeric=matrix.numeric)
+
+	[ [ inv_matrix.set( ri - matrix.rows, ci - matrix.cols, rref_matrix.get(ri, ci) ) for ci in range( matrix.cols, rref_matrix.cols ) ] for ri in range( rref_matrix.rows ) ]
+
+	return inv_matrix
+
+
+def _update_columns(values, order, numeric):
+	"""
+	Returns the columns of the n x k Matrix (or the single column given as a sequence) received as argument, as lists
+	in the numeric backend requested.
+
+		:raise: Exception
+	"""
+
+	if hasattr(values, 'cols'):
+		try:
+			assert values.rows == order
+		except AssertionError:
+			raise Exception("Expected update vectors with %i rows, got a %ix%i matrix. Exiting..." % (order, values.rows, values.cols))
+
+		values = values if values.numeric is numeric else values.converted(numeric)
+		elements = values.elements()
+
+		return [list(elements[ci::values.cols]) for ci in range(values.cols)]
+
+	try:
+		assert len(values) == order
+	except AssertionError:
+		raise Exception("Expected update vectors with %i elements, got %i. Exiting..." % (order, len(values)))
+
+	return [[numeric.coerce(e) for e in values]]
+
+
+def _woodbury(inverse_rows, u_cols, v_cols, numeric, tolerance):
+	"""
+	Woodbury identity over the rows of A^-1 and the columns of U and V (n x k each):
+
+		(A + U * Vt)^-1 = A^-1 - Z * (I + Vt * Z)^-1 * Vt * A^-1,	where Z = A^-1 * U
+
+	Costs O(n^2 * k) plus the O(k^3) inverse of the k x k capacitance matrix I + Vt * Z. With k = 1 it is the
+	Sherman-Morrison formula.
+
+		:return: List with the rows of (A + U * Vt)^-1, or None when A + U * Vt is singular
+	"""
+
+	n = len(inverse_rows)
+	k = len(u_cols)
+
+	try:
+		assert len(v_cols) == k
+	except AssertionError:
+		raise Exception("U and V are expected to have the same number of columns: %i /= %i. Exiting..." % (k, len(v_cols)))
+
+	''' Z = A^-1 * U (n x k, one column per update) and W = Vt * A^-1 (k x n, one row per update) '''
+	z_cols = [[sum(map(mul, row, u)) for row in inverse_rows] for u in u_cols]
+	zero = numeric.coerce(0)
+	w_rows = []
+
+	for v in v_cols:
+		w = [zero] * n
+
+		for factor, row in zip(v, inverse_rows):
+			if factor != 0:
+				w = [a + factor * b for a, b in zip(w, row)]
+
+		w_rows.append(w)
+
+	capacitance = Matrix.Matrix(k, k, [(1 if a == b else 0) + sum(map(mul, v_cols[a], z_cols[b])) for a in range(k) for b in range(k)], numeric=numeric)
+	lu = LUFactorization(capacitance, tolerance)
+
+	if lu.singular:
+		return None
+
+	''' M = (I + Vt * Z)^-1 * W (k x n), then A^-1 - Z * M row by row '''
+	m_rows = _matrix_rows(lu.solve_many(Matrix.Matrix(k, n, [e for w in w_rows for e in w], numeric=numeric)))
+	updated = []
+
+	for ri, row in enumerate(inverse_rows):
+		for z, m in zip(z_cols, m_rows):
+			factor = z[ri]
+
+			if factor != 0:
+				row = [a - factor * b for a, b in zip(row, m)]
+
+		updated.append(row)
+
+	return updated
+
+
+def woodbury_update(inverse, u, v, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Given the inverse of A, returns the inverse of A + U * Vt in O(n^2 * k) instead of inverting it again, e.g. after a
+	rank-k change of a transform or a constraint matrix.
+
+		:param inverse: n x n Matrix instance. The inverse of A
+		:param u: n x k Matrix instance, or a list or tuple of n numbers (k = 1)
+		:param v: n x k Matrix instance, or a list or tuple of n numbers (k = 1)
+		:param tolerance: Float
+
+		:return: Matrix instance, or None when A + U * Vt is singular
+
+		:raise: Exception
+	"""
+
+	numeric = inverse.numeric
+	order = inverse.rows
+	rows = _woodbury(_matrix_rows(inverse), _update_columns(u, order, numeric), _update_columns(v, order, numeric), numeric, tolerance)
+
+	if rows is None:
+		return None
+
+	return Matrix.Matrix(order, order, [e for row in rows for e in row], numeric=numeric)
+
+
+def sherman_morrison_update(inverse, u, v, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Given the inverse of A, returns the inverse of A + u * vt in O(n^2), e.g. after changing a single row (u = e_i,
+	v = new row - old row) or column (u = new column - old column, v = e_j) of A.
+
+		:param inverse: n x n Matrix instance. The inverse of A
+		:param u: n x 1 Matrix instance, or a list or tuple of n numbers
+		:param v: n x 1 Matrix instance, or a list or tuple of n numbers
+		:param tolerance: Float
+
+		:return: Matrix instance, or None when A + u * vt is singular
+
+		:raise: Exception
+	"""
+
+	for vector in (u, v):
+		if hasattr(vector, 'cols') and vector.cols != 1:
+			raise Exception("Sherman-Morrison expects n x 1 vectors, got a %ix%i matrix. Use woodbury_update instead. Exiting..." % (vector.rows, vector.cols))
+
+	return woodbury_update(inverse, u, v, tolerance)
+
+
+class UpdatableInverse(object):
+	"""
+	Inverse of a square matrix kept up to date through rank-k changes of the matrix (see woodbury_update), at O(n^2 * k)
+	per change instead of the O(n^3) of inverting it again.
+
+	Every update adds rounding error to the inverse. After every check_every updates the drift, the largest entry of
+	A * (A^-1 * p) - p for a fixed probe vector p (O(n^2)), is compared with drift_tolerance (or with 10 times the
+	drift measured right after the last factorization, when bigger, since ill-conditioned matrices never get below it).
+	Beyond it, the inverse is computed again from the current matrix through an LU factorization. Updates that make
+	the capacitance matrix singular also fall back to a full factorization.
+	"""
+
+	''' Ratio allowed between the drift and the one measured right after a factorization '''
+	drift_growth = 10
+
+	def __init__(self, matrix, drift_tolerance=1e-9, check_every=1, tolerance=DEFAULT_TOLERANCE):
+		"""
+			:param matrix: Square Matrix instance
+			:param drift_tolerance: Float
+			:param check_every: Integer. Number of updates between drift checks
+			:param tolerance: Float. Pivots whose magnitude rounds to zero at this tolerance make the matrix singular
+
+			:raise: Exception when the matrix is singular
+		"""
+
+		super(UpdatableInverse, self).__init__()
+
+		self.order = matrix.rows
+		self.numeric = matrix.numeric
+		self.drift_tolerance = drift_tolerance
+		self.check_every = max(1, check_every)
+		self.tolerance = tolerance
+		self.updates = 0
+		self.refactorizations = 0
+		self.__rows = _matrix_rows(matrix)
+		''' A fixed, unstructured probe vector for the drift checks '''
+		self.__probe = [self.numeric.coerce(((i * 7919) % 97) / 97.0 - 0.5) for i in range(self.order)]
+		self.__pending = 0
+		self.__inverse, self.__baseline = self.__factor(self.__rows)
+
+	def __factor(self, rows):
+		"""
+		Inverts the matrix given by its rows through an LU factorization, without changing the state of the instance.
+
+			:return: Tuple (rows of the inverse, drift measured for it)
+
+			:raise: Exception when the matrix is singular
+		"""
+
+		lu = LUFactorization(Matrix.Matrix(self.order, self.order, [e for row in rows for e in row], numeric=self.numeric),
+		                      self.tolerance)
+
+		if lu.singular:
+			raise Exception("The %ix%i matrix is singular and has no inverse. Exiting..." % (self.order, self.order))
+
+		inverse = _matrix_rows(lu.inverse())
+
+		return inverse, self.__drift(rows, inverse)
+
+	def __drift(self, rows, inverse):
+		y = [sum(map(mul, row, self.__probe)) for row in inverse]
+
+		return max([abs(sum(map(mul, row, y)) - p) for row, p in zip(rows, self.__probe)] or [0])
+
+	def matrix(self):
+		"""
+		:return: Matrix instance. The current matrix, with every update applied
+		"""
+
+		return Matrix.Matrix(self.order, self.order, [e for row in self.__rows for e in row], numeric=self.numeric)
+
+	def inverse(self):
+		"""
+		:return: Matrix instance. The inverse of the current matrix
+		"""
+
+		return Matrix.Matrix(self.order, self.order, [e for row in self.__inverse for e in row], numeric=self.numeric)
+
+	def drift(self):
+		"""
+		:return: Float. Largest entry of A * (A^-1 * p) - p for the probe vector p
+		"""
+
+		return self.__drift(self.__rows, self.__inverse)
+
+	def update(self, u, v):
+		"""
+		Replaces A by A + U * Vt and updates its inverse. The new matrix and its inverse are only kept once the inverse
+		has been computed, so an update that makes the matrix singular raises and leaves both as they were.
+
+			:param u: n x k Matrix instance, or a list or tuple of n numbers (k = 1)
+			:param v: n x k Matrix instance, or a list or tuple of n numbers (k = 1)
+
+			:return: Boolean. True when the inverse was computed again from the matrix instead of updated
+
+			:raise: Exception when the updated matrix is singular
+		"""
+
+		u_cols = _update_columns(u, self.order, self.numeric)
+		v_cols = _update_columns(v, self.order, self.numeric)
+		rows = []
+
+		for ri, row in enumerate(self.__rows):
+			for u_col, v_col in zip(u_cols, v_cols):
+				factor = u_col[ri]
+
+				if factor != 0:
+					row = [a + factor * b for a, b in zip(row, v_col)]
+
+			rows.append(row)
+
+		inverse = _woodbury(self.__inverse, u_cols, v_cols, self.numeric, self.tolerance)
+		pending = self.__pending + 1
+		refactored = inverse is None
+
+		if not refactored and pending >= self.check_every:
+			pending = 0
+			refactored = self.__drift(rows, inverse) > max(self.drift_tolerance, self.drift_growth * self.__baseline)
+
+		if refactored:
+			inverse, self.__baseline = self.__factor(rows)
+			pending = 0
+			self.refactorizations += 1
+
+		self.__rows = rows
+		self.__inverse = inverse
+		self.__pending = pending
+		self.updates += 1
+
+		return refactored
+
+	def replace_row(self, index, row):
+		"""
+		Replaces the row at index (a rank-1 update).
+
+			:param index: Integer
+			:param row: 1 x n Matrix instance, or a list or tuple of n numbers
+
+			:return: Boolean. See update
+		"""
+
+		values = row.elements() if hasattr(row, 'cols') else row
+		u = [0] * self.order
+		u[index] = 1
+
+		return self.update(u, [self.numeric.coerce(e) - a for e, a in zip(values, self.__rows[index])])
+
+	def replace_column(self, index, column):
+		"""
+		Replaces the column at index (a rank-1 update).
+
+			:param index: Integer
+			:param column: n x 1 Matrix instance, or a list or tuple of n numbers
+
+			:return: Boolean. See update
+		"""
+
+		values = column.elements() if hasattr(column, 'cols') else column
+		v = [0] * self.order
+		v[index] = 1
+
+		return self.update([self.numeric.coerce(e) - row[index] for e, row in zip(values, self.__rows)], v)
+
+	def solve(self, b):
+		"""
+		Solves A * x = b for the current matrix, in O(n^2) per column of b: the rows of the inverse kept are multiplied
+		against b directly.
+
+			:param b: n x k Matrix instance
+			:return: n x k Matrix instance
+
+			:raise: Exception
+		"""
+
+		try:
+			assert b.rows == self.order
+		except AssertionError:
+			raise Exception("Expected a right-hand side with %i rows, got a %ix%i matrix. Exiting..." % (self.order, b.rows, b.cols))
+
+		cols = _matrix_cols(b if b.numeric is self.numeric else b.converted(self.numeric))
+
+		return Matrix.Matrix(self.order, b.cols, [sum(map(mul, row, col)) for row in self.__inverse for col in cols],
+		                     numeric=self.numeric)
+
+
+def matrix_transform_point(matrix, point):
+	"""
+	Transforms a point (w = 1) by a 4x4 matrix, or by a 3x3 one, treating the point as a column vector.
+
+		:param matrix: 3x3 or 4x4 Matrix instance
+		:param point: List or tuple of 3 floats
+
+		:return: List of 3 floats
+
+		:raise: Exception
+	"""
+
+	order = _fixed_order(matrix)
+
+	if order == 4:
+		return fsu.m4_transform_point(matrix.elements(), point)
+	elif order == 3:
+		return fsu.m3_transform_vector(matrix.elements(), point)
+
+	raise Exception("Expected a float 3x3 or 4x4 matrix, got a %ix%i one instead. Exiting..." % (matrix.rows, matrix.cols))
+
+
+def matrix_transform_vector(matrix, vector):
+	"""
+	Transforms a direction (w = 0) by a 4x4 matrix, or by a 3x3 one, treating the vector as a column vector.
+
+		:param matrix: 3x3 or 4x4 Matrix instance
+		:param vector: List or tuple of 3 floats
+
+		:return: List of 3 floats
+
+		:raise: Exception
+	"""
+
+	order = _fixed_order(matrix)
+
+	if order == 4:
+		return fsu.m4_transform_vector(matrix.elements(), vector)
+	elif order == 3:
+		return fsu.m3_transform_vector(matrix.elements(), vector)
+
+	raise Exception("Expected a float 3x3 or 4x4 matrix, got a %ix%i one instead. Exiting..." % (matrix.rows, matrix.cols))
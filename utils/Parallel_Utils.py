@@ -0,0 +1,269 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from Geometry.classes import Matrix
+from Geometry.utils import Matrix_Utils as mu
+
+DEFAULT_MIN_BLOCK = 16
+
+'''
+	Opt-in process-pool parallelism for the dense float routines of Matrix_Utils:
+
+		- matrix_prod is split in blocks of rows of A; every worker multiplies its rows by all of B
+		- LUFactorization.solve_many is split in blocks of right-hand sides; every worker substitutes its columns
+
+	The operands are copied once into multiprocessing.shared_memory blocks of float64 and the workers attach to them by
+	name, so neither the operands nor the results are pickled; only the block bounds travel with every task. B is
+	shared transposed, so every worker reads the columns of B (and the right-hand sides) as contiguous rows.
+
+	Exact (Decimal, Fraction) matrices can\'t be kept in shared memory and are computed in the calling process.
+
+	Usage:
+
+		with ParallelExecutor(workers=32) as executor:
+			product = mu.matrix_prod(matrix_a, matrix_b, executor=executor)
+			x = mu.LUFactorization(matrix).solve_many(b, executor=executor)
+'''
+
+
+def _allocate(count):
+	return shared_memory.SharedMemory(create=True, size=max(1, count * 8))
+
+
+def _share(elements):
+	"""
+	Copies elements into a new float64 shared memory block.
+
+		:return: SharedMemory instance. The caller is expected to close and unlink it
+	"""
+
+	count = len(elements)
+	block = _allocate(count)
+	block.buf[:count * 8] = array('d', elements).tobytes()
+
+	return block
+
+
+def _attach(name, count):
+	"""
+	Attaches to the shared memory block named name.
+
+		:return: Tuple (SharedMemory instance, float64 memoryview over its first count elements)
+	"""
+
+	block = shared_memory.SharedMemory(name=name)
+
+	return block, block.buf[:count * 8].cast('d')
+
+
+def _release(*attached):
+	for block, view in attached:
+		view.release()
+		block.close()
+
+
+def _product_block(a_name, bt_name, out_name, inner, cols, start, end, rows):
+	"""
+	Worker task: multiplies rows start to end of A by B and writes them into the shared result.
+	"""
+
+	a = _attach(a_name, rows * inner)
+	bt = _attach(bt_name, cols * inner)
+	out = _attach(out_name, rows * cols)
+
+	try:
+		a_view = a[1]
+		bt_view = bt[1]
+		a_rows = [list(a_view[ri * inner:(ri + 1) * inner]) for ri in range(start, end)]
+		b_cols = [list(bt_view[ci * inner:(ci + 1) * inner]) for ci in range(cols)]
+		elements = array('d')
+
+		for row in mu._tiled_prod(a_rows, b_cols):
+			elements.extend(row)
+
+		out[1][start * cols:end * cols] = elements
+	finally:
+		_release(a, bt, out)
+
+
+def _substitution_block(lu_name, permutation, bt_name, out_name, start, end, count):
+	"""
+	Worker task: solves the right-hand sides start to end (rows of B transposed) through the shared LU factors and
+	writes the solutions, also transposed, into the shared result.
+	"""
+
+	n = len(permutation)
+	lu = _attach(lu_name, n * n)
+	bt = _attach(bt_name, count * n)
+	out = _attach(out_name, count * n)
+
+	try:
+		lu_view = lu[1]
+		bt_view = bt[1]
+		lu_rows = [list(lu_view[ri * n:(ri + 1) * n]) for ri in range(n)]
+		elements = array('d')
+
+		for ci in range(start, end):
+			elements.extend(mu._lu_substitute(lu_rows, permutation, bt_view[ci * n:(ci + 1) * n]))
+
+		out[1][start * n:end * n] = elements
+	finally:
+		_release(lu, bt, out)
+
+
+class ParallelExecutor(object):
+	"""
+	Process pool running the dense float products and batched solves of Matrix_Utils in parallel. The pool is started
+	on first use and kept until shutdown() (or the end of a with block), so it is worth reusing across calls.
+	"""
+
+	def __init__(self, workers=None, min_block=DEFAULT_MIN_BLOCK):
+		"""
+			:param workers: Integer. Number of worker processes. Defaults to the number of CPUs
+			:param min_block: Integer. Least number of rows (products) or right-hand sides (solves) handed to a worker.
+					Work that doesn\'t fill two blocks is computed in the calling process
+		"""
+
+		super(ParallelExecutor, self).__init__()
+
+		self.workers = workers or os.cpu_count() or 1
+		self.min_block = max(1, min_block)
+		self.__pool = None
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.shutdown()
+
+	def __pool_instance(self):
+		if self.__pool is None:
+			self.__pool = ProcessPoolExecutor(max_workers=self.workers)
+
+		return self.__pool
+
+	def shutdown(self):
+		"""
+		Stops the worker processes. The executor can still be used afterwards: a new pool is started on demand.
+		"""
+
+		if self.__pool is not None:
+			self.__pool.shutdown()
+			self.__pool = None
+
+	def blocks(self, count):
+		"""
+		Splits range(count) in at most one block per worker, each at least min_block long.
+
+			:return: List of (start, end) tuples
+		"""
+
+		size = max(self.min_block, -(-count // self.workers))
+
+		return [(start, min(start + size, count)) for start in range(0, count, size)]
+
+	def __run(self, function, tasks):
+		pool = self.__pool_instance()
+
+		for future in [pool.submit(function, *task) for task in tasks]:
+			''' Re-raises the exception of a failed task '''
+			future.result()
+
+	def matrix_prod(self, matrix_a, matrix_b, out=None):
+		"""
+		Same as Matrix_Utils.matrix_prod(matrix_a, matrix_b, out=out, executor=self).
+		"""
+
+		return mu.matrix_prod(matrix_a, matrix_b, out=out, executor=self)
+
+	def solve_many(self, factorization, b):
+		"""
+		Same as factorization.solve_many(b, executor=self).
+
+			:param factorization: LUFactorization instance
+			:param b: n x k Matrix instance
+		"""
+
+		return factorization.solve_many(b, executor=self)
+
+	def product(self, matrix_a, matrix_b):
+		"""
+		Multiplies two dense float matrices, one block of rows of matrix_a per task.
+
+			:param matrix_a: Matrix instance (float)
+			:param matrix_b: Matrix instance (float)
+
+			:return: Matrix instance
+		"""
+
+		rows = matrix_a.rows
+		inner = matrix_a.cols
+		cols = matrix_b.cols
+		blocks = self.blocks(rows)
+
+		if len(blocks) < 2:
+			return mu._dense_matrix_prod(matrix_a, matrix_b)
+
+		b_elements = matrix_b.elements()
+		shared = [_share(matrix_a.elements())]
+
+		try:
+			shared.append(_share([e for ci in range(cols) for e in b_elements[ci::cols]]))
+			shared.append(_allocate(rows * cols))
+
+			self.__run(_product_block, [(shared[0].name, shared[1].name, shared[2].name, inner, cols, start, end, rows)
+			                            for start, end in blocks])
+
+			product = shared[2].buf[:rows * cols * 8].cast('d')
+
+			try:
+				return Matrix.Matrix(rows, cols, array('d', product))
+			finally:
+				product.release()
+		finally:
+			for block in shared:
+				block.close()
+				block.unlink()
+
+	def substitution(self, lu_rows, permutation, b):
+		"""
+		Solves the columns of b through the rows of an LU factorization, one block of columns per task.
+
+			:param lu_rows: List with the rows of the LU factors (see LUFactorization)
+			:param permutation: List with the row permutation of the factorization
+			:param b: n x k Matrix instance (float)
+
+			:return: n x k Matrix instance
+		"""
+
+		n = len(lu_rows)
+		count = b.cols
+		blocks = self.blocks(count)
+
+		if len(blocks) < 2:
+			elements = b.elements()
+			solutions = [mu._lu_substitute(lu_rows, permutation, elements[ci::count]) for ci in range(count)]
+
+			return Matrix.Matrix(n, count, [col[ri] for ri in range(n) for col in solutions])
+
+		b_elements = b.elements()
+		shared = [_share([e for row in lu_rows for e in row])]
+
+		try:
+			shared.append(_share([e for ci in range(count) for e in b_elements[ci::count]]))
+			shared.append(_allocate(count * n))
+
+			self.__run(_substitution_block, [(shared[0].name, permutation, shared[1].name, shared[2].name, start, end, count)
+			                                 for start, end in blocks])
+
+			solutions = shared[2].buf[:count * n * 8].cast('d')
+
+			try:
+				return Matrix.Matrix(n, count, [solutions[ci * n + ri] for ri in range(n) for ci in range(count)])
+			finally:
+				solutions.release()
+		finally:
+			for block in shared:
+				block.close()
+				block.unlink()
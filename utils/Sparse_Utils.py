@@ -0,0 +1,236 @@
+from array import array
+from Geometry.classes import Matrix
+from Geometry.classes import SparseMatrix
+
+
+def is_sparse(matrix):
+	return isinstance(matrix, SparseMatrix.SparseMatrix)
+
+
+def sparse_scalar_prod(matrix, scalar):
+	"""
+	Multiplies every stored element of the sparse matrix by the scalar received as argument. Cost: O(nnz).
+
+		:param matrix: SparseMatrix instance
+		:param scalar: Float
+
+		:return: SparseMatrix instance
+	"""
+
+	scalar = float(scalar)
+
+	if scalar == 0.0:
+		return SparseMatrix.SparseMatrix(matrix.rows, matrix.cols)
+
+	return SparseMatrix.SparseMatrix(matrix.rows, matrix.cols, matrix.indptr, matrix.indices,
+	                                 [e * scalar for e in matrix.data])
+
+
+def sparse_transpose(matrix):
+	"""
+	Transposes the sparse matrix received as argument with a counting sort over its column indices.
+	Cost: O(nnz + rows + cols).
+
+		:param matrix: SparseMatrix instance
+
+		:return: SparseMatrix instance
+	"""
+
+	indptr = matrix.indptr
+	indices = matrix.indices
+	data = matrix.data
+
+	t_indptr = array('l', [0]) * (matrix.cols + 1)
+
+	for ci in indices:
+		t_indptr[ci + 1] += 1
+
+	for ci in range(matrix.cols):
+		t_indptr[ci + 1] += t_indptr[ci]
+
+	t_indices = array('l', [0]) * len(indices)
+	t_data = array('d', [0.0]) * len(data)
+	next_position = array('l', t_indptr[:-1])
+
+	for ri in range(matrix.rows):
+		for position in range(indptr[ri], indptr[ri + 1]):
+			ci = indices[position]
+			t_position = next_position[ci]
+			t_indices[t_position] = ri
+			t_data[t_position] = data[position]
+			next_position[ci] = t_position + 1
+
+	return SparseMatrix.SparseMatrix(matrix.cols, matrix.rows, t_indptr, t_indices, t_data)
+
+
+def sparse_add(matrix_a, matrix_b):
+	"""
+	Adds two sparse matrices by merging their rows. Cost: O(nnz(A) + nnz(B)).
+
+		:param matrix_a: SparseMatrix instance
+		:param matrix_b: SparseMatrix instance
+
+		:return: SparseMatrix instance
+	"""
+
+	a_indptr, a_indices, a_data = matrix_a.indptr, matrix_a.indices, matrix_a.data
+	b_indptr, b_indices, b_data = matrix_b.indptr, matrix_b.indices, matrix_b.data
+
+	indptr = array('l', [0])
+	indices = array('l')
+	data = array('d')
+
+	for ri in range(matrix_a.rows):
+		pa, end_a = a_indptr[ri], a_indptr[ri + 1]
+		pb, end_b = b_indptr[ri], b_indptr[ri + 1]
+
+		while pa < end_a or pb < end_b:
+			ca = a_indices[pa] if pa < end_a else matrix_a.cols
+			cb = b_indices[pb] if pb < end_b else matrix_b.cols
+
+			if ca == cb:
+				ci, value = ca, a_data[pa] + b_data[pb]
+				pa += 1
+				pb += 1
+			elif ca < cb:
+				ci, value = ca, a_data[pa]
+				pa += 1
+			else:
+				ci, value = cb, b_data[pb]
+				pb += 1
+
+			if value != 0.0:
+				indices.append(ci)
+				data.append(value)
+
+		indptr.append(len(data))
+
+	return SparseMatrix.SparseMatrix(matrix_a.rows, matrix_a.cols, indptr, indices, data)
+
+
+def sparse_dense_add(sparse_matrix, dense_matrix):
+	"""
+	Adds a sparse and a dense matrix. The result is dense. Cost: O(rows * cols) for the copy plus O(nnz).
+
+		:param sparse_matrix: SparseMatrix instance
+		:param dense_matrix: Matrix instance
+
+		:return: Matrix instance
+	"""
+
+	result = Matrix.Matrix(dense_matrix.rows, dense_matrix.cols, dense_matrix.elements())
+	elements = result.elements()
+	cols = result.cols
+
+	for ri in range(sparse_matrix.rows):
+		offset = ri * cols
+
+		for position in range(sparse_matrix.indptr[ri], sparse_matrix.indptr[ri + 1]):
+			elements[offset + sparse_matrix.indices[position]] += sparse_matrix.data[position]
+
+	return result
+
+
+def sparse_prod(matrix_a, matrix_b):
+	"""
+	Multiplies two sparse matrices row by row (Gustavson\'s algorithm), accumulating every result row in a dictionary so
+	the cost only depends on the nonzero elements touched: O(sum over nonzero A[i,k] of nnz(B row k)).
+
+		:param matrix_a: SparseMatrix instance
+		:param matrix_b: SparseMatrix instance
+
+		:return: SparseMatrix instance
+	"""
+
+	a_indptr, a_indices, a_data = matrix_a.indptr, matrix_a.indices, matrix_a.data
+	b_indptr, b_indices, b_data = matrix_b.indptr, matrix_b.indices, matrix_b.data
+
+	indptr = array('l', [0])
+	indices = array('l')
+	data = array('d')
+
+	for ri in range(matrix_a.rows):
+		accum = {}
+
+		for pa in range(a_indptr[ri], a_indptr[ri + 1]):
+			k = a_indices[pa]
+			a_value = a_data[pa]
+
+			for pb in range(b_indptr[k], b_indptr[k + 1]):
+				ci = b_indices[pb]
+				accum[ci] = accum.get(ci, 0.0) + a_value * b_data[pb]
+
+		for ci in sorted(accum):
+			value = accum[ci]
+
+			if value != 0.0:
+				indices.append(ci)
+				data.append(value)
+
+		indptr.append(len(data))
+
+	return SparseMatrix.SparseMatrix(matrix_a.rows, matrix_b.cols, indptr, indices, data)
+
+
+def sparse_dense_prod(sparse_matrix, dense_matrix):
+	"""
+	Multiplies a sparse matrix (left) by a dense matrix (right). Every nonzero A[i,k] adds A[i,k] times row k of B to row
+	i of the result. Cost: O(nnz(A) * cols(B)).
+
+		:param sparse_matrix: SparseMatrix instance
+		:param dense_matrix: Matrix instance
+
+		:return: Matrix instance
+	"""
+
+	result = Matrix.Matrix(sparse_matrix.rows, dense_matrix.cols)
+	elements = result.elements()
+	b_elements = dense_matrix.elements()
+	cols = dense_matrix.cols
+	indptr, indices, data = sparse_matrix.indptr, sparse_matrix.indices, sparse_matrix.data
+
+	for ri in range(sparse_matrix.rows):
+		offset = ri * cols
+
+		for position in range(indptr[ri], indptr[ri + 1]):
+			a_value = data[position]
+			b_offset = indices[position] * cols
+
+			for ci in range(cols):
+				elements[offset + ci] += a_value * b_elements[b_offset + ci]
+
+	return result
+
+
+def dense_sparse_prod(dense_matrix, sparse_matrix):
+	"""
+	Multiplies a dense matrix (left) by a sparse matrix (right). Every element A[i,k] adds A[i,k] times the stored
+	elements of row k of B to row i of the result. Cost: O(rows(A) * nnz(B)).
+
+		:param dense_matrix: Matrix instance
+		:param sparse_matrix: SparseMatrix instance
+
+		:return: Matrix instance
+	"""
+
+	result = Matrix.Matrix(dense_matrix.rows, sparse_matrix.cols)
+	elements = result.elements()
+	a_elements = dense_matrix.elements()
+	a_cols = dense_matrix.cols
+	cols = sparse_matrix.cols
+	indptr, indices, data = sparse_matrix.indptr, sparse_matrix.indices, sparse_matrix.data
+
+	for ri in range(dense_matrix.rows):
+		offset = ri * cols
+		a_offset = ri * a_cols
+
+		for k in range(a_cols):
+			a_value = a_elements[a_offset + k]
+
+			if a_value == 0.0:
+				continue
+
+			for position in range(indptr[k], indptr[k + 1]):
+				elements[offset + indices[position]] += a_value * data[position]
+
+	return result
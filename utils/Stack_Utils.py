@@ -0,0 +1,246 @@
+from array import array
+from operator import mul
+from Geometry.classes import MatrixStack
+from Geometry.utils import Fixed_Size_Utils as fsu
+
+DEFAULT_TOLERANCE = 0.0001
+
+
+def _stack_operand(operand):
+	"""
+	Returns the buffer, the distance (in elements) between consecutive matrices and the count of matrices for a stack
+	or a single matrix. Single matrices get a distance of 0 so the same matrix is used against every matrix in the
+	other operand (broadcasting).
+
+		:param operand: MatrixStack or Matrix instance
+
+		:return: Tuple (array('d'), step, count or None)
+	"""
+
+	if isinstance(operand, MatrixStack.MatrixStack):
+		return operand.elements(), operand.rows * operand.cols, operand.count
+
+	return array('d', operand.elements()), 0, None
+
+
+def _broadcast_count(count_a, count_b):
+	if count_a is None and count_b is None:
+		raise Exception("At least one of the operands is expected to be a MatrixStack. Exiting...")
+	elif count_a is None:
+		return count_b
+	elif count_b is None or count_a == count_b:
+		return count_a
+
+	raise Exception("Stacks with different counts can\'t be combined: %i /= %i" % (count_a, count_b))
+
+
+def _fixed_stack_map(kernel, count, order, *operands):
+	"""
+	Applies one of the unrolled 3x3/4x4 kernels in Fixed_Size_Utils to every matrix of the operands, given as
+	(buffer, step) pairs (see _stack_operand), and returns the results in a new stack.
+
+		:return: MatrixStack instance
+	"""
+
+	size = order * order
+	out = array('d')
+
+	if len(operands) == 1:
+		elements = operands[0][0]
+
+		for offset in range(0, count * size, size):
+			out.extend(kernel(elements[offset:offset + size]))
+	else:
+		(a_elements, a_step), (b_elements, b_step) = operands
+		''' Broadcast operands (step 0) are sliced once instead of once per matrix '''
+		a_single = a_elements[:size] if a_step == 0 else None
+		b_single = b_elements[:size] if b_step == 0 else None
+
+		for n in range(count):
+			a = a_single if a_single is not None else a_elements[n * a_step:n * a_step + size]
+			b = b_single if b_single is not None else b_elements[n * b_step:n * b_step + size]
+			out.extend(kernel(a, b))
+
+	result = MatrixStack.MatrixStack(count, order, order)
+	result.elements()[:] = out
+
+	return result
+
+
+def stack_prod(stack_a, stack_b):
+	"""
+	Multiplies every matrix of stack_a by the matrix at the same index on stack_b. Either operand can be a single
+	Matrix, in which case it is multiplied against every matrix of the other stack.
+
+		:param stack_a: MatrixStack or Matrix instance
+		:param stack_b: MatrixStack or Matrix instance
+
+		:return: MatrixStack instance
+
+		:raise: Exception
+	"""
+
+	try:
+		assert stack_a.cols == stack_b.rows
+	except AssertionError:
+		raise Exception("Matrix product for matrices A(%ix%i) and B(%ix%i) is not defined" % (
+			stack_a.rows, stack_a.cols, stack_b.rows, stack_b.cols))
+
+	a_elements, a_step, a_count = _stack_operand(stack_a)
+	b_elements, b_step, b_count = _stack_operand(stack_b)
+	count = _broadcast_count(a_count, b_count)
+
+	rows = stack_a.rows
+	inner = stack_a.cols
+	cols = stack_b.cols
+
+	if rows == inner == cols and rows in fsu.PRODUCTS:
+		return _fixed_stack_map(fsu.PRODUCTS[rows], count, rows, (a_elements, a_step), (b_elements, b_step))
+
+	result = MatrixStack.MatrixStack(count, rows, cols)
+	out = result.elements()
+
+	b_size = inner * cols
+	position = 0
+
+	for n in range(count):
+		a_offset = n * a_step
+		b_offset = n * b_step
+		''' Strided slices give the columns of B as contiguous sequences, so every element is a single C-level sum '''
+		b_matrix = b_elements[b_offset:b_offset + b_size]
+		b_cols = [b_matrix[ci::cols] for ci in range(cols)]
+
+		for ri in range(rows):
+			a_row = a_elements[a_offset + ri * inner:a_offset + (ri + 1) * inner]
+
+			for b_col in b_cols:
+				out[position] = sum(map(mul, a_row, b_col))
+				position += 1
+
+	return result
+
+
+def stack_transpose(stack):
+	"""
+	Transposes every matrix of the stack received as argument.
+
+		:param stack: MatrixStack instance
+
+		:return: MatrixStack instance
+	"""
+
+	rows = stack.rows
+	cols = stack.cols
+
+	if rows == cols and rows in fsu.TRANSPOSES:
+		return _fixed_stack_map(fsu.TRANSPOSES[rows], stack.count, rows, (stack.elements(), rows * cols))
+
+	step = rows * cols
+	elements = stack.elements()
+
+	result = MatrixStack.MatrixStack(stack.count, cols, rows)
+	out = result.elements()
+
+	for n in range(stack.count):
+		offset = n * step
+
+		for ri in range(rows):
+			row = offset + ri * cols
+
+			for ci in range(cols):
+				out[offset + ci * rows + ri] = elements[row + ci]
+
+	return result
+
+
+def stack_inverse(stack, tolerance=DEFAULT_TOLERANCE):
+	"""
+	Inverts every (square) matrix of the stack received as argument: 3x3 and 4x4 ones through the unrolled kernels in
+	Fixed_Size_Utils, any other order with Gauss-Jordan elimination and partial pivoting. A matrix is singular under the
+	same test Matrix_Utils.has_inverse and matrix_inverse apply.
+
+		:param stack: MatrixStack instance
+		:param tolerance: Float. Pivots whose magnitude rounds to zero at this tolerance are considered zero.
+
+		:return: MatrixStack instance
+
+		:raise: Exception
+	"""
+
+	try:
+		assert stack.rows == stack.cols
+	except AssertionError:
+		raise Exception("Only square matrices have an inverse: %ix%i. Exiting..." % (stack.rows, stack.cols))
+
+	order = stack.rows
+
+	if order in fsu.INVERSES:
+		kernel = fsu.INVERSES[order]
+		size = order * order
+		elements = stack.elements()
+		out = array('d')
+
+		for n in range(stack.count):
+			try:
+				out.extend(kernel(elements[n * size:(n + 1) * size], tolerance))
+			except Exception:
+				raise Exception("The matrix at index %i of the stack doesn\'t have an inverse. Exiting..." % n)
+
+		result = MatrixStack.MatrixStack(stack.count, order, order)
+		result.elements()[:] = out
+
+		return result
+
+	step = order * order
+	elements = stack.elements()
+
+	result = MatrixStack.MatrixStack.identity(stack.count, order)
+	out = result.elements()
+	work = array('d', [0.0]) * step
+
+	for n in range(stack.count):
+		offset = n * step
+		work[0:step] = elements[offset:offset + step]
+
+		for ci in range(order):
+			''' Partial pivoting: bring the row with the largest value in this column to the diagonal '''
+			pivot_row = ci
+			pivot_value = abs(work[ci * order + ci])
+
+			for ri in range(ci + 1, order):
+				value = abs(work[ri * order + ci])
+
+				if value > pivot_value:
+					pivot_row, pivot_value = ri, value
+
+			if pivot_value <= tolerance / 2.0:
+				raise Exception("The matrix at index %i of the stack doesn\'t have an inverse. Exiting..." % n)
+
+			if pivot_row != ci:
+				for k in range(order):
+					a, b = ci * order + k, pivot_row * order + k
+					work[a], work[b] = work[b], work[a]
+					out[offset + a], out[offset + b] = out[offset + b], out[offset + a]
+
+			scale = 1.0 / work[ci * order + ci]
+			pivot = ci * order
+
+			for k in range(order):
+				work[pivot + k] *= scale
+				out[offset + pivot + k] *= scale
+
+			for ri in range(order):
+				if ri == ci:
+					continue
+
+				row = ri * order
+				factor = work[row + ci]
+
+				if factor == 0.0:
+					continue
+
+				for k in range(order):
+					work[row + k] -= factor * work[pivot + k]
+					out[offset + row + k] -= factor * out[offset + pivot + k]
+
+	return result
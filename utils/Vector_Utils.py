@@ -1,4 +1,5 @@
 import math
+from Geometry.utils import Fixed_Size_Utils as fsu
 
 
 def length(vector):
@@ -266,6 +267,53 @@ def outter_prod_3D(vector_a, vector_b, vector_c):
 		raise Exception("Vectors are expected to be in R3. Exiting...")
 
 
+def simplex_signed_volumes(simplices):
+	"""
+	Calculates the signed volume of every simplex received as argument: n + 1 points in Rn (a triangle in R2, a
+	tetrahedron in R3...), whose volume is the determinant of the edges from the first point to the others divided by
+	n!. The sign tells the orientation of the points, so the volumes of the simplices a point forms with the faces of a
+	simplex give its barycentric coordinates (see Barycentric_Utils.tetrahedron_barycentric_coord).
+
+	This is a convenience loop over the simplices, one determinant each: triangles use the 2D outter product,
+	tetrahedra and 4-simplices the unrolled 3x3/4x4 determinant kernels of Fixed_Size_Utils, and higher dimensions
+	factor a Matrix of edges per simplex (Matrix_Utils.LUFactorization), which is imported only then.
+
+		:param simplices: List of simplices, each a list or tuple of n + 1 points (lists or tuples of n floats)
+
+		:raise: Exception
+		:return: List of floats
+	"""
+
+	volumes = []
+
+	for simplex in simplices:
+		n = len(simplex) - 1
+		origin = simplex[0]
+		edges = []
+
+		for point in simplex[1:]:
+			if len(point) != n:
+				raise Exception("A simplex of %i points is expected to be in R%i, got a point with %i components. Exiting..." % (n + 1, n, len(point)))
+
+			edges.append([c - o for c, o in zip(point, origin)])
+
+		if n == 2:
+			determinant = outter_prod_2D(edges[0], edges[1])
+		elif n in fsu.DETERMINANTS:
+			determinant = fsu.DETERMINANTS[n]([c for edge in edges for c in edge])
+		else:
+			from Geometry.classes import Matrix
+			from Geometry.utils import Matrix_Utils as mu
+
+			''' No tolerance: a tiny simplex still has a volume '''
+			edges = Matrix.Matrix(n, n, [c for edge in edges for c in edge])
+			determinant = mu.LUFactorization(edges, tolerance=0.0).determinant()
+
+		volumes.append(determinant / math.factorial(n))
+
+	return volumes
+
+
 def vector_projection_on_plane(vector, basis_a, basis_b, origin=(0.0, 0.0, 0.0)):
 	"""
 	Projects the vector passed as first argument on the plane formed by arguments passed for the basis_a (vector) and